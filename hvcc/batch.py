@@ -0,0 +1,267 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
+
+from hvcc.cache import CompileCache
+from hvcc.compiler import compile_dataflow
+from hvcc.core.hv2ir.SignalScheduler import SignalScheduler
+from hvcc.core.hv2ir.hv2ir import hv2ir
+from hvcc.types.batch import BatchJob, BatchResult, BatchResults
+from hvcc.types.compiler import CompilerResults
+
+
+def collect_errors(results: CompilerResults) -> List[str]:
+    """ Returns the error messages of all stages. Exceptions are replaced by their
+        message, such that the results can be pickled and JSONified.
+    """
+    errors: List[str] = []
+    for r in results.root.values():
+        if r.notifs.has_error:
+            errors.extend(f"{r.stage}: {e.message}" for e in r.notifs.errors)
+            if len(r.notifs.errors) == 0 and r.notifs.exception is not None:
+                errors.append(f"{r.stage} exception: {r.notifs.exception}")
+        r.notifs.exception = None
+    return errors
+
+
+def load_jobs(patches: Iterable[str], defaults: BatchJob) -> List[BatchJob]:
+    """ Expands a list of Pd files, glob patterns and json manifests into batch jobs.
+        A manifest is a json list of job objects, e.g. [{"in_path": "synth.pd", "generators": ["dpf"]}].
+        Relative paths in a manifest are resolved from the directory of the manifest.
+    """
+    jobs = []
+    for p in patches:
+        if p.endswith(".json"):
+            manifest_dir = os.path.dirname(os.path.abspath(p))
+            with open(p, "r") as f:
+                for entry in json.load(f):
+                    job = defaults.model_copy(update=BatchJob(**entry).model_dump(exclude_unset=True))
+                    job.in_path = os.path.join(manifest_dir, job.in_path)
+                    if job.out_dir is not None:
+                        job.out_dir = os.path.join(manifest_dir, job.out_dir)
+                    if job.patch_meta_file is not None:
+                        job.patch_meta_file = os.path.join(manifest_dir, job.patch_meta_file)
+                    jobs.append(job)
+        else:
+            for in_path in sorted(glob.glob(p, recursive=True)) if glob.has_magic(p) else [p]:
+                jobs.append(defaults.model_copy(update={"in_path": in_path}))
+    return jobs
+
+
+def compile_job(
+    job: BatchJob,
+    cache_dir: Optional[str] = None,
+    cache_size: int = CompileCache.DEFAULT_MAX_SIZE
+) -> BatchResult:
+    tick = time.time()
+    in_path = os.path.abspath(job.in_path)
+    results = compile_dataflow(
+        in_path=in_path,
+        out_dir=job.out_dir or os.path.dirname(in_path),
+        patch_name=job.patch_name,
+        patch_meta_file=job.patch_meta_file,
+        search_paths=job.search_paths,
+        generators=job.generators,
+        ext_generators=job.ext_generators,
+        copyright=job.copyright,
+        nodsp=job.nodsp,
+        buffer_allocator=job.buffer_allocator,
+        signal_scheduler=job.signal_scheduler,
+        message_scheduling=job.message_scheduling,
+        profile=job.profile,
+        cache_dir=cache_dir,
+        cache_size=cache_size)
+
+    return BatchResult(
+        job=job,
+        compile_time=time.time() - tick,
+        errors=collect_errors(results),
+        results=results)
+
+
+def compile_batch(
+    jobs: List[BatchJob],
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    cache_size: int = CompileCache.DEFAULT_MAX_SIZE,
+    verbose: bool = False
+) -> BatchResults:
+    """ Compiles all jobs over a pool of worker processes. Each worker keeps its
+        imported modules and template environments for all of the patches it compiles.
+        The results are returned in the order of the jobs.
+    """
+    tick = time.time()
+    batch = BatchResults()
+
+    # each patch needs its own output directory
+    out_dirs = [os.path.abspath(j.out_dir or os.path.dirname(j.in_path)) for j in jobs]
+    duplicates = {d for d in out_dirs if out_dirs.count(d) > 1}
+
+    runnable = []
+    for job, out_dir in zip(jobs, out_dirs):
+        if out_dir in duplicates:
+            batch.patches.append(BatchResult(
+                job=job,
+                errors=[f"hvcc: Output directory {out_dir} is shared with another patch."]))
+        else:
+            batch.patches.append(BatchResult(job=job))
+            runnable.append(len(batch.patches) - 1)
+
+    def report(i: int, result: BatchResult) -> None:
+        batch.patches[i] = result
+        if verbose:
+            status = "failed" if result.errors else "ok"
+            print(f"--> {result.job.in_path}: {status} ({1000 * result.compile_time:.2f}ms)")
+
+    if workers == 1:
+        for i in runnable:
+            report(i, compile_job(batch.patches[i].job, cache_dir, cache_size))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [(i, executor.submit(compile_job, batch.patches[i].job, cache_dir, cache_size))
+                       for i in runnable]
+            for i, future in futures:
+                try:
+                    report(i, future.result())
+                except Exception as e:
+                    report(i, BatchResult(job=batch.patches[i].job, errors=[f"hvcc exception: {e}"]))
+
+    batch.num_errors = sum(len(r.errors) for r in batch.patches)
+    batch.total_time = time.time() - tick
+    return batch
+
+
+def main(argv: Optional[List[str]] = None) -> bool:
+    parser = argparse.ArgumentParser(
+        prog="hvcc batch",
+        description="Compiles many patches at once over a pool of worker processes.")
+    parser.add_argument(
+        "patches",
+        nargs="+",
+        help="Pd files, glob patterns (e.g. 'patches/**/*.pd') or json manifests with a list of jobs.")
+    parser.add_argument(
+        "-o",
+        "--out_dir",
+        default=".",
+        help="Build output path. Every patch is written to a sub-directory named after the patch.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes. Defaults to the number of CPUs.")
+    parser.add_argument(
+        "-p",
+        "--search_paths",
+        nargs="+",
+        help="Add a list of directories to search through for abstractions.")
+    parser.add_argument(
+        "-n",
+        "--name",
+        default="heavy",
+        help="Provides a name for the generated Heavy contexts.")
+    parser.add_argument(
+        "-g",
+        "--gen",
+        nargs="+",
+        default=["c"],
+        help="List of generator outputs: c, daisy, dpf, js, owl, pdext, unity, wwise.")
+    parser.add_argument(
+        "-G",
+        "--ext-gen",
+        nargs="*",
+        help="Name of a Python module that implements a generator, see 'External Generators' docs page.")
+    parser.add_argument(
+        "--results_path",
+        help="Write the aggregated results of all patches to the given path as a JSON-formatted string."
+             " Target directory will be created if it does not exist.")
+    parser.add_argument(
+        "--nodsp",
+        action='store_true',
+        help="Disable DSP. Run as control-only patch.")
+    parser.add_argument(
+        "--buffer-allocator",
+        choices=hv2ir.BUFFER_ALLOCATORS,
+        default="greedy",
+        help="Allocator of the temporary signal buffers, see 'hvcc --help'.")
+    parser.add_argument(
+        "--signal-scheduler",
+        choices=SignalScheduler.SCHEDULERS,
+        default="depth-first",
+        help="Scheduler of the signal process order, see 'hvcc --help'.")
+    parser.add_argument(
+        "--message-scheduling",
+        choices=["frame", "split"],
+        default="frame",
+        help="How the generated process() schedules messages, see 'hvcc --help'.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Count the time spent in every signal object and message function of the generated C.")
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory of the compile cache. Unchanged patches are restored from it instead of being recompiled.")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=512,
+        help="Maximum size of the compile cache in MiB. Least recently used entries are evicted first.")
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        help="Show a line per compiled patch.",
+        action="count")
+    parser.add_argument(
+        "--copyright",
+        help="A string indicating the owner of the copyright.")
+    args = parser.parse_args(argv)
+
+    jobs = load_jobs(args.patches, BatchJob(
+        in_path="",
+        patch_name=args.name,
+        search_paths=args.search_paths,
+        generators=args.gen,
+        ext_generators=args.ext_gen,
+        copyright=args.copyright,
+        nodsp=args.nodsp,
+        buffer_allocator=args.buffer_allocator,
+        signal_scheduler=args.signal_scheduler,
+        message_scheduling=args.message_scheduling,
+        profile=args.profile))
+
+    for job in jobs:
+        if job.out_dir is None:
+            job.out_dir = os.path.join(args.out_dir, os.path.splitext(os.path.basename(job.in_path))[0])
+
+    batch = compile_batch(
+        jobs,
+        workers=args.jobs,
+        cache_dir=args.cache_dir,
+        cache_size=args.cache_size * 1024 * 1024,
+        verbose=bool(args.verbose))
+
+    for r in batch.patches:
+        for i, error in enumerate(r.errors):
+            print(f"{i + 1:3d}) Error {r.job.in_path}: {error}")
+
+    if args.results_path:
+        results_path = os.path.realpath(os.path.abspath(args.results_path))
+        results_dir = os.path.dirname(results_path)
+
+        if not os.path.exists(results_dir):
+            os.makedirs(results_dir)
+
+        with open(results_path, "w") as f:
+            f.write(batch.model_dump_json())
+
+    if args.verbose:
+        print(f"Compiled {len(batch.patches)} patches in {1000 * batch.total_time:.2f}ms")
+    return batch.num_errors != 0
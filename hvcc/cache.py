@@ -0,0 +1,221 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Set
+
+from hvcc.core.directory_index import DirectoryIndex
+from hvcc.interpreters.pd2hv.PdFile import PdFiles
+from hvcc.interpreters.pd2hv.PdParser import PdParser
+from hvcc.types.compiler import CompilerResults
+from hvcc.version import VERSION
+
+
+class CompileCache:
+    """ A content-addressed cache of compiled patches. Every entry holds the c/ and ir/
+        output directories and the CompilerResults of the pd2hv to ir2c_perf stages.
+        When a patch has changed, its unchanged abstractions are reused by pd2hv from
+        the abstractions/ directory of the cache.
+        The least recently used entries are evicted when the cache grows beyond max_size.
+    """
+
+    # the directories of the output that are stored in an entry
+    OUTPUT_DIRS = ("c", "ir")
+
+    RESULTS_FILE = "results.json"
+
+    # the directory of the pd2hv AbstractionCache
+    ABSTRACTIONS_DIR = "abstractions"
+
+    DEFAULT_MAX_SIZE = 512 * 1024 * 1024  # bytes
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+
+    @property
+    def abstractions_dir(self) -> str:
+        return os.path.join(self.cache_dir, self.ABSTRACTIONS_DIR)
+
+    @classmethod
+    def abstraction_closure(
+        cls,
+        pd_path: str,
+        search_paths: Optional[List[str]] = None,
+        pd_files: Optional[PdFiles] = None,
+        directory_index: Optional[DirectoryIndex] = None
+    ) -> Optional[List[str]]:
+        """ Returns the paths of all abstractions that are resolved from the given patch,
+            in the same way as the PdParser would find them. Returns None if the closure
+            cannot be determined statically, e.g. when an object name contains a $ argument.
+        """
+        parser = PdParser(pd_files=pd_files, directory_index=directory_index)
+        for p in search_paths or []:
+            parser.add_absolute_search_directory(p)
+        parser.search_paths.append(os.path.dirname(pd_path))
+
+        closure: List[str] = []
+        visited: Set[str] = {pd_path}
+        stack = [pd_path]
+        while stack:
+            path = stack.pop()
+            local_dir = os.path.dirname(path)
+            for _, line in parser.pd_files.load(path).lines:
+                if len(line) < 2 or line[0] != "#X":
+                    continue
+                if line[1] == "declare" and path == pd_path and len(line) >= 4 and line[2] == "-path":
+                    parser.add_relative_search_directory(os.path.join(local_dir, line[3]))
+                elif line[1] == "obj" and len(line) >= 5:
+                    if "$" in line[4]:
+                        return None
+                    abs_path = parser.find_abstraction_path(local_dir, line[4])
+                    if abs_path is not None and abs_path not in visited:
+                        visited.add(abs_path)
+                        closure.append(abs_path)
+                        stack.append(abs_path)
+        return closure
+
+    @classmethod
+    def _hash_file(cls, h: Any, path: str, pd_files: PdFiles) -> None:
+        h.update(path.encode("utf-8"))
+        if path.endswith(".pd"):
+            h.update(bytes.fromhex(pd_files.load(path).sha256))  # the hash of the contents that are compiled
+        else:
+            with open(path, "rb") as f:
+                h.update(hashlib.sha256(f.read()).digest())
+
+    def key(
+        self,
+        in_path: str,
+        out_dir: str,
+        search_paths: Optional[List[str]] = None,
+        generators: Optional[List[str]] = None,
+        nodsp: Optional[bool] = False,
+        patch_name: str = "heavy",
+        patch_meta_file: Optional[str] = None,
+        copyright: Optional[str] = None,
+        options: Optional[Dict] = None,
+        pd_files: Optional[PdFiles] = None,
+        directory_index: Optional[DirectoryIndex] = None
+    ) -> Optional[str]:
+        """ Returns the cache key of a compile, or None if the patch can not be cached.
+            Any further compiler options that change the output are passed in options.
+            The .pd files are read from pd_files and the abstractions are looked up in
+            directory_index, such that the key covers the same files that the compile
+            then reads from them.
+        """
+        in_path = os.path.abspath(in_path)
+        pd_files = pd_files or PdFiles()
+        try:
+            closure = self.abstraction_closure(in_path, search_paths, pd_files, directory_index)
+            if closure is None:
+                return None
+
+            h = hashlib.sha256()
+            h.update(f"hvcc {VERSION}\n".encode("utf-8"))
+            h.update(f"{os.path.abspath(out_dir)}\n".encode("utf-8"))
+            h.update(f"{search_paths or []}\n".encode("utf-8"))
+            h.update(f"{sorted(generators or [])}\n".encode("utf-8"))
+            h.update(f"{bool(nodsp)} {patch_name} {copyright}\n".encode("utf-8"))
+            h.update(f"{sorted((options or {}).items())}\n".encode("utf-8"))
+            for path in [in_path] + closure:
+                self._hash_file(h, path, pd_files)
+            if patch_meta_file:
+                self._hash_file(h, os.path.abspath(patch_meta_file), pd_files)
+            return h.hexdigest()
+        except OSError:
+            return None
+
+    def load(self, key: str, out_dir: str) -> Optional[CompilerResults]:
+        """ Restores the output directories of a cache entry into out_dir and returns
+            its results. Returns None on a cache miss.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        results_path = os.path.join(entry_dir, self.RESULTS_FILE)
+        try:
+            with open(results_path, "r") as f:
+                results = CompilerResults.model_validate_json(f.read())
+            for d in self.OUTPUT_DIRS:
+                if os.path.isdir(os.path.join(entry_dir, d)):
+                    shutil.copytree(os.path.join(entry_dir, d), os.path.join(out_dir, d), dirs_exist_ok=True)
+        except (OSError, ValueError):
+            return None
+
+        # mark the entry as recently used
+        os.utime(results_path)
+        for r in results.root.values():
+            r.cached = True
+        return results
+
+    def store(self, key: str, out_dir: str, results: CompilerResults) -> None:
+        """ Adds the output directories and results of a successful compile to the cache.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry_dir = os.path.join(self.cache_dir, key)
+        if os.path.isdir(entry_dir):
+            return
+
+        # build the entry next to its final location so that concurrent compiles
+        # never observe a partially written entry
+        tmp_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            for d in self.OUTPUT_DIRS:
+                if os.path.isdir(os.path.join(out_dir, d)):
+                    shutil.copytree(os.path.join(out_dir, d), os.path.join(tmp_dir, d))
+            with open(os.path.join(tmp_dir, self.RESULTS_FILE), "w") as f:
+                f.write(results.model_dump_json())
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def size(self) -> int:
+        """ Returns the total size of all cache entries in bytes.
+        """
+        return sum(s for _, _, s in self._entries())
+
+    def evict(self) -> None:
+        """ Removes the least recently used entries until the cache fits within max_size.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        total = sum(s for _, _, s in entries)
+        for entry_dir, _, s in entries:
+            if total <= self.max_size:
+                break
+            if os.path.isdir(entry_dir):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            else:
+                os.remove(entry_dir)
+            total -= s
+
+    def _entries(self) -> List[tuple]:
+        """ Returns (path, last use, size) of every entry in the cache,
+            including the entries of the abstraction cache.
+        """
+        entries: List[tuple] = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        if os.path.isdir(self.abstractions_dir):
+            for e in os.scandir(self.abstractions_dir):
+                if e.is_file() and not e.name.startswith("."):
+                    stat = e.stat()
+                    entries.append((e.path, stat.st_mtime, stat.st_size))
+        for e in os.scandir(self.cache_dir):
+            if not e.is_dir() or e.name.startswith(".") or e.name == self.ABSTRACTIONS_DIR:
+                continue
+            try:
+                last_use = os.stat(os.path.join(e.path, self.RESULTS_FILE)).st_mtime
+            except OSError:
+                last_use = 0.0  # incomplete entries are evicted first
+            size = 0
+            for root, _, files in os.walk(e.path):
+                size += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+            entries.append((e.path, last_use, size))
+        return entries
@@ -20,20 +20,16 @@ import json
 import os
 import re
 import sys
-from typing import Any, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
 
+from hvcc.cache import CompileCache
+from hvcc.core.directory_index import DirectoryIndex
 from hvcc.interpreters.pd2gui import pd2gui
 from hvcc.interpreters.pd2hv import pd2hv
+from hvcc.interpreters.pd2hv.PdFile import PdFiles
 from hvcc.core.hv2ir import hv2ir
 from hvcc.generators.ir2c import ir2c, ir2c_perf
-from hvcc.generators.c2js import c2js
-from hvcc.generators.c2daisy import c2daisy
-from hvcc.generators.c2dpf import c2dpf
-from hvcc.generators.c2owl import c2owl
-from hvcc.generators.c2pdext import c2pdext
-from hvcc.generators.c2wwise import c2wwise
-from hvcc.generators.c2unity import c2unity
-from hvcc.generators.c2fmod import c2fmod
 from hvcc.types.compiler import (
     CompilerResults, CompilerResp, CompilerNotif, CompilerMsg, Generator,
     ExternInfo, ExternMemoryPool, ExternMidi, ExternEvents, ExternParams
@@ -42,6 +38,26 @@ from hvcc.types.IR import IRGraph
 from hvcc.types.meta import Meta
 
 
+# the built-in generators in the order in which their results are merged,
+# as "module:class" paths that are only imported when the generator is selected
+GENERATORS: Dict[str, Tuple[str, str]] = {
+    "js": ("Generating Javascript", "hvcc.generators.c2js.c2js:c2js"),
+    "daisy": ("Generating Daisy module", "hvcc.generators.c2daisy.c2daisy:c2daisy"),
+    "dpf": ("Generating DPF plugin", "hvcc.generators.c2dpf.c2dpf:c2dpf"),
+    "owl": ("Generating OWL plugin", "hvcc.generators.c2owl.c2owl:c2owl"),
+    "pdext": ("Generating Pd external", "hvcc.generators.c2pdext.c2pdext:c2pdext"),
+    "unity": ("Generating Unity plugin", "hvcc.generators.c2unity.c2unity:c2unity"),
+    "wwise": ("Generating Wwise plugin", "hvcc.generators.c2wwise.c2wwise:c2wwise"),
+    "fmod": ("Generating Fmod plugin", "hvcc.generators.c2fmod.c2fmod:c2fmod"),
+}
+
+# the entry point group under which installed packages register external generators
+EXT_GENERATOR_GROUP = "hvcc.generators"
+
+# pairs of generators that write to the same files (out_dir/Makefile)
+SHARED_OUTPUT_GENERATORS = [{"c2dpf", "c2pdext"}]
+
+
 def add_error(
     results: CompilerResults,
     error: str
@@ -194,8 +210,34 @@ def generate_extern_info(hvir: IRGraph, results: CompilerResults) -> ExternInfo:
     )
 
 
+def load_generator(path: str) -> Any:
+    """ Imports a generator class from its "module:class" path.
+    """
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def ext_generator_entry_points() -> Dict[str, Any]:
+    """ Returns the external generators registered by installed packages, by name.
+    """
+    import importlib.metadata  # slow to import, and only needed for external generators
+    if sys.version_info >= (3, 10):
+        return {ep.name: ep for ep in importlib.metadata.entry_points(group=EXT_GENERATOR_GROUP)}
+    else:
+        return {ep.name: ep for ep in importlib.metadata.entry_points().get(EXT_GENERATOR_GROUP, [])}
+
+
 def load_ext_generator(module_name: str, verbose: bool) -> Optional[Generator]:
+    """ Loads an external generator by its entry point name, or by its "module:class" path.
+        A plain module name is searched for a class derived from hvcc.types.compiler.Generator.
+    """
+    ep = ext_generator_entry_points().get(module_name)
     try:
+        if ep is not None:
+            return ep.load()()
+        elif ":" in module_name:
+            return load_generator(module_name)()
+
         module = importlib.import_module(module_name)
         for _, member in inspect.getmembers(module):
             if inspect.isclass(member) and not inspect.isabstract(member) and issubclass(member, Generator):
@@ -203,56 +245,52 @@ def load_ext_generator(module_name: str, verbose: bool) -> Optional[Generator]:
         if verbose:
             print(f"---> Module {module_name} does not contain a class derived from hvcc.types.Compiler")
         return None
-    except ModuleNotFoundError:
+    except (ModuleNotFoundError, AttributeError):
         print(f"---> Module {module_name} not found")
         return None
 
 
-def compile_dataflow(
+def compile_c(
+    results: CompilerResults,
     in_path: str,
     out_dir: str,
-    patch_name: str = "heavy",
-    patch_meta_file: Optional[str] = None,
-    search_paths: Optional[List[str]] = None,
-    generators: Optional[List[str]] = None,
-    ext_generators: Optional[List[str]] = None,
-    verbose: bool = False,
-    copyright: Optional[str] = None,
-    nodsp: Optional[bool] = False
-) -> CompilerResults:
-    results = CompilerResults(root={})
-    patch_meta = Meta()
-
-    # basic error checking on input
-    if os.path.isfile(in_path):
-        if not in_path.endswith((".pd")):
-            return add_error(results, "Can only process Pd files.")
-    elif os.path.isdir(in_path):
-        if not os.path.basename("c"):
-            return add_error(results, "Can only process c directories.")
-    else:
-        return add_error(results, f"Unknown input path {in_path}")
-
-    # meta-data file
-    if patch_meta_file:
-        if os.path.isfile(patch_meta_file):
-            with open(patch_meta_file) as json_file:
-                try:
-                    patch_meta_json = json.load(json_file)
-                    patch_meta = Meta(**patch_meta_json)
-                except Exception as e:
-                    return add_error(results, f"Unable to open json_file: {e}")
+    patch_name: str,
+    search_paths: Optional[List[str]],
+    generators: List[str],
+    verbose: bool,
+    copyright: Optional[str],
+    nodsp: Optional[bool],
+    intermediates: bool,
+    abstraction_cache_dir: Optional[str] = None,
+    buffer_allocator: str = "greedy",
+    signal_scheduler: str = "depth-first",
+    message_scheduling: str = "frame",
+    profile: bool = False,
+    pd_files: Optional[PdFiles] = None,
+    directory_index: Optional[DirectoryIndex] = None
+) -> Tuple[CompilerResults, Optional[ExternInfo]]:
+    """ Runs the pd2hv, pd2gui, hv2ir, ir2c and ir2c_perf stages, writing the C sources
+        to the c/ directory of out_dir. Returns the results and the extern info of the patch.
+        pd2hv and pd2gui share the .pd files read from pd_files, and all stages look up
+        abstractions in the same directory_index.
+    """
+    pd_files = pd_files or PdFiles()
+    directory_index = directory_index or DirectoryIndex()
 
-    patch_name = patch_meta.name or patch_name
-    generators = ["c"] if generators is None else [x.lower() for x in generators]
+    # the Heavy and HeavyIR graphs are passed between stages in-memory.
+    # Their json files are only written for debugging, or when a generator reads them.
+    write_ir = intermediates or "owl" in generators
 
     if verbose:
         print("--> Generating C")
     results.root["pd2hv"] = pd2hv.pd2hv.compile(
         pd_path=in_path,
-        hv_dir=os.path.join(out_dir, "hv"),
+        hv_dir=os.path.join(out_dir, "hv") if intermediates else None,
         search_paths=search_paths,
-        verbose=verbose)
+        verbose=verbose,
+        abstraction_cache_dir=abstraction_cache_dir,
+        pd_files=pd_files,
+        directory_index=directory_index)
 
     if verbose:
         print("--> Generating GUI IR")
@@ -260,30 +298,36 @@ def compile_dataflow(
         pd_path=in_path,
         ir_dir=os.path.join(out_dir, "ir"),
         search_paths=search_paths,
-        verbose=verbose)
+        verbose=verbose,
+        pd_files=pd_files,
+        directory_index=directory_index)
 
     # check for errors
     response: CompilerResp = list(results.root.values())[0]
 
     if response.notifs.has_error:
-        return results
+        return results, None
 
     subst_name = re.sub(r'\W', '_', patch_name)
+    hv_file = f"{os.path.splitext(os.path.basename(in_path))[0]}.hv.json"
     results.root["hv2ir"] = hv2ir.hv2ir.compile(
-        hv_file=os.path.join(response.out_dir, response.out_file),
+        hv_file=os.path.join(out_dir, "hv", hv_file),
         # ensure that the ir filename has no funky characters in it
-        ir_file=os.path.join(out_dir, "ir", f"{subst_name}.heavy.ir.json"),
+        ir_file=os.path.join(out_dir, "ir", f"{subst_name}.heavy.ir.json") if write_ir else None,
         patch_name=patch_name,
-        verbose=verbose)
+        verbose=verbose,
+        hv_json=response.hv,
+        buffer_allocator=buffer_allocator,
+        signal_scheduler=signal_scheduler,
+        directory_index=directory_index)
 
     # check for errors
     if results.root["hv2ir"].notifs.has_error:
-        return results
+        return results, None
 
     # get the hvir data
     hvir = results.root["hv2ir"].ir
     assert hvir is not None
-    patch_name = hvir.name.escaped
     externs = generate_extern_info(hvir, results)
 
     # get application path
@@ -292,18 +336,27 @@ def compile_dataflow(
     elif __file__:
         application_path = os.path.dirname(__file__)
 
-    c_src_dir = os.path.join(out_dir, "c")
     results.root["ir2c"] = ir2c.ir2c.compile(
-        hv_ir_path=os.path.join(results.root["hv2ir"].out_dir, results.root["hv2ir"].out_file),
+        hv_ir_path=None,
         static_dir=os.path.join(application_path, "generators/ir2c/static"),
-        output_dir=c_src_dir,
+        output_dir=os.path.join(out_dir, "c"),
         externs=externs,
         copyright=copyright,
-        nodsp=nodsp)
+        nodsp=nodsp,
+        ir=hvir,
+        message_scheduling=message_scheduling,
+        profile=profile)
+
+    if verbose:
+        stats = results.root["ir2c"].stats
+        print(f"ir2c: {stats['symbols']} symbols, {stats['symbol_duplicates']} used more than once, "
+              f"{stats['symbol_collisions']} hash collisions")
+        print(f"ir2c: {stats['expr_objects']} expr~ objects share {stats['expr_evaluators']} evaluators, "
+              f"{stats['expr_bytes_saved']} bytes of C saved")
 
     # check for errors
     if results.root["ir2c"].notifs.has_error:
-        return results
+        return results, externs
 
     # ir2c_perf
     results.root["ir2c_perf"] = CompilerResp(
@@ -313,6 +366,108 @@ def compile_dataflow(
         in_file=results.root["hv2ir"].out_file,
     )
 
+    return results, externs
+
+
+def compile_dataflow(
+    in_path: str,
+    out_dir: str,
+    patch_name: str = "heavy",
+    patch_meta_file: Optional[str] = None,
+    search_paths: Optional[List[str]] = None,
+    generators: Optional[List[str]] = None,
+    ext_generators: Optional[List[str]] = None,
+    verbose: bool = False,
+    copyright: Optional[str] = None,
+    nodsp: Optional[bool] = False,
+    intermediates: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_size: int = CompileCache.DEFAULT_MAX_SIZE,
+    sequential_generators: bool = False,
+    buffer_allocator: str = "greedy",
+    signal_scheduler: str = "depth-first",
+    message_scheduling: str = "frame",
+    profile: bool = False
+) -> CompilerResults:
+    results = CompilerResults(root={})
+    patch_meta = Meta()
+
+    # basic error checking on input
+    if os.path.isfile(in_path):
+        if not in_path.endswith((".pd")):
+            return add_error(results, "Can only process Pd files.")
+    elif os.path.isdir(in_path):
+        if not os.path.basename("c"):
+            return add_error(results, "Can only process c directories.")
+    else:
+        return add_error(results, f"Unknown input path {in_path}")
+
+    # meta-data file
+    if patch_meta_file:
+        if os.path.isfile(patch_meta_file):
+            with open(patch_meta_file) as json_file:
+                try:
+                    patch_meta_json = json.load(json_file)
+                    patch_meta = Meta(**patch_meta_json)
+                except Exception as e:
+                    return add_error(results, f"Unable to open json_file: {e}")
+
+    patch_name = patch_meta.name or patch_name
+    generators = ["c"] if generators is None else [x.lower() for x in generators]
+
+    # every .pd file is read once per compile, by the cache key and the frontends,
+    # and every searched directory is listed once
+    pd_files = PdFiles()
+    directory_index = DirectoryIndex()
+
+    # the cache is bypassed when the intermediate files are requested for debugging
+    cache = CompileCache(cache_dir, cache_size) if cache_dir is not None and not intermediates else None
+    cache_key = None
+    cached_results = None
+    if cache is not None:
+        cache_key = cache.key(
+            in_path, out_dir, search_paths, generators, nodsp, patch_name, patch_meta_file, copyright,
+            options={
+                "buffer_allocator": buffer_allocator,
+                "signal_scheduler": signal_scheduler,
+                "message_scheduling": message_scheduling,
+                "profile": profile
+            },
+            pd_files=pd_files,
+            directory_index=directory_index)
+        if cache_key is not None:
+            cached_results = cache.load(cache_key, out_dir)
+
+    if cached_results is not None:
+        if verbose:
+            print("--> Restored C from the compile cache")
+        results = cached_results
+        hvir = results.root["hv2ir"].ir
+        assert hvir is not None
+        externs = generate_extern_info(hvir, results)
+    else:
+        results, c_externs = compile_c(
+            results, in_path, out_dir, patch_name, search_paths, generators, verbose, copyright, nodsp, intermediates,
+            abstraction_cache_dir=cache.abstractions_dir if cache is not None else None,
+            buffer_allocator=buffer_allocator,
+            signal_scheduler=signal_scheduler,
+            message_scheduling=message_scheduling,
+            profile=profile,
+            pd_files=pd_files,
+            directory_index=directory_index)
+        if c_externs is None or "ir2c_perf" not in results.root:
+            return results
+        externs = c_externs
+        hvir = results.root["hv2ir"].ir
+        assert hvir is not None
+
+        # only successful compiles are cached
+        if cache is not None and cache_key is not None and not any(r.notifs.has_error for r in results.root.values()):
+            cache.store(cache_key, out_dir, results)
+
+    patch_name = hvir.name.escaped
+    c_src_dir = os.path.join(out_dir, "c")
+
     # run the c2x generators, merge the results
     num_input_channels = hvir.signal.numInputBuffers
     num_output_channels = hvir.signal.numOutputBuffers
@@ -329,52 +484,44 @@ def compile_dataflow(
         'verbose': verbose
     }
 
-    if "js" in generators:
-        if verbose:
-            print("--> Generating Javascript")
-        results.root["c2js"] = c2js.c2js.compile(**gen_args)
-
-    if "daisy" in generators:
-        if verbose:
-            print("--> Generating Daisy module")
-        results.root["c2daisy"] = c2daisy.c2daisy.compile(**gen_args)
-
-    if "dpf" in generators:
-        if verbose:
-            print("--> Generating DPF plugin")
-        results.root["c2dpf"] = c2dpf.c2dpf.compile(**gen_args)
-
-    if "owl" in generators:
-        if verbose:
-            print("--> Generating OWL plugin")
-        results.root["c2owl"] = c2owl.c2owl.compile(**gen_args)
-
-    if "pdext" in generators:
-        if verbose:
-            print("--> Generating Pd external")
-        results.root["c2pdext"] = c2pdext.c2pdext.compile(**gen_args)
-
-    if "unity" in generators:
-        if verbose:
-            print("--> Generating Unity plugin")
-        results.root["c2unity"] = c2unity.c2unity.compile(**gen_args)
-
-    if "wwise" in generators:
-        if verbose:
-            print("--> Generating Wwise plugin")
-        results.root["c2wwise"] = c2wwise.c2wwise.compile(**gen_args)
-
-    if "fmod" in generators:
-        if verbose:
-            print("--> Generating Fmod plugin")
-        results.root["c2fmod"] = c2fmod.c2fmod.compile(**gen_args)
+    # generators that write to the same files in out_dir share a task, such that they run in order
+    tasks: List[List[Tuple[str, str, Any]]] = []
+    for name, (description, path) in GENERATORS.items():
+        if name in generators:
+            stage = path.partition(":")[2]
+            generator = load_generator(path)
+            task = next((t for t in tasks if {stage, t[0][0]} in SHARED_OUTPUT_GENERATORS), None)
+            if task is not None:
+                task.append((stage, description, generator))
+            else:
+                tasks.append([(stage, description, generator)])
 
     if ext_generators:
         for module_name in ext_generators:
-            generator = load_ext_generator(module_name, verbose)
-            if generator is not None:
-                if verbose:
-                    print(f"--> Executing custom generator from module {module_name}")
-                results.root[module_name] = generator.compile(**gen_args)
+            ext_generator = load_ext_generator(module_name, verbose)
+            if ext_generator is not None:
+                tasks.append([(module_name, f"Executing custom generator from module {module_name}", ext_generator)])
+
+    def run_task(task: List[Tuple[str, str, Any]]) -> List[Tuple[str, CompilerResp]]:
+        task_results = []
+        for stage, description, generator in task:
+            if verbose:
+                print(f"--> {description}")
+            # every generator gets its own copy of the shared arguments, as some modify them
+            args = dict(gen_args, externs=externs.model_copy(deep=True), patch_meta=patch_meta.model_copy(deep=True))
+            task_results.append((stage, generator.compile(**args)))
+        return task_results
+
+    # the generators are independent of each other and run concurrently, unless the
+    # sequential order is requested. Their results are merged in the sequential order.
+    if sequential_generators or len(tasks) < 2:
+        task_results = [run_task(t) for t in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            task_results = list(executor.map(run_task, tasks))
+
+    for stage_results in task_results:
+        for stage, response in stage_results:
+            results.root[stage] = response
 
     return results
@@ -0,0 +1,68 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+from typing import Dict, FrozenSet, Optional, Tuple
+
+
+class DirectoryIndex:
+    """ The names of the files in a directory, listed with a single os.scandir
+        the first time that the directory is searched. Abstraction lookups in
+        pd2hv, pd2gui and hv2ir are then answered from the listing, without a
+        stat for every path that they try.
+
+        One index is shared by all stages of a compile, and assumes that the
+        searched directories do not change during it. The directories that are
+        added by [declare -path] are listed again. On a case-insensitive file
+        system, names are also matched casefolded, as os.path.isfile would.
+    """
+
+    def __init__(self) -> None:
+        # the names of the files in every listed directory, and their casefolded
+        # names if the directory is on a case-insensitive file system
+        self.__listings: Dict[str, Tuple[FrozenSet[str], Optional[FrozenSet[str]]]] = {}
+
+    def __list(self, dir_path: str) -> Tuple[FrozenSet[str], Optional[FrozenSet[str]]]:
+        listing = self.__listings.get(dir_path)
+        if listing is None:
+            try:
+                with os.scandir(dir_path or ".") as it:
+                    names = frozenset(e.name for e in it if e.is_file())
+            except OSError:
+                names = frozenset()
+            listing = (names, self.casefolded(dir_path, names))
+            self.__listings[dir_path] = listing
+        return listing
+
+    @classmethod
+    def casefolded(cls, dir_path: str, names: FrozenSet[str]) -> Optional[FrozenSet[str]]:
+        """ Returns the casefolded names of the files in a directory if it is on a
+            case-insensitive file system, or None otherwise. This is tested with a
+            single os.path.isfile of one of the names in a different case.
+        """
+        for name in names:
+            other = name.swapcase()
+            if other != name and other not in names:
+                if os.path.isfile(os.path.join(dir_path, other)):
+                    return frozenset(n.casefold() for n in names)
+                return None
+        return None  # no name has a case to test, and every match is exact
+
+    def listing(self, dir_path: str) -> FrozenSet[str]:
+        """ Returns the names of all files in a directory, or an empty set if it does not exist.
+        """
+        return self.__list(dir_path)[0]
+
+    def isfile(self, path: str) -> bool:
+        """ Returns True if the path is an existing file, like os.path.isfile.
+        """
+        dir_path, file_name = os.path.split(path)
+        names, folded = self.__list(dir_path)
+        return file_name in names or (folded is not None and file_name.casefold() in folded)
+
+    def invalidate(self, dir_path: str) -> None:
+        """ Lists the directory again when it is next searched.
+        """
+        self.__listings.pop(dir_path, None)
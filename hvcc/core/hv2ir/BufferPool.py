@@ -14,7 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from collections import defaultdict
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 
 from .HeavyException import HeavyException
@@ -26,9 +26,15 @@ class BufferPool:
         # the idea is that the same buffer is reused as quickly as possible so that it doesn't need
         # to be moved around in the cache. It does not give substantially different results
         # from a Counter-based implementation, but it is more consistent and predictable.
-        self.pool: Dict = {
-            "~f>": defaultdict(list),
-            "~i>": defaultdict(list)
+        # The retain count of every buffer is indexed, and the unused buffers (with a retain
+        # count of zero) are kept in the order in which they were released.
+        self.counts: Dict[str, Dict[Tuple, int]] = {
+            "~f>": {},
+            "~i>": {}
+        }
+        self.free: Dict[str, OrderedDict] = {
+            "~f>": OrderedDict(),
+            "~i>": OrderedDict()
         }
 
     def num_buffers(self, connection_type: Optional[str] = None) -> int:
@@ -37,8 +43,8 @@ class BufferPool:
         """
         if connection_type is None:
             return self.num_buffers("~f>") + self.num_buffers("~i>")
-        elif connection_type in self.pool:
-            return sum(len(v) for v in self.pool[connection_type].values())
+        elif connection_type in self.counts:
+            return len(self.counts[connection_type])
         else:
             raise HeavyException(f"Unknown connection type: \"{connection_type}\"")
 
@@ -48,16 +54,17 @@ class BufferPool:
         """
         excludeSet = excludeSet if excludeSet is not None else set()
 
-        pool = self.pool[connection_type]
+        counts = self.counts[connection_type]
+        free = self.free[connection_type]
 
         # get the most recently used, unused buffer
-        b = next((b for b in reversed(pool[0]) if b not in excludeSet), None)
+        b = next((b for b in reversed(free) if b not in excludeSet), None)
         if b is not None:
-            pool[0].remove(b)
+            del free[b]
         else:
             # if we get here, then no available buffer was found. Create a new one.
-            b = (connection_type, self.num_buffers(connection_type))  # new buffer index for the given type
-        pool[count].append(b)
+            b = (connection_type, len(counts))  # new buffer index for the given type
+        self._set_count(connection_type, b, count)
         return b
 
     def retain_buffer(self, b: List, count: int = 1) -> int:
@@ -67,13 +74,7 @@ class BufferPool:
         if b[0] in {"zero", "input"}:
             return 0
         else:
-            pool = self.pool[b[0]]
-            for k, v in pool.items():
-                if b in v:
-                    v.remove(b)
-                    pool[k + count].append(b)
-                    return k + count  # return the new retain count
-            raise HeavyException(f"{b} not found in BufferPool!")
+            return self._update_count(b, count)
 
     def release_buffer(self, b: List, count: int = 1) -> int:
         """ Reduces the retain count of the buffer. Returns the new count.
@@ -84,13 +85,25 @@ class BufferPool:
         if b[0] in {"zero", "input"}:
             return 0
         else:
-            pool = self.pool[b[0]]
-            for k, v in pool.items():
-                if b in v:
-                    v.remove(b)
-                    pool[k - count].append(b)
-                    return k - count  # return the new retain count
+            return self._update_count(b, -count)
+
+    def _update_count(self, b: List, delta: int) -> int:
+        b_key = tuple(b)
+        counts = self.counts[b_key[0]]
+        if b_key not in counts:
             raise HeavyException(f"{b} not found in BufferPool!")
 
+        # an unused buffer is always moved to the most recently released position,
+        # even if its retain count does not change
+        if counts[b_key] == 0:
+            del self.free[b_key[0]][b_key]
+        self._set_count(b_key[0], b_key, counts[b_key] + delta)
+        return counts[b_key]  # return the new retain count
+
+    def _set_count(self, connection_type: str, b: Tuple, count: int) -> None:
+        self.counts[connection_type][b] = count
+        if count == 0:
+            self.free[connection_type][b] = None
+
     def __repr__(self) -> str:
-        return self.pool["~f>"].__repr__() + self.pool["~i>"].__repr__()
+        return self.counts["~f>"].__repr__() + self.counts["~i>"].__repr__()
@@ -0,0 +1,138 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .HeavyIrObject import HeavyIrObject
+
+if TYPE_CHECKING:
+    from .HeavyGraph import HeavyGraph
+
+
+class ConstantFolding:
+    """ Folds signal operations of which an input is constant:
+
+        - [__varread~f] of a [__var~f] that is never written becomes a [__var_k~f].
+        - [__mul~f] by one passes its other input through, by zero it outputs zero.
+        - [__add~f] and [__sub~f] with zero pass their other input through.
+
+        A signal inlet without connections reads the zero buffer. An object that outputs
+        zero is therefore removed along with its outgoing connections.
+        Objects writing to the adc~ or dac~ buffers are never folded.
+    """
+
+    __MUL_TYPES = {"__mul~f", "__mul~i"}
+    __ADD_TYPES = {"__add~f", "__add~i"}
+    __SUB_TYPES = {"__sub~f", "__sub~i"}
+
+    @classmethod
+    def objects(cls, graph: 'HeavyGraph') -> Iterator[HeavyIrObject]:
+        """ Iterates over all objects of the graph and its subgraphs, including the subgraphs.
+        """
+        for o in list(graph.objs.values()):
+            yield o
+            if o.type == "__graph":
+                yield from cls.objects(o)
+
+    @classmethod
+    def run(cls, graph: 'HeavyGraph') -> Tuple[int, int, int]:
+        """ Folds constants until nothing changes anymore.
+            Returns the number of removed objects, the number of signal buffers that they
+            no longer write, and the number of var reads that were replaced by constants.
+        """
+        num_objects = 0
+        num_buffers = 0
+        num_constants = 0
+        removed: Set[HeavyIrObject] = set()
+
+        is_changed = True
+        while is_changed:
+            is_changed = False
+            objs = list(cls.objects(graph))
+
+            # vars without writers are constant
+            written = {o.args["var_id"] for o in objs if o.type in {"__varwrite~f", "__varwrite~i"}}
+            constant_vars = {
+                o.id: o for o in objs
+                if o.type in {"__var~f", "__var~i"} and o.id not in written
+                and o.args["step"] == 0 and all(len(cc) == 0 for cc in o.inlet_connections)
+            }
+
+            for o in objs:
+                if o in removed or any(b[0] != "zero" for b in o.inlet_buffers + o.outlet_buffers):
+                    continue
+
+                if o.type in {"__varread~f", "__varread~i"} and o.args["var_id"] in constant_vars:
+                    cls._replace_with_constant(o, constant_vars[o.args["var_id"]])
+                    removed.add(o)
+                    num_constants += 1
+                    is_changed = True
+                    continue
+
+                if o.type not in cls.__MUL_TYPES | cls.__ADD_TYPES | cls.__SUB_TYPES:
+                    continue
+
+                # the inlet of which the input is passed through, None if the output is zero
+                bypass: Optional[int] = -1
+                a, b = cls._constant(o, 0), cls._constant(o, 1)
+                if o.type in cls.__MUL_TYPES:
+                    bypass = None if (a == 0 or b == 0) else 1 if a == 1 else 0 if b == 1 else -1
+                elif o.type in cls.__ADD_TYPES:
+                    bypass = 1 if a == 0 else 0 if b == 0 else -1
+                elif b == 0:
+                    bypass = 0
+
+                if bypass != -1:
+                    cls._bypass(o, bypass)
+                    removed.add(o)
+                    num_objects += 1
+                    num_buffers += o.num_outlets
+                    is_changed = True
+
+        return num_objects, num_buffers, num_constants
+
+    @classmethod
+    def _constant(cls, o: HeavyIrObject, inlet_index: int) -> Optional[float]:
+        """ Returns the constant value at a signal inlet, or None if it is not constant.
+        """
+        cc = [c for c in o.inlet_connections[inlet_index] if c.is_signal]
+        if len(cc) == 0:
+            return 0.0  # the zero buffer
+        elif len(cc) > 1:
+            return None
+
+        # follow the connection through graph inlets and outlets
+        x = cc[0].from_object
+        if x.type == "__graph":
+            return cls._constant(x.outlet_objs[cc[0].outlet_index], 0)
+        elif x.type == "__inlet" and x.graph is not None and not x.graph.is_root_graph() \
+                and x.outlet_buffers[0][0] != "input":
+            return cls._constant(x.graph, x.graph.inlet_objs.index(x))
+        elif x.type in {"__var_k~f", "__var_k~i"} and x.args["step"] == 0:
+            return float(x.args["k"])
+        else:
+            return None
+
+    @classmethod
+    def _bypass(cls, o: HeavyIrObject, inlet_index: Optional[int]) -> None:
+        """ Connects the input at the given inlet directly to all consumers of the object,
+            and removes the object. If the inlet index is None, the output is zero and the
+            consumers are left unconnected.
+        """
+        assert o.graph is not None
+        cc: List = [] if inlet_index is None else [c for c in o.inlet_connections[inlet_index] if c.is_signal]
+        if len(cc) == 1:
+            for c in list(o.outlet_connections[0]):
+                o.graph.update_connection(c, [cc[0].copy(to_object=c.to_object, inlet_index=c.inlet_index)])
+        o.graph.remove_object(o)
+
+    @classmethod
+    def _replace_with_constant(cls, o: HeavyIrObject, var: HeavyIrObject) -> None:
+        assert o.graph is not None
+        k = HeavyIrObject(f"__var_k~{o.type[-1]}", {"k": var.args["k"]})
+        o.graph.add_object(k)
+        for c in list(o.outlet_connections[0]):
+            o.graph.update_connection(c, [c.copy(from_object=k)])
+        o.graph.remove_object(o)
@@ -0,0 +1,92 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import List, Set, Tuple, TYPE_CHECKING
+
+from .ConstantFolding import ConstantFolding
+from .HeavyIrObject import HeavyIrObject
+
+if TYPE_CHECKING:
+    from .HeavyGraph import HeavyGraph
+
+
+class DeadCodeElimination:
+    """ Removes signal objects of which the output never reaches a dac~, table,
+        send~ with a receiver or control outlet.
+
+        Only objects without side effects are removed, i.e. objects that only have signal
+        outlets. A [__var~f] without any readers is removed together with its writers.
+        Signal connections into graph outlets that are not used outside of the graph are
+        removed, as are connections into graph inlets that are not used inside of the graph.
+    """
+
+    __VAR_TYPES = {"__var~f", "__var~i"}
+    __VARREAD_TYPES = {"__varread~f", "__varread~i"}
+    __VARWRITE_TYPES = {"__varwrite~f", "__varwrite~i"}
+
+    @classmethod
+    def is_removable(cls, o: HeavyIrObject) -> bool:
+        """ Returns True if the object can be removed when its outputs are not used.
+        """
+        return o.type != "__graph" and o.does_process_signal and o.num_outlets > 0 \
+            and all(o.outlet_requires_signal(i) for i in range(o.num_outlets)) \
+            and all(b[0] == "zero" for b in o.inlet_buffers + o.outlet_buffers)
+
+    @classmethod
+    def run(cls, graph: 'HeavyGraph') -> Tuple[int, int]:
+        """ Returns the number of removed objects and signal buffers.
+        """
+        num_objects = 0
+        num_buffers = 0
+        removed: Set[HeavyIrObject] = set()
+
+        def disconnect(cc: List) -> List[HeavyIrObject]:
+            # removes the signal connections and returns the objects that they came from
+            sources = []
+            for c in [c for c in cc if c.is_signal]:
+                c.to_object.graph.disconnect_objects(c)
+                sources.append(c.from_object)
+            return sources
+
+        def remove(o: HeavyIrObject) -> List[HeavyIrObject]:
+            # removes the object and returns the objects that fed into it
+            assert o.graph is not None
+            sources = [c.from_object for cc in o.inlet_connections for c in cc]
+            o.graph.remove_object(o)
+            removed.add(o)
+            return sources
+
+        def is_unused(cc: List) -> bool:
+            return not any(c.is_signal for c in cc)
+
+        work: List = list(ConstantFolding.objects(graph))
+        while len(work) > 0:
+            while len(work) > 0:
+                o = work.pop()
+                if o in removed:
+                    continue
+                elif o.type == "__graph":
+                    for i, cc in enumerate(o.outlet_connections):
+                        if is_unused(cc):
+                            work.extend(disconnect(o.outlet_objs[i].inlet_connections[0]))
+                elif o.type == "__inlet":
+                    g = o.graph
+                    if g is not None and not g.is_root_graph() and is_unused(o.outlet_connections[0]):
+                        work.extend(disconnect(g.inlet_connections[g.inlet_objs.index(o)]))
+                elif cls.is_removable(o) and all(len(cc) == 0 for cc in o.outlet_connections):
+                    work.extend(remove(o))
+                    num_objects += 1
+                    num_buffers += o.num_outlets
+
+            # vars that are never read, and everything writing to them
+            objs = list(ConstantFolding.objects(graph))
+            read = {o.args["var_id"] for o in objs if o.type in cls.__VARREAD_TYPES}
+            for o in objs:
+                if (o.type in cls.__VAR_TYPES and o.id not in read) or \
+                        (o.type in cls.__VARWRITE_TYPES and o.args["var_id"] not in read):
+                    work.extend(remove(o))
+                    num_objects += 1
+
+        return num_objects, num_buffers
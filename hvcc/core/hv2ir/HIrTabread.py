@@ -21,7 +21,7 @@ from .HeavyGraph import HeavyGraph
 
 
 class HIrTabread(HeavyIrObject):
-    """ __tabread~if
+    """ __tabread~if, __tabread~f, __tabread_stoppable~f, __tabreadu~f, __tabread and __delread_lin~f
     """
 
     def __init__(
@@ -31,7 +31,9 @@ class HIrTabread(HeavyIrObject):
         graph: Optional[HeavyGraph] = None,
         annotations: Optional[Dict] = None
     ) -> None:
-        assert obj_type in {"__tabread~if", "__tabread~f", "__tabread_stoppable~f", "__tabreadu~f", "__tabread"}
+        assert obj_type in {
+            "__tabread~if", "__tabread~f", "__tabread_stoppable~f", "__tabreadu~f", "__tabread", "__delread_lin~f"
+        }
         super().__init__(obj_type, args=args, graph=graph, annotations=annotations)
 
     def reduce(self) -> Optional[Tuple[Set, List]]:
@@ -0,0 +1,33 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Optional, Dict
+
+from .HeavyIrObject import HeavyIrObject
+from .HeavyLangObject import HeavyLangObject
+from .HeavyGraph import HeavyGraph
+
+
+class HLangOsc(HeavyLangObject):
+    """ Translates HeavyLang object [osc] to HeavyIR [osc~].
+    """
+
+    def __init__(
+        self,
+        obj_type: str,
+        args: Dict,
+        graph: 'HeavyGraph',
+        annotations: Optional[Dict] = None
+    ) -> None:
+        assert obj_type == "osc"
+        super().__init__(obj_type, args, graph, annotations=annotations)
+
+    def reduce(self) -> tuple:
+        if self.has_inlet_connection_format(["f_", "fc"]):
+            x = HeavyIrObject("__osc~f", self.args)
+            return ({x}, self.get_connection_move_list(x))
+        else:
+            x = HeavyIrObject("__osc_k~f", self.args)
+            return ({x}, self.get_connection_move_list(x))
@@ -21,12 +21,17 @@ from typing import Optional, Union, Dict, List, Set, Tuple
 
 from .BufferPool import BufferPool
 from .Connection import Connection
+from .ConstantFolding import ConstantFolding
+from .DeadCodeElimination import DeadCodeElimination
 from .LocalVars import LocalVars
 from .HeavyException import HeavyException
 from .HeavyIrObject import HeavyIrObject
 from .HIrReceive import HIrReceive
 from .HeavyLangObject import HeavyLangObject
+from .PeepholeOptimiser import PeepholeOptimiser
+from .SignalScheduler import SignalScheduler
 
+from hvcc.core.directory_index import DirectoryIndex
 from hvcc.types.compiler import CompilerNotif
 from hvcc.types.IR import (
     IRObjectdict, IRGraph, IRName, IRInit, IRControl, IRReceiver,
@@ -46,7 +51,9 @@ class HeavyGraph(HeavyIrObject):
         graph: Optional['HeavyGraph'] = None,
         graph_args: Optional[Dict] = None,
         file: str = "",
-        xname: str = "heavy"
+        xname: str = "heavy",
+        origin: str = "",
+        directory_index: Optional[DirectoryIndex] = None
     ) -> None:
         # zero inlets and outlets until inlet/outlet objects are declared
         super().__init__("__graph", graph_args, graph, 0, 0)
@@ -57,6 +64,9 @@ class HeavyGraph(HeavyIrObject):
         # a user-defined name of this graph
         self.xname = xname
 
+        # the Pd files and subpatches which define this graph, e.g. "main.pd/voice.pd/lop~.pd"
+        self.origin = origin
+
         # the dictionary of all objects in the graph
         self.objs: Dict = {}
 
@@ -66,8 +76,11 @@ class HeavyGraph(HeavyIrObject):
         else:
             self.args = {}
 
-        # initialise the local variables
-        self.local_vars = LocalVars()
+        # initialise the local variables. Abstractions are looked up in the
+        # directory index of the root graph, shared by all graphs of a compile
+        if directory_index is None and graph is not None:
+            directory_index = graph.local_vars.directory_index
+        self.local_vars: LocalVars = LocalVars(directory_index=directory_index)
 
         # the list of all constituent inlet and outlet objects
         # graphs always start with no inlet/outlets
@@ -81,6 +94,12 @@ class HeavyGraph(HeavyIrObject):
         # an ordered list of signal objects to process
         self.signal_order: List = []
 
+        # the scheduler that determines the signal order, see SignalScheduler
+        self.signal_scheduler = "depth-first"
+
+        # the number of objects and buffers removed by the optimisation passes
+        self.stats: Dict[str, int] = {}
+
         # a pool of signal buffers for use during signal ordering and buffer assignment
         self.buffer_pool: Optional[BufferPool] = None
 
@@ -420,11 +439,15 @@ class HeavyGraph(HeavyIrObject):
                 c[o.type] += 1
         return c
 
-    def prepare(self) -> None:
+    def prepare(self, signal_scheduler: str = "depth-first") -> None:
         """ Prepares a graph to be exported. Must be called from a root graph.
         """
         assert self.is_root_graph()
 
+        if signal_scheduler not in SignalScheduler.SCHEDULERS:
+            raise HeavyException(f"Unknown signal scheduler \"{signal_scheduler}\".")
+        self.signal_scheduler = signal_scheduler
+
         try:
             # apply graph transformations when all graphs have been read
             # All transformations must be recursive.
@@ -453,9 +476,15 @@ class HeavyGraph(HeavyIrObject):
             # ensures that there is at most one signal connection at any inlet
             self.cascade_expansion()
 
-            # fma replacement
-            # convert [__mul~f ~f> __add~f] into [__fma~f]
-            self.fma_replacement()
+            # fold signal operations with constant inputs,
+            # then remove signal objects of which the output is never used
+            self.stats["constant_folding_objects"], self.stats["constant_folding_buffers"], \
+                self.stats["constant_folding_constants"] = ConstantFolding.run(self)
+            self.stats["dead_code_objects"], self.stats["dead_code_buffers"] = DeadCodeElimination.run(self)
+
+            # rewrite chains of signal objects, e.g. convert [__mul~f ~f> __add~f] into [__fma~f]
+            for name, hits in PeepholeOptimiser.run(self).items():
+                self.stats[f"peephole_{name}"] = hits
 
             # group all control receivers with the same name under one logical receiver
             self.group_control_receivers()
@@ -689,56 +718,6 @@ class HeavyGraph(HeavyIrObject):
             if o.type == "__graph":
                 o.cascade_expansion()
 
-    def fma_replacement(self) -> None:
-        """ Replace:
-            [__mul~f] ~f> [__add~f] with [__fma~f] or
-            [__mul~f] ~f> [__sub~f] with [__fms~f]
-        """
-        # for all __mul~f objects
-        for o in self.objs.copy().values():
-            if o.type == "__mul~f" \
-                    and len(o.inlet_connections[0]) == 1 \
-                    and len(o.inlet_connections[1]) == 1 \
-                    and len(o.outlet_connections[0]) == 1 \
-                    and (o.outlet_connections[0][0].to_object.type == "__add~f"
-                         or (o.outlet_connections[0][0].to_object.type == "__sub~f"
-                             and o.outlet_connections[0][0].inlet_index == 0)) \
-                    and len(o.outlet_connections[0][0].to_object.inlet_connections[0]) == 1 \
-                    and len(o.outlet_connections[0][0].to_object.inlet_connections[1]) == 1 \
-                    and len(o.outlet_connections[0][0].to_object.outlet_connections[0]) > 0:
-
-                fma_type = "__fma~f" if o.outlet_connections[0][0].to_object.type == "__add~f" else "__fms~f"
-                fma = HeavyIrObject(fma_type)
-                self.add_object(fma)
-
-                # move connection to left inlet of fma~
-                c = o.inlet_connections[0][0]
-                self.update_connection(c, [c.copy(to_object=fma)])
-
-                # move connection to right inlet of fma~
-                c = o.inlet_connections[1][0]
-                self.update_connection(c, [c.copy(to_object=fma)])
-
-                o_add = o.outlet_connections[0][0].to_object
-
-                # move connection to third inlet of fma~ from +~ (not connected to *~)
-                i = o.outlet_connections[0][0].inlet_index  # i is either 0 or 1
-                # i ^ 1 # use the other inlet; 0 > 1, 1 > 0
-                c = o_add.inlet_connections[i ^ 1][0]
-                self.update_connection(c, [c.copy(to_object=fma, inlet_index=2)])
-
-                # move all +~ outlet connections to fma~ outlet
-                for c in o_add.outlet_connections[0]:
-                    self.connect_objects(c.copy(from_object=fma))
-
-                # remove old *~ and +~ objects from the graph
-                # (along with any remaining connections)
-                o.graph.remove_object(o)  # *~
-                o_add.graph.remove_object(o_add)  # +~
-
-            elif o.type == "__graph":
-                o.fma_replacement()  # recurse through all subgraphs
-
     def group_control_receivers(self) -> None:
         """ Group all control receivers with the same name under one receiver
             with that name. This way only one message must be scheduled to hit
@@ -803,6 +782,9 @@ class HeavyGraph(HeavyIrObject):
         # retain only objects that process a signal
         self.signal_order = [o for o in self.signal_order if o.does_process_signal]
 
+        if self.get_root_graph().signal_scheduler == "locality":
+            self.signal_order = SignalScheduler.schedule(self.signal_order)
+
     def assign_signal_buffers(self, buffer_pool: Optional[BufferPool] = None) -> None:
         # the top-level graph owns the buffer pool
         if buffer_pool is not None:
@@ -14,9 +14,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import json
-import os
-
 from typing import Dict, List, Optional, TYPE_CHECKING
 
 from .Connection import Connection
@@ -24,7 +21,8 @@ from .HeavyException import HeavyException
 from .HeavyLangObject import HeavyLangObject
 from .BufferPool import BufferPool
 
-from hvcc.types.IR import HeavyIRType, IRNode, IRObjectdict, IRSendMessage, IROnMessage, IRSignalList, IRBuffer
+from hvcc.core.registry import HEAVY_IR
+from hvcc.types.IR import IRNode, IRObjectdict, IRSendMessage, IROnMessage, IRSignalList, IRBuffer
 from hvcc.types.Lang import LangLetType
 
 
@@ -38,9 +36,8 @@ class HeavyIrObject(HeavyLangObject):
         the file heavy.ir.json.
     """
 
-    # load the HeavyIR object definitions
-    with open(os.path.join(os.path.dirname(__file__), "../json/heavy.ir.json"), "r") as f:
-        __HEAVY_OBJS_IR_DICT = HeavyIRType(**json.load(f)).root
+    # the HeavyIR object definitions
+    __HEAVY_OBJS_IR_DICT = HEAVY_IR
 
     def __init__(
         self,
@@ -199,12 +196,13 @@ class HeavyIrObject(HeavyLangObject):
 
     def get_object_dict(self) -> Dict[str, IRObjectdict]:
         """ Returns a dictionary of all constituent low-level objects,
-            indexed by id, including their arguments and type.
+            indexed by id, including their arguments, type and origin.
         """
         return {
             self.id: IRObjectdict(
                 args=self.args,
-                type=self.type
+                type=self.type,
+                origin=self.graph.origin if self.graph is not None else None
             )
         }
 
@@ -15,19 +15,18 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import decimal
-import json
-import os
 import random
 import string
 
-from struct import unpack, pack
 from typing import Optional, Union, List, Dict, Any, TYPE_CHECKING
 
 from .Connection import Connection
 from .HeavyException import HeavyException
 
 from hvcc.types.compiler import CompilerMsg, CompilerNotif
-from hvcc.types.Lang import HeavyLangType, LangNode, LangLet, LangLetType, LangValueType
+from hvcc.core.registry import HEAVY_LANG
+from hvcc.core.symbol_hash import get_hash
+from hvcc.types.Lang import LangNode, LangLet, LangLetType, LangValueType
 
 if TYPE_CHECKING:
     from .HeavyGraph import HeavyGraph
@@ -41,9 +40,8 @@ class HeavyLangObject:
     __RANDOM = random.Random()
     __ID_CHARS = string.ascii_letters + string.digits
 
-    # load the Heavy object definitions
-    with open(os.path.join(os.path.dirname(__file__), "../json/heavy.lang.json"), "r") as f:
-        _HEAVY_LANG_DICT = HeavyLangType(**json.load(f)).root
+    # the Heavy object definitions
+    _HEAVY_LANG_DICT = HEAVY_LANG
 
     def __init__(
         self,
@@ -378,45 +376,7 @@ class HeavyLangObject:
     def get_hash(cls, x: str) -> int:
         """ Compute the message element hash used by msg_getHash(). Returns a 32-bit integer.
         """
-        if isinstance(x, float) or isinstance(x, int):
-            # interpret the float bytes as an unsigned integer
-            return unpack("@I", pack("@f", float(x)))[0]
-        elif x == "bang":
-            return 0xFFFFFFFF
-        elif isinstance(x, str):
-            # this hash is based MurmurHash2
-            # http://en.wikipedia.org/wiki/MurmurHash
-            # https://sites.google.com/site/murmurhash/
-            x = str(x)
-            m = 0x5bd1e995
-            r = 24
-            h = len(x)
-            i = 0
-            while i < len(x) & ~0x3:
-                k = unpack("@I", bytes(x[i:i + 4], "utf-8"))[0]
-                k = (k * m) & 0xFFFFFFFF
-                k ^= k >> r
-                k = (k * m) & 0xFFFFFFFF
-                h = (h * m) & 0xFFFFFFFF
-                h ^= k
-                i += 4
-
-            n = len(x) & 0x3
-            x = x[i:i + n]
-            if n >= 3:
-                h ^= (ord(x[2]) << 16) & 0xFFFFFFFF
-            if n >= 2:
-                h ^= (ord(x[1]) << 8) & 0xFFFFFFFF
-            if n >= 1:
-                h ^= ord(x[0])
-                h = (h * m) & 0xFFFFFFFF
-
-            h ^= h >> 13
-            h = (h * m) & 0xFFFFFFFF
-            h ^= h >> 15
-            return h
-        else:
-            raise Exception("Message element hashes can only be computed for float and string types.")
+        return get_hash(x)
 
     def __repr__(self) -> str:
         arg_str = " ".join([f"{k}:{o}" for (k, o) in self.args.items()])
@@ -43,6 +43,7 @@ from .HeavyLangObject import HeavyLangObject
 from .HLangLine import HLangLine
 from .HLangMessage import HLangMessage
 # from .HLangNoise import HLangNoise  # circular import. moved here
+from .HLangOsc import HLangOsc
 from .HLangPhasor import HLangPhasor
 from .HLangPrint import HLangPrint
 from .HLangReceive import HLangReceive
@@ -59,6 +60,8 @@ from .HLangVario import HLangVario
 from .HeavyGraph import HeavyGraph
 from .Connection import Connection
 
+from hvcc.core.directory_index import DirectoryIndex
+
 
 class HeavyParser:
 
@@ -69,7 +72,9 @@ class HeavyParser:
         graph: Optional[HeavyGraph] = None,
         graph_args: Optional[Dict] = None,
         path_stack: Optional[set] = None,
-        xname: Optional[str] = None
+        xname: Optional[str] = None,
+        json_heavy: Optional[Dict] = None,
+        directory_index: Optional[DirectoryIndex] = None
     ) -> HeavyGraph:
         """ Read a graph object from a file.
 
@@ -78,6 +83,10 @@ class HeavyParser:
             resolved dictionary.
             @param path_stack  The path_stack is the current stack of resolved abstractions.
             It prevents infinite recursion when reading many abstractions deep.
+            @param json_heavy  An already parsed Heavy graph. If given, hv_file is
+            not read and is only used to locate the graph.
+            @param directory_index  The index of the abstraction directories of a root graph.
+            Graphs with a parent share the index of their parent.
         """
         # ensure that we have an absolute path to the hv_file
         hv_file = os.path.abspath(os.path.expanduser(hv_file))
@@ -90,10 +99,11 @@ class HeavyParser:
             path_stack.add(hv_file)
 
         # open and parse the heavy file
-        with open(hv_file, "r") as f:
-            json_heavy = json.load(f)
+        if json_heavy is None:
+            with open(hv_file, "r") as f:
+                json_heavy = json.load(f)
 
-        return cls.graph_from_object(hv_file, json_heavy, path_stack, graph, graph_args, xname)
+        return cls.graph_from_object(hv_file, json_heavy, path_stack, graph, graph_args, xname, directory_index)
 
     @classmethod
     def graph_from_object(
@@ -103,7 +113,8 @@ class HeavyParser:
         path_stack: set,
         graph: Optional[HeavyGraph] = None,
         graph_args: Optional[Dict] = None,
-        xname: Optional[str] = None
+        xname: Optional[str] = None,
+        directory_index: Optional[DirectoryIndex] = None
     ) -> HeavyGraph:
 
         """ Parse a graph object.
@@ -129,7 +140,16 @@ class HeavyParser:
 
         # create a new graph
         subpatch_name = json_heavy.get("annotations", {}).get("name", xname)
-        g = HeavyGraph(graph, graph_args, file=hv_file, xname=subpatch_name)
+
+        # the origin of a graph is appended to that of its parent graph
+        origin = json_heavy.get("properties", {}).get("origin")
+        if origin is None and (graph is None or graph.file != hv_file):
+            origin = os.path.basename(hv_file)
+        if graph is not None:
+            origin = graph.origin if origin is None else f"{graph.origin}/{origin}"
+
+        g = HeavyGraph(
+            graph, graph_args, file=hv_file, xname=subpatch_name, origin=origin, directory_index=directory_index)
 
         # add the import paths to the global vars
         g.local_vars.add_import_paths(json_heavy.get("imports", []))
@@ -292,6 +312,7 @@ LANG_CLASS_DICT = {
     "noise": HLangNoise,
     "system": HLangSystem,
     "phasor": HLangPhasor,
+    "osc": HLangOsc,
     "line": HLangLine,
     "random": HLangRandom,
     "delay": HLangDelay,
@@ -302,6 +323,7 @@ LANG_CLASS_DICT = {
     "__tabread_stoppable~f": HIrTabread,
     "__tabreadu~f": HIrTabread,
     "__tabread": HIrTabread,
+    "__delread_lin~f": HIrTabread,
     "__tabhead~f": HIrTabhead,
     "__tabhead": HIrTabhead,
     "__tabwrite~f": HIrTabwrite,
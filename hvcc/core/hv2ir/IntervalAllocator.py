@@ -0,0 +1,84 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Dict, List, Optional, Tuple
+
+from hvcc.types.IR import IRBuffer, IRSignal
+
+
+class IntervalAllocator:
+    """ Reassigns the temporary signal buffers of a signal process order, using
+        the minimal number of buffers.
+
+        Every value written to a temporary buffer is live from the object that writes it
+        up to the last object that reads it. The live ranges form an interval graph,
+        which is coloured optimally by assigning buffers in the order in which the
+        live ranges start. As with the BufferPool, an object may write its outputs
+        to the buffers of inputs that it reads last, but never two outputs to the same buffer.
+    """
+
+    # the buffer types that are allocated. adc~, dac~ and zero buffers are left untouched.
+    BUFFER_TYPES = ("~f>", "~i>")
+
+    @classmethod
+    def live_ranges(cls, signal: IRSignal) -> Optional[List[Tuple[int, int, str, List[IRBuffer]]]]:
+        """ Returns the live range of every value written to a temporary buffer, in the order
+            in which they start. A range is a tuple of (start, end, buffer type, buffer references).
+            Reads happen at time 2*i and writes at time 2*i+1 of the i-th object in the process order.
+            Returns None if a buffer is read before it is written, i.e. it is used across blocks.
+        """
+        ranges: List[List] = []
+        current: Dict[Tuple[str, int], List] = {}  # the live range of the value currently in each buffer
+
+        for i, so in enumerate(signal.processOrder):
+            for b in so.inputBuffers:
+                if b.type in cls.BUFFER_TYPES:
+                    r = current.get((b.type, b.index))
+                    if r is None:
+                        return None
+                    r[1] = 2 * i
+                    r[3].append(b)
+            for b in so.outputBuffers:
+                if b.type in cls.BUFFER_TYPES:
+                    r = [2 * i + 1, 2 * i + 1, b.type, [b]]
+                    current[(b.type, b.index)] = r
+                    ranges.append(r)
+
+        return [(r[0], r[1], r[2], r[3]) for r in ranges]
+
+    @classmethod
+    def allocate(cls, signal: IRSignal) -> bool:
+        """ Reassigns the temporary buffers of the process order in-place and updates the
+            number of temporary buffers. Returns False if the buffers could not be reassigned.
+        """
+        ranges = cls.live_ranges(signal)
+        if ranges is None:
+            return False
+
+        num_buffers = {t: 0 for t in cls.BUFFER_TYPES}
+        free: Dict[str, List[int]] = {t: [] for t in cls.BUFFER_TYPES}
+        active: List[Tuple[int, str, int]] = []  # (end, type, index) of the buffers in use
+
+        for start, end, buffer_type, refs in ranges:
+            # release all buffers of which the live range has ended
+            active.sort(reverse=True)
+            while len(active) > 0 and active[-1][0] < start:
+                _, t, index = active.pop()
+                free[t].append(index)
+
+            # reuse the most recently released buffer, such that it is likely still in the cache
+            if len(free[buffer_type]) > 0:
+                index = free[buffer_type].pop()
+            else:
+                index = num_buffers[buffer_type]
+                num_buffers[buffer_type] += 1
+            active.append((end, buffer_type, index))
+
+            for b in refs:
+                b.index = index
+
+        signal.numTemporaryBuffers.float = num_buffers["~f>"]
+        signal.numTemporaryBuffers.integer = num_buffers["~i>"]
+        return True
@@ -21,12 +21,14 @@ from typing import Optional, Union, Dict, List
 from .HeavyException import HeavyException
 from .HeavyLangObject import HeavyLangObject
 
+from hvcc.core.directory_index import DirectoryIndex
+
 
 class LocalVars:
     """ A set of scoped objects.
     """
 
-    def __init__(self, stdlib_dir: str = "./") -> None:
+    def __init__(self, stdlib_dir: str = "./", directory_index: Optional[DirectoryIndex] = None) -> None:
         # a dictionary of name-registered objects
         # the data structure is a list map
         # key is the name under which the object is registered, value is a
@@ -36,6 +38,9 @@ class LocalVars:
         # the list of globally declared paths
         self.declared_paths = [stdlib_dir]  # initialise with the standard library directory
 
+        # the files in the declared paths, listed once per compile
+        self.directory_index = directory_index or DirectoryIndex()
+
     def find_path_for_abstraction(self, name: str) -> Optional[str]:
         # the file name based on the abstraction name
         file_name = f"{name}.hv.json"
@@ -43,7 +48,7 @@ class LocalVars:
         # iterate in order through the declared paths in order to find the file
         for d in self.declared_paths:
             file_path = os.path.join(d, file_name)
-            if os.path.exists(file_path):
+            if self.directory_index.isfile(file_path):
                 return file_path  # if a matching abstraction is found, return the path
         return None  # otherwise return None
 
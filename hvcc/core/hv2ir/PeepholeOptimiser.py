@@ -0,0 +1,196 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import math
+import struct
+from typing import Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .ConstantFolding import ConstantFolding
+from .HeavyIrObject import HeavyIrObject
+
+if TYPE_CHECKING:
+    from .HeavyGraph import HeavyGraph
+
+
+class PeepholeOptimiser:
+    """ Rewrites short chains of signal objects into cheaper equivalents.
+
+        A rule matches a chain of objects by type, each object feeding a signal into the next.
+        The rule's method then checks the connections of the chain and rewrites it, returning
+        the removed objects, or None if the chain cannot be rewritten.
+
+        Rules are applied in order, and all of them repeatedly until nothing changes anymore.
+        Objects reading or writing the adc~ or dac~ buffers are never part of a chain.
+
+        Apart from the fma rule, which rounds once instead of twice, the rewrites do not change
+        the float results. Multiplications are only reassociated where that is exact.
+    """
+
+    # name, object types of the chain from first to last, rewrite method
+    RULES: List[Tuple[str, Tuple[Set[str], ...], str]] = [
+        ("mul_constants", ({"__mul~f"}, {"__mul~f"}), "_mul_constants"),
+        ("abs_abs", ({"__abs~f"}, {"__abs~f"}), "_abs_abs"),
+        ("fma", ({"__mul~f"}, {"__add~f", "__sub~f"}), "_fma"),
+    ]
+
+    @classmethod
+    def run(cls, graph: 'HeavyGraph') -> Dict[str, int]:
+        """ Applies all rules until nothing changes anymore.
+            Returns the number of hits of every rule.
+        """
+        hits = {name: 0 for name, _, _ in cls.RULES}
+        removed: Set[HeavyIrObject] = set()
+
+        is_changed = True
+        while is_changed:
+            is_changed = False
+            for name, pattern, method in cls.RULES:
+                rewrite = getattr(cls, method)
+                for o in ConstantFolding.objects(graph):
+                    for chain in [] if o in removed else list(cls._chains(o, pattern)):
+                        r = rewrite(chain)
+                        if r is not None:
+                            removed.update(r)
+                            hits[name] += 1
+                            is_changed = True
+                            break  # the connections of the object have changed
+
+        return hits
+
+    @classmethod
+    def _chains(cls, o: HeavyIrObject, pattern: Tuple[Set[str], ...]) -> Iterator[List[HeavyIrObject]]:
+        """ Yields all chains starting at the given object which match the pattern.
+        """
+        if o.type not in pattern[0] or any(b[0] != "zero" for b in o.inlet_buffers + o.outlet_buffers):
+            return
+        elif len(pattern) == 1:
+            yield [o]
+        else:
+            consumers = dict.fromkeys(c.to_object for cc in o.outlet_connections for c in cc if c.is_signal)
+            for x in consumers:
+                for chain in cls._chains(x, pattern[1:]):
+                    yield [o] + chain
+
+    @classmethod
+    def _signal_connections(cls, o: HeavyIrObject, inlet_index: int) -> List:
+        return [c for c in o.inlet_connections[inlet_index] if c.is_signal]
+
+    @classmethod
+    def _constant(cls, o: HeavyIrObject, inlet_index: int) -> Optional[float]:
+        """ Returns the value of a constant connected directly to the inlet, otherwise None.
+        """
+        cc = cls._signal_connections(o, inlet_index)
+        if len(cc) == 1 and cc[0].from_object.type == "__var_k~f" and cc[0].from_object.args["step"] == 0:
+            return float(cc[0].from_object.args["k"])
+        return None
+
+    @classmethod
+    def _remove_unused(cls, objs: List[HeavyIrObject]) -> List[HeavyIrObject]:
+        """ Removes the objects of which the outputs are no longer used, i.e. replaced constants.
+            Returns the removed objects.
+        """
+        unused = [o for o in dict.fromkeys(objs) if all(len(cc) == 0 for cc in o.outlet_connections)]
+        for o in unused:
+            assert o.graph is not None
+            o.graph.remove_object(o)
+        return unused
+
+    @classmethod
+    def _f32(cls, x: float) -> float:
+        """ Returns the value rounded to a 32-bit float, as the C code stores it.
+        """
+        return float(struct.unpack("f", struct.pack("f", x))[0])
+
+    @classmethod
+    def _is_exact_product(cls, a: float, b: float) -> bool:
+        """ Returns True if (x*a)*b == x*(a*b) for 32-bit floats, i.e. if either constant is a
+            power of two and their product is a normal float. A product x*a that overflows
+            or becomes subnormal is not taken into account.
+        """
+        ab = a * b
+        return any(x != 0.0 and math.frexp(x)[0] in (0.5, -0.5) for x in (a, b)) \
+            and 2.0 ** -126 <= abs(ab) <= 3.4028234663852886e+38
+
+    @classmethod
+    def _mul_constants(cls, chain: List[HeavyIrObject]) -> Optional[List[HeavyIrObject]]:
+        """ [__mul~f x a] ~f> [__mul~f b] becomes [__mul~f x a*b], if either a or b is a power of two.
+        """
+        m0, m1 = chain
+        if len(m0.outlet_connections[0]) != 1:
+            return None
+
+        i = m0.outlet_connections[0][0].inlet_index
+        b = cls._constant(m1, i ^ 1)
+        j = 1 if cls._constant(m0, 1) is not None else 0
+        a = cls._constant(m0, j)
+        x = cls._signal_connections(m0, j ^ 1)
+        if a is None or b is None or len(x) != 1:
+            return None
+        a, b = cls._f32(a), cls._f32(b)
+        if not cls._is_exact_product(a, b):
+            return None
+
+        assert m1.graph is not None
+        g = m1.graph
+        k = HeavyIrObject("__var_k~f", {"k": a * b})
+        g.add_object(k)
+        c = cls._signal_connections(m1, i ^ 1)[0]
+        constants = [c.from_object, cls._signal_connections(m0, j)[0].from_object]
+        g.update_connection(c, [c.copy(from_object=k)])
+        g.update_connection(x[0], [x[0].copy(to_object=m1, inlet_index=i)])
+        g.remove_object(m0)
+        return [m0] + cls._remove_unused(constants)
+
+    @classmethod
+    def _abs_abs(cls, chain: List[HeavyIrObject]) -> Optional[List[HeavyIrObject]]:
+        """ [__abs~f] ~f> [__abs~f] becomes [__abs~f].
+        """
+        a0, a1 = chain
+        assert a1.graph is not None
+        for c in list(a1.outlet_connections[0]):
+            a1.graph.update_connection(c, [c.copy(from_object=a0)])
+        a1.graph.remove_object(a1)
+        return [a1]
+
+    @classmethod
+    def _fma(cls, chain: List[HeavyIrObject]) -> Optional[List[HeavyIrObject]]:
+        """ [__mul~f] ~f> [__add~f] becomes [__fma~f],
+            [__mul~f] ~f> [__sub~f] (left inlet) becomes [__fms~f].
+        """
+        o, o_add = chain
+        if len(o.inlet_connections[0]) != 1 \
+                or len(o.inlet_connections[1]) != 1 \
+                or len(o.outlet_connections[0]) != 1 \
+                or (o_add.type == "__sub~f" and o.outlet_connections[0][0].inlet_index != 0) \
+                or len(o_add.inlet_connections[0]) != 1 \
+                or len(o_add.inlet_connections[1]) != 1 \
+                or len(o_add.outlet_connections[0]) == 0:
+            return None
+
+        assert o.graph is not None
+        g = o.graph
+        fma = HeavyIrObject("__fma~f" if o_add.type == "__add~f" else "__fms~f")
+        g.add_object(fma)
+
+        # move connections to the left and right inlets of fma~
+        c = o.inlet_connections[0][0]
+        g.update_connection(c, [c.copy(to_object=fma)])
+        c = o.inlet_connections[1][0]
+        g.update_connection(c, [c.copy(to_object=fma)])
+
+        # move connection to third inlet of fma~ from +~ (not connected to *~)
+        i = o.outlet_connections[0][0].inlet_index  # i is either 0 or 1
+        c = o_add.inlet_connections[i ^ 1][0]
+        g.update_connection(c, [c.copy(to_object=fma, inlet_index=2)])
+
+        # move all +~ outlet connections to fma~ outlet
+        for c in o_add.outlet_connections[0]:
+            g.connect_objects(c.copy(from_object=fma))
+
+        # remove old *~ and +~ objects from the graph
+        # (along with any remaining connections)
+        g.remove_object(o)
+        g.remove_object(o_add)
+        return [o, o_add]
@@ -0,0 +1,115 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import heapq
+from typing import Dict, List, Set, Tuple
+
+
+class SignalScheduler:
+    """ Reorders the signal objects of a graph to shorten the live ranges of their
+        buffers. The depth-first order places all inputs of an object before it,
+        but the order in which independent objects are visited follows the order
+        of the graph. This scheduler instead picks the next object such that:
+
+        - the consumers of the last scheduled object follow it directly, where possible.
+        - objects that read the last use of buffers (freeing them) go first.
+        - objects that only create new buffers (e.g. constants) are delayed.
+
+        Data dependencies are always respected. Objects that share state outside of
+        their buffers (tables, variables and the output channels) keep their relative order.
+    """
+
+    SCHEDULERS = ("depth-first", "locality")
+
+    # object types that read or write shared state, other than their own
+    __SHARED_STATE_PREFIXES = ("__tab", "__delread", "__varread", "__varwrite", "__conv")
+
+    @classmethod
+    def has_shared_state(cls, o) -> bool:
+        """ Returns True if the object (or any object in the graph) touches shared state.
+        """
+        if o.type == "__graph":
+            return any(cls.has_shared_state(x) for x in o.objs.values())
+        return o.type.startswith(cls.__SHARED_STATE_PREFIXES) or \
+            any(b[0] == "output" for b in o.inlet_buffers + o.outlet_buffers)
+
+    @classmethod
+    def schedule(cls, signal_order: List) -> List:
+        """ Returns a new order of the given signal objects, which must be in a valid
+            (i.e. depth-first) process order.
+        """
+        index = {o: i for i, o in enumerate(signal_order)}
+
+        # the dependencies of every object
+        succs: List[Set[int]] = [set() for _ in signal_order]
+        num_preds = [0] * len(signal_order)
+
+        # the buffers (i.e. signal outlets) read and written by every object,
+        # and the number of objects which have not yet read each buffer
+        reads: List[Set[Tuple[int, int]]] = [set() for _ in signal_order]
+        writes: List[List[Tuple[int, int]]] = [[] for _ in signal_order]
+        num_readers: Dict[Tuple[int, int], int] = {}
+
+        for i, o in enumerate(signal_order):
+            for c in [c for cc in o.inlet_connections for c in cc if c.is_signal]:
+                j = index.get(c.from_object)
+                if j is not None:
+                    succs[j].add(i)
+                    reads[i].add((j, c.outlet_index))
+
+            for k, cc in enumerate(o.outlet_connections):
+                readers = {c.to_object for c in cc if c.is_signal}
+                if len(readers) > 0:
+                    writes[i].append((i, k))
+                    # buffers leaving the graph are never freed here
+                    num_readers[(i, k)] = len(readers) + (0 if all(r in index for r in readers) else 1)
+
+        # objects with shared state are chained in their original order
+        shared = [i for i, o in enumerate(signal_order) if cls.has_shared_state(o)]
+        for i, j in zip(shared, shared[1:]):
+            succs[i].add(j)
+        for i in range(len(signal_order)):
+            for j in succs[i]:
+                num_preds[j] += 1
+
+        def score(i: int) -> int:
+            # the number of buffers that are freed minus the number of buffers created
+            return sum(1 for b in reads[i] if num_readers[b] == 1) - len(writes[i])
+
+        ready: List[Tuple[int, int]] = [(-score(i), i) for i, n in enumerate(num_preds) if n == 0]
+        heapq.heapify(ready)
+        is_scheduled = [False] * len(signal_order)
+        order: List[int] = []
+
+        candidates: List[int] = []
+        while len(order) < len(signal_order):
+            if len(candidates) > 0:
+                # keep the consumers of the last object adjacent to it
+                i = min(candidates, key=lambda x: (-score(x), x))
+            else:
+                s, i = heapq.heappop(ready)
+                if is_scheduled[i] or -s != score(i):
+                    continue  # stale entry
+
+            is_scheduled[i] = True
+            order.append(i)
+
+            for b in reads[i]:
+                num_readers[b] -= 1
+                if num_readers[b] == 1:
+                    # the score of the last reader of the buffer increases
+                    for j in succs[b[0]]:
+                        if b in reads[j] and not is_scheduled[j] and num_preds[j] == 0:
+                            heapq.heappush(ready, (-score(j), j))
+
+            candidates = []
+            for j in succs[i]:
+                num_preds[j] -= 1
+                if num_preds[j] == 0:
+                    heapq.heappush(ready, (-score(j), j))
+                    if any(b[0] == i for b in reads[j]):
+                        candidates.append(j)
+
+        return [signal_order[i] for i in order]
@@ -19,38 +19,53 @@ import json
 import os
 import time
 
-from typing import Optional
+from typing import Dict, Optional
 
+from hvcc.core.directory_index import DirectoryIndex
 from hvcc.core.hv2ir.HeavyException import HeavyException
 from hvcc.core.hv2ir.HeavyParser import HeavyParser
+from hvcc.core.hv2ir.IntervalAllocator import IntervalAllocator
+from hvcc.core.hv2ir.SignalScheduler import SignalScheduler
 
 from hvcc.types.compiler import CompilerResp, CompilerNotif, CompilerMsg
+from hvcc.types.IR import IRGraph
 
 
 class hv2ir:
 
+    BUFFER_ALLOCATORS = ("greedy", "interval")
+
     @classmethod
     def compile(
         cls,
         hv_file: str,
-        ir_file: str,
+        ir_file: Optional[str] = None,
         patch_name: Optional[str] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        hv_json: Optional[Dict] = None,
+        buffer_allocator: str = "greedy",
+        signal_scheduler: str = "depth-first",
+        directory_index: Optional[DirectoryIndex] = None
     ) -> CompilerResp:
-        """ Compiles a HeavyLang file into a HeavyIR file.
-            Returns a tuple of compile time in seconds, a notification dictionary,
-            and a heavy object counter.
+        """ Compiles a HeavyLang file into HeavyIR.
+            If hv_json is given it is used instead of reading hv_file. The IR is
+            returned in-memory and only written to ir_file if one is given.
+            The signal objects are ordered by the given signal scheduler, and their
+            temporary buffers are assigned by the given buffer allocator.
+            Abstractions are looked up in directory_index, if it is given, to share
+            it with the other stages of a compile.
         """
 
         # keep track of the total compile time
         tick = time.time()
 
         hv_file = os.path.abspath(os.path.expanduser(hv_file))
-        ir_file = os.path.abspath(os.path.expanduser(ir_file))
+        ir_file = os.path.abspath(os.path.expanduser(ir_file)) if ir_file is not None else ""
 
         try:
             # parse heavy file
-            hv_graph = HeavyParser.graph_from_file(hv_file=hv_file, xname=patch_name)
+            hv_graph = HeavyParser.graph_from_file(
+                hv_file=hv_file, xname=patch_name, json_heavy=hv_json, directory_index=directory_index)
         except HeavyException as e:
             return CompilerResp(
                 stage="hv2ir",
@@ -67,19 +82,22 @@ class hv2ir:
                 out_dir=os.path.dirname(ir_file)
             )
 
+        stats: Dict[str, int] = {}
         try:
             # get a counter of all heavy objects
             hv_counter = hv_graph.get_object_counter(recursive=True)
 
             # prepare the graph for exporting
-            hv_graph.prepare()
-
-            # ensure that the output directory exists
-            if not os.path.exists(os.path.dirname(ir_file)):
-                os.makedirs(os.path.dirname(ir_file))
+            hv_graph.prepare(signal_scheduler=signal_scheduler)
 
             # generate Heavy.IR
             ir = hv_graph.to_ir()
+
+            stats = dict(hv_graph.stats)
+
+            # optionally reassign the signal buffers based on their live ranges
+            if ir is not None and (buffer_allocator == "interval" or verbose):
+                stats.update(cls.allocate_buffers(ir, buffer_allocator))
         except HeavyException as e:
             return CompilerResp(
                 stage="hv2ir",
@@ -98,11 +116,27 @@ class hv2ir:
             )
 
         if ir is not None:
-            # write the hv.ir file
-            with open(ir_file, "w") as f:
-                json.dump(ir.model_dump(), f, indent=4)
+            if ir_file:
+                # ensure that the output directory exists
+                if not os.path.exists(os.path.dirname(ir_file)):
+                    os.makedirs(os.path.dirname(ir_file))
+
+                # write the hv.ir file
+                with open(ir_file, "w") as f:
+                    json.dump(ir.model_dump(), f, indent=4)
 
             if verbose and ir is not None:
+                print("")
+                print("=== Optimisations ===")
+                for name in ["constant_folding", "dead_code"]:
+                    print(f"{name}: {stats[f'{name}_objects']} objects, {stats[f'{name}_buffers']} buffers removed")
+                print(f"constant_folding: {stats['constant_folding_constants']} var reads replaced by constants")
+                for name, hits in [(k, v) for k, v in stats.items() if k.startswith("peephole_")]:
+                    print(f"{name}: {hits} hits")
+                print("")
+                print("=== Signal Buffers ===")
+                print(f"greedy: {stats['buffers_greedy']}")
+                print(f"interval: {stats['buffers_interval']}")
                 if len(ir.signal.processOrder) > 0:
                     print("")
                     print("=== Signal Order ===")
@@ -124,9 +158,30 @@ class hv2ir:
             out_file=os.path.basename(ir_file),
             out_dir=os.path.dirname(ir_file),
             obj_counter=hv_counter,
-            ir=ir
+            ir=ir,
+            stats=stats
         )
 
+    @classmethod
+    def allocate_buffers(cls, ir: IRGraph, buffer_allocator: str) -> Dict[str, int]:
+        """ Reassigns the temporary signal buffers if the interval allocator is selected.
+            Returns the number of temporary buffers under both allocators.
+        """
+        if buffer_allocator not in cls.BUFFER_ALLOCATORS:
+            raise HeavyException(f"Unknown buffer allocator \"{buffer_allocator}\".")
+
+        num_greedy = ir.signal.numTemporaryBuffers.float + ir.signal.numTemporaryBuffers.integer
+
+        signal = ir.signal if buffer_allocator == "interval" else ir.signal.model_copy(deep=True)
+        if not IntervalAllocator.allocate(signal):
+            # buffers are shared across blocks, keep the greedy assignment
+            signal = ir.signal
+
+        return {
+            "buffers_greedy": num_greedy,
+            "buffers_interval": signal.numTemporaryBuffers.float + signal.numTemporaryBuffers.integer
+        }
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -142,6 +197,16 @@ def main() -> None:
         "--name",
         default="heavy",
         help="")
+    parser.add_argument(
+        "--buffer-allocator",
+        choices=hv2ir.BUFFER_ALLOCATORS,
+        default="greedy",
+        help="The allocator of the temporary signal buffers.")
+    parser.add_argument(
+        "--signal-scheduler",
+        choices=SignalScheduler.SCHEDULERS,
+        default="depth-first",
+        help="The scheduler of the signal process order.")
     parser.add_argument("-v", "--verbose", action="count")
     args = parser.parse_args()
 
@@ -149,7 +214,9 @@ def main() -> None:
         hv_file=args.hv_path,
         ir_file=args.hv_ir_path,
         patch_name=args.name,
-        verbose=args.verbose)
+        verbose=args.verbose,
+        buffer_allocator=args.buffer_allocator,
+        signal_scheduler=args.signal_scheduler)
 
     if args.verbose:
         print(f"Total hv2ir time: {(d.compile_time * 1000):.2f}ms")
@@ -0,0 +1,54 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import os
+from typing import Any, Dict, Iterator, Mapping, Optional, Type
+
+from pydantic import RootModel
+
+from hvcc.types.IR import HeavyIRType, IRNode
+from hvcc.types.Lang import HeavyLangType, LangNode
+
+
+class ObjectRegistry(Mapping):
+    """ The object definitions of a heavy json file, by object type.
+
+        The file is read and validated on first access, and then shared by everything
+        in the process.
+    """
+
+    JSON_DIR = os.path.join(os.path.dirname(__file__), "json")
+
+    def __init__(self, file_name: str, model: Type[RootModel]) -> None:
+        self.json_path = os.path.join(self.JSON_DIR, file_name)
+        self.__model = model
+        self.__objs: Optional[Dict[str, Any]] = None
+
+    @property
+    def objs(self) -> Dict[str, Any]:
+        if self.__objs is None:
+            self.__objs = self.__load()
+        return self.__objs
+
+    def __getitem__(self, obj_type: str) -> Any:
+        return self.objs[obj_type]
+
+    def __contains__(self, obj_type: object) -> bool:
+        return obj_type in self.objs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.objs)
+
+    def __len__(self) -> int:
+        return len(self.objs)
+
+    def __load(self) -> Dict[str, Any]:
+        with open(self.json_path, "r") as f:
+            return self.__model(**json.load(f)).root
+
+
+HEAVY_IR: Mapping[str, IRNode] = ObjectRegistry("heavy.ir.json", HeavyIRType)
+HEAVY_LANG: Mapping[str, LangNode] = ObjectRegistry("heavy.lang.json", HeavyLangType)
@@ -0,0 +1,74 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from functools import lru_cache
+from struct import pack, unpack, unpack_from
+from typing import Union
+
+
+# the number of hashes which are remembered
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_hash(x: Union[float, str]) -> int:
+    """ Compute the message element hash used by msg_getHash(). Returns a 32-bit integer.
+        Every symbol is hashed by both hv2ir and ir2c, the results are cached.
+    """
+    if isinstance(x, float) or isinstance(x, int):
+        # interpret the float bytes as an unsigned integer
+        return unpack("@I", pack("@f", float(x)))[0]
+    elif x == "bang":
+        return 0xFFFFFFFF
+    elif isinstance(x, str):
+        return _murmur_hash(x)
+    else:
+        raise Exception("Message element hashes can only be computed for float and string types.")
+
+
+def get_hash_string(x: Union[float, str]) -> str:
+    """ Returns the hash as a hex string.
+    """
+    return f"0x{get_hash(x):X}"
+
+
+def _murmur_hash(x: str) -> int:
+    """ The hash of hv_string_to_hash(), based on MurmurHash2
+        http://en.wikipedia.org/wiki/MurmurHash
+        https://sites.google.com/site/murmurhash/
+    """
+    m = 0x5bd1e995
+    r = 24
+    h = len(x)
+
+    n = len(x) >> 2
+    if x.isascii():
+        # all 4-byte blocks at once
+        data = x.encode("ascii")
+        blocks = unpack_from(f"@{n}I", data)
+    else:
+        # NOTE: blocks are taken per 4 characters, which fails for blocks that are not ascii
+        blocks = tuple(unpack("@I", bytes(x[i:i + 4], "utf-8"))[0] for i in range(0, 4 * n, 4))
+
+    for k in blocks:
+        k = (k * m) & 0xFFFFFFFF
+        k ^= k >> r
+        k = (k * m) & 0xFFFFFFFF
+        h = (h * m) & 0xFFFFFFFF
+        h ^= k
+
+    tail = x[4 * n:]
+    if len(tail) >= 3:
+        h ^= (ord(tail[2]) << 16) & 0xFFFFFFFF
+    if len(tail) >= 2:
+        h ^= (ord(tail[1]) << 8) & 0xFFFFFFFF
+    if len(tail) >= 1:
+        h ^= ord(tail[0])
+        h = (h * m) & 0xFFFFFFFF
+
+    h ^= h >> 13
+    h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 15
+    return h
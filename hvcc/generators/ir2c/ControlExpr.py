@@ -17,6 +17,7 @@ import re
 from typing import Callable, Dict, List, Tuple
 
 from .HeavyObject import HeavyObject
+from .expr.expr_optimiser import ExprOptimiser
 
 
 class ControlExpr(HeavyObject):
@@ -81,7 +82,7 @@ class ControlExpr(HeavyObject):
 
         lines = super().get_C_impl(obj_type, obj_id, on_message_list, get_obj_class, objects, args)
         expr = args["expressions"][0]
-        bound_expr = bind_expr(expr, "args")
+        bound_expr = bind_expr(ExprOptimiser.fold_constants_c(expr), "args")
         lines.extend([
             "",
             f"float Heavy_{{{{name}}}}::{cls.preamble}_{obj_id}_evaluate(const float* args) {{",
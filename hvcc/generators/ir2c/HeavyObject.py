@@ -14,9 +14,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from struct import unpack, pack
 from typing import Callable, Dict, List, Union
 
+from hvcc.core.symbol_hash import get_hash, get_hash_string
 from hvcc.types.IR import IROnMessage, IRSignalList, IRBuffer, IRObjectdict
 
 
@@ -127,6 +127,12 @@ class HeavyObject:
     def get_C_process(cls, process_dict: IRSignalList, obj_type: str, obj_id: str, args: Dict) -> List[str]:
         raise NotImplementedError("method get_C_process not implemented")
 
+    @classmethod
+    def process_sends_messages(cls, obj_type: str) -> bool:
+        """ True if the signal process function of the object sends or schedules messages.
+        """
+        return False
+
     @classmethod
     def get_table_data_decl(cls, obj_type: str, obj_id: str, args: Dict) -> List[str]:
         raise NotImplementedError("method get_table_data_decl not implemented")
@@ -161,51 +167,12 @@ class HeavyObject:
 
     @classmethod
     def get_hash(cls, x: Union[float, str]) -> int:
-        """ Compute the message element hash used by msg_getHash().
-        Returns a 32-bit integer.
+        """ Compute the message element hash used by msg_getHash(). Returns a 32-bit integer.
         """
-        if isinstance(x, float) or isinstance(x, int):
-            # interpret the float bytes as an unsigned integer
-            return unpack("@I", pack("@f", float(x)))[0]
-        elif x == "bang":
-            return 0xFFFFFFFF
-        elif isinstance(x, str):
-            # this hash is based MurmurHash2
-            # http://en.wikipedia.org/wiki/MurmurHash
-            # https://sites.google.com/site/murmurhash/
-            x = str(x)
-            m = 0x5bd1e995
-            r = 24
-            h = len(x)
-            i = 0
-            while i < len(x) & ~0x3:
-                k = unpack("@I", bytes(x[i:i + 4], encoding='utf-8'))[0]
-                k = (k * m) & 0xFFFFFFFF
-                k ^= k >> r
-                k = (k * m) & 0xFFFFFFFF
-                h = (h * m) & 0xFFFFFFFF
-                h ^= k
-                i += 4
-
-            n = len(x) & 0x3
-            x = x[i:i + n]
-            if n >= 3:
-                h ^= (ord(x[2]) << 16) & 0xFFFFFFFF
-            if n >= 2:
-                h ^= (ord(x[1]) << 8) & 0xFFFFFFFF
-            if n >= 1:
-                h ^= ord(x[0])
-                h = (h * m) & 0xFFFFFFFF
-
-            h ^= h >> 13
-            h = (h * m) & 0xFFFFFFFF
-            h ^= h >> 15
-            return h
-        else:
-            raise Exception("Message element hashes can only be computed for float and string types.")
+        return get_hash(x)
 
     @classmethod
     def get_hash_string(cls, x: Union[float, str]) -> str:
         """ Returns the hash as a hex string.
         """
-        return f"0x{cls.get_hash(x):X}"
+        return get_hash_string(x)
@@ -0,0 +1,51 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Dict, List
+
+from .HeavyObject import HeavyObject
+
+from hvcc.types.IR import IRSignalList
+
+
+class SignalDelreadLin(HeavyObject):
+    """Handles __delread_lin~f
+    """
+
+    c_struct = "SignalDelreadLin"
+    preamble = "sDelreadLin"
+
+    @classmethod
+    def get_C_header_set(cls) -> set:
+        return {"HvSignalDelreadLin.h"}
+
+    @classmethod
+    def get_C_file_set(cls) -> set:
+        return {
+            "HvSignalDelreadLin.h", "HvSignalDelreadLin.c",
+            "HvSignalTabread.h", "HvSignalTabread.c",
+            "HvSignalVar.h", "HvSignalVar.c"
+        }
+
+    @classmethod
+    def get_C_init(cls, obj_type: str, obj_id: str, args: Dict) -> List[str]:
+        return [f"sDelreadLin_init(&sDelreadLin_{obj_id}, &hTable_{args['table_id']}, sampleRate);"]
+
+    @classmethod
+    def get_C_free(cls, obj_type: str, obj_id: str, args: Dict) -> List[str]:
+        return []
+
+    @classmethod
+    def get_C_onMessage(cls, obj_type: str, obj_id: str, inlet_index: int, args: Dict) -> List[str]:
+        return [f"sDelreadLin_onMessage(_c, &Context(_c)->sDelreadLin_{obj_id}, m);"]
+
+    @classmethod
+    def get_C_process(cls, process_dict: IRSignalList, obj_type: str, obj_id: str, args: Dict) -> List[str]:
+        return [
+            "__hv_delread_lin_f(&sDelreadLin_{0}, VIf({1}), VOf({2}));".format(
+                process_dict.id,
+                cls._c_buffer(process_dict.inputBuffers[0]),
+                cls._c_buffer(process_dict.outputBuffers[0])
+            )]
@@ -51,3 +51,7 @@ class SignalEnvelope(HeavyObject):
                 cls._c_buffer(process_dict.inputBuffers[0])
             )
         ]
+
+    @classmethod
+    def process_sends_messages(cls, obj_type: str) -> bool:
+        return True
@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from hvcc.types.IR import IRSignalList
 
@@ -23,11 +23,17 @@ from .HeavyObject import HeavyObject
 
 class SignalExpr(HeavyObject):
     """ Handles the math objects.
-        Note: obj_eval_functions dict accumulates until reset!
+        Objects with the same expression share one evaluator function.
+        Note: obj_eval_functions and obj_evaluators dicts accumulate until reset!
     """
 
     preamble = "cExprSig"
-    obj_eval_functions: Dict = {}
+
+    # the name of every evaluator function, by its body
+    obj_eval_functions: Dict[str, str] = {}
+
+    # the index into the evaluators of every object
+    obj_evaluators: Dict[str, int] = {}
 
     @classmethod
     def handles_type(cls, obj_type: str) -> bool:
@@ -39,6 +45,51 @@ class SignalExpr(HeavyObject):
     def get_C_header_set(cls) -> set:
         return {"HvMath.h"}
 
+    @classmethod
+    def _get_C_body(cls, expr: str) -> List[str]:
+        """ Returns the body of the evaluator function of an expression.
+        """
+        # expressions only differing in whitespace compile to the same code,
+        # which is generated only once
+        expr_parser = ExprCWriter(" ".join(expr.split()))
+        expr_lines = expr_parser.to_c_simd("bIns", "bOut")[:-1]
+        num_buffers = expr_parser.num_simd_buffers()
+
+        expr_line = "\n".join(
+            [f"\t{line}" for line in expr_lines]
+        )
+        buffer_declaration = "\t// no extra buffers needed"
+        if num_buffers > 0:
+            buffers = ", ".join([f"Bf{i}" for i in range(0, num_buffers)])
+            buffer_declaration = f"\thv_bufferf_t {buffers};"
+        return [buffer_declaration, expr_line]
+
+    @classmethod
+    def _get_evaluator(cls, obj_id: str, args: Dict) -> Tuple[int, str]:
+        """ Returns the index and the name of the evaluator function of an object.
+            The function is named after the first object with its body.
+        """
+        if obj_id not in cls.obj_evaluators:
+            body = "\n".join(cls._get_C_body(args["expressions"][0]))
+            if body not in cls.obj_eval_functions:
+                cls.obj_eval_functions[body] = f"{cls.preamble}_{obj_id}_evaluate"
+            cls.obj_evaluators[obj_id] = list(cls.obj_eval_functions).index(body)
+
+        index = cls.obj_evaluators[obj_id]
+        return index, list(cls.obj_eval_functions.values())[index]
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """ Returns the number of expr~ objects and evaluator functions, and the size
+            of the evaluator functions which are not generated as they are shared.
+        """
+        bodies = list(cls.obj_eval_functions)
+        return {
+            "expr_objects": len(cls.obj_evaluators),
+            "expr_evaluators": len(bodies),
+            "expr_bytes_saved": sum(len(bodies[i]) for i in cls.obj_evaluators.values()) - sum(len(b) for b in bodies),
+        }
+
     @classmethod
     def get_C_class_header_code(cls, obj_type: str, args: Dict) -> List[str]:
         eval_funcs = ",\n\t\t".join(cls.obj_eval_functions.values())
@@ -51,44 +102,28 @@ class SignalExpr(HeavyObject):
 
     @classmethod
     def get_C_obj_header_code(cls, obj_type: str, obj_id: str, args: Dict) -> List[str]:
-        lines = []
-        func_name = f"{cls.preamble}_{obj_id}_evaluate"
-        cls.obj_eval_functions[obj_id] = func_name
-        lines.extend([
+        _, func_name = cls._get_evaluator(obj_id, args)
+        if func_name != f"{cls.preamble}_{obj_id}_evaluate":
+            return []  # shares the evaluator of another object
+        return [
             f"static inline void {func_name}(hv_bInf_t* bIns, hv_bOutf_t bOut);",
-        ])
-        return lines
+        ]
 
     @classmethod
     def get_C_obj_impl_code(cls, obj_type: str, obj_id: str, args: Dict) -> List[str]:
-        """ (Per object) this creates the _sendMessage function that other objects use to
-            send messages to this object.
+        """ (Per object) this creates the evaluator function of the expression,
+            unless it is shared with another object.
         """
+        _, func_name = cls._get_evaluator(obj_id, args)
+        if func_name != f"{cls.preamble}_{obj_id}_evaluate":
+            return []  # shares the evaluator of another object
 
-        lines = []
-        expr = args["expressions"][0]
-        expr_parser = ExprCWriter(expr)
-        expr_lines = expr_parser.to_c_simd("bIns", "bOut")[:-1]
-        expr_line = "\n".join(
-            [f"\t{line}" for line in expr_lines]
-        )
-        num_buffers = expr_parser.num_simd_buffers()
-        buffer_declaration = "\t// no extra buffers needed"
-        if num_buffers > 0:
-            buffers = ", ".join([f"Bf{i}" for i in range(0, num_buffers)])
-            buffer_declaration = f"\thv_bufferf_t {buffers};"
-
-        func_name = f"Heavy_{{{{name}}}}::{cls.preamble}_{obj_id}_evaluate"
-        lines.extend([
+        return [
             "",
-            f"void {func_name}(hv_bInf_t* bIns, hv_bOutf_t bOut) {{",
-
-            buffer_declaration,
-            expr_line,
+            f"void Heavy_{{{{name}}}}::{func_name}(hv_bInf_t* bIns, hv_bOutf_t bOut) {{",
+            *cls._get_C_body(args["expressions"][0]),
             "}",
-
-        ])
-        return lines
+        ]
 
     @classmethod
     def get_C_process(cls, process_dict: IRSignalList, obj_type: str, obj_id: str, args: Dict) -> List[str]:
@@ -103,7 +138,7 @@ class SignalExpr(HeavyObject):
             "",
             "\t// !!! declare this buffer once outside the loop",
             f"\thv_bInf_t input_args_{obj_id}[{args['num_inlets']}] = {{{', '.join(input_args)}}};",
-            f"\t{cls.preamble}_evaluators[{len(cls.obj_eval_functions)}](input_args_{obj_id}, {out_buf});"
+            f"\t{cls.preamble}_evaluators[{cls._get_evaluator(obj_id, args)[0]}](input_args_{obj_id}, {out_buf});"
             "",
         ]
 
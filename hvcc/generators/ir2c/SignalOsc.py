@@ -0,0 +1,68 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import Dict, List
+
+from .HeavyObject import HeavyObject
+
+from hvcc.types.IR import IRSignalList
+
+
+class SignalOsc(HeavyObject):
+    """ A cosine oscillator, with the state and messages of a phasor.
+    """
+
+    c_struct = "SignalPhasor"
+    preamble = "sOsc"
+
+    @classmethod
+    def get_C_header_set(cls) -> set:
+        return {"HvSignalOsc.h"}
+
+    @classmethod
+    def get_C_file_set(cls) -> set:
+        return {"HvSignalOsc.h", "HvSignalPhasor.h", "HvSignalPhasor.c", "HvSignalVar.h", "HvSignalVar.c"}
+
+    @classmethod
+    def get_C_init(cls, obj_type: str, obj_id: str, args: Dict) -> List[str]:
+        if obj_type == "__osc~f":
+            return [f"sPhasor_init(&sOsc_{obj_id}, sampleRate);"]
+        elif obj_type == "__osc_k~f":
+            return [f"sPhasor_k_init(&sOsc_{obj_id}, {args['frequency']}f, sampleRate);"]
+        else:
+            raise Exception(f"Unknown object type \"{obj_type}\".")
+
+    @classmethod
+    def get_C_free(cls, obj_type: str, obj_id: str, args: Dict) -> List[str]:
+        return []
+
+    @classmethod
+    def get_C_onMessage(cls, obj_type: str, obj_id: str, inlet_index: int, args: Dict) -> List[str]:
+        if obj_type == "__osc~f":
+            return [f"sPhasor_onMessage(_c, &Context(_c)->sOsc_{obj_id}, {inlet_index}, m);"]
+        elif obj_type == "__osc_k~f":
+            return [f"sPhasor_k_onMessage(_c, &Context(_c)->sOsc_{obj_id}, {inlet_index}, m);"]
+        else:
+            raise Exception(f"Unknown object type \"{obj_type}\".")
+
+    @classmethod
+    def get_C_process(cls, process_dict: IRSignalList, obj_type: str, obj_id: str, args: Dict) -> List[str]:
+        if obj_type == "__osc~f":
+            return [
+                "__hv_osc_f(&sOsc_{0}, VIf({1}), VOf({2}));".format(
+                    process_dict.id,
+                    cls._c_buffer(process_dict.inputBuffers[0]),
+                    cls._c_buffer(process_dict.outputBuffers[0])
+                )
+            ]
+        elif obj_type == "__osc_k~f":
+            return [
+                "__hv_osc_k_f(&sOsc_{0}, VOf({1}));".format(
+                    process_dict.id,
+                    cls._c_buffer(process_dict.outputBuffers[0])
+                )
+            ]
+        else:
+            raise Exception(f"Unknown object type \"{obj_type}\".")
@@ -60,3 +60,7 @@ class SignalSample(HeavyObject):
                 cls.preamble
             )
         ]
+
+    @classmethod
+    def process_sends_messages(cls, obj_type: str) -> bool:
+        return True
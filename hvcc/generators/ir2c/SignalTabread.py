@@ -88,3 +88,7 @@ class SignalTabread(HeavyObject):
                 )]
         else:
             raise Exception()
+
+    @classmethod
+    def process_sends_messages(cls, obj_type: str) -> bool:
+        return obj_type == "__tabread_stoppable~f"
@@ -0,0 +1,96 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import re
+from collections import Counter
+from typing import Dict, List
+
+from hvcc.core.symbol_hash import get_hash
+from hvcc.types.IR import IRGraph
+
+
+class SymbolTable:
+    """ All distinct symbols of a Heavy.IR graph and their hashes, which are computed once
+        before the C code is generated. The symbols are the names of receivers, sends and
+        tables, the cases of switchcase objects and the symbols in messages.
+
+        Different symbols with the same hash cannot be told apart by the runtime.
+    """
+
+    def __init__(self, ir: IRGraph) -> None:
+        # the number of uses of every symbol, by kind
+        self.uses: Dict[str, Counter] = {}
+
+        for r in ir.control.receivers.values():
+            self.add(r.display, "receiver")
+        for t in ir.tables.values():
+            self.add(t.display, "table")
+
+        for o in ir.objects.values():
+            if o.type == "__send":
+                self.add(o.args["name"], "send")
+            elif o.type == "__switchcase":
+                for c in o.args["cases"]:
+                    if isinstance(c, str):
+                        self.add(c, "case")
+            elif o.type == "__message":
+                for m in o.args["local"]:
+                    for e in m:
+                        if self.is_message_symbol(e):
+                            self.add(e, "message")
+
+        # the hash of every symbol
+        self.hashes: Dict[str, int] = {s: get_hash(s) for s in self.uses}
+
+    def add(self, symbol: str, kind: str) -> None:
+        self.uses.setdefault(symbol, Counter())[kind] += 1
+
+    @classmethod
+    def is_message_symbol(cls, e: str) -> bool:
+        """ Returns True if the message element is set as a symbol, see ControlMessage.
+        """
+        try:
+            float(e)
+            return False
+        except Exception:
+            return e not in ["bang", "@HV_N_SIMD"] and re.match(r"\$[\d]+", e) is None
+
+    @classmethod
+    def c_string(cls, symbol: str) -> str:
+        """ Returns the symbol as a C string literal. Quotes and backslashes are escaped,
+            as are control characters in octal. Other characters are written as UTF-8.
+        """
+        escaped = []
+        for c in symbol:
+            if c in "\\\"":
+                escaped.append(f"\\{c}")
+            elif ord(c) < 0x20 or ord(c) == 0x7F:
+                escaped.append(f"\\{ord(c):03o}")
+            elif c == "?":
+                escaped.append("\\?")  # no trigraphs
+            else:
+                escaped.append(c)
+        return f"\"{''.join(escaped)}\""
+
+    def get_duplicates(self) -> Dict[str, Counter]:
+        """ Returns the symbols which are used more than once.
+        """
+        return {s: c for s, c in self.uses.items() if sum(c.values()) > 1}
+
+    def get_collisions(self) -> Dict[int, List[str]]:
+        """ Returns all hashes which are shared by different symbols.
+        """
+        symbols: Dict[int, List[str]] = {}
+        for s, h in self.hashes.items():
+            symbols.setdefault(h, []).append(s)
+        return {h: sorted(s) for h, s in symbols.items() if len(s) > 1}
+
+    def get_table(self) -> List[Dict[str, str]]:
+        """ Returns the symbols and their hashes ordered by hash, for the symbol table template.
+        """
+        return [
+            {"symbol": self.c_string(s), "hash": f"0x{h:X}", "uses": ", ".join(sorted(self.uses[s]))}
+            for s, h in sorted(self.hashes.items(), key=lambda x: (x[1], x[0]))
+        ]
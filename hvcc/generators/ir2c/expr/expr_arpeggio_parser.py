@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from functools import lru_cache
 from typing import Literal, Union
 
 from arpeggio import ParsingExpression as ParseTreeNode, Terminal  # type: ignore
@@ -46,8 +47,9 @@ class ExprArpeggioParser():
     """
     @classmethod
     def parse(cls, expr) -> ParseExpr:
-        """Parse the input expression and return a parse tree"""
-        return expr_grammar.parse(expr)
+        """Parse the input expression and return a parse tree.
+        Parse trees are cached by expression, and must not be modified."""
+        return _parse(expr)
 
     @classmethod
     def parse_to_ast(cls, expr: str) -> ExprNode:
@@ -102,3 +104,8 @@ class ExprArpeggioParser():
             return subtree
         else:
             raise ValueError(f"Unknown rule {expr.rule_name}")
+
+
+@lru_cache(maxsize=1024)
+def _parse(expr: str) -> ParseExpr:
+    return expr_grammar.parse(expr)
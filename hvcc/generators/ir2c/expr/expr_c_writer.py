@@ -13,34 +13,48 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import copy
 import re
-from typing import List, Union
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union
 
 from .expr_arpeggio_parser import ExprArpeggioParser, ExprNode, ParseExpr
+from .expr_optimiser import ExprOptimiser
 
 
 class BufferAllocator:
     """ Class for managing the swapping of buffers from
         output to input in successive calls.
+
+        A buffer is returned to the pool after its last use, so that it
+        can hold the output of the same call in which it is last used.
     """
     def __init__(self) -> None:
         self._avail: set = set()
         self._next: int = 0
+        self._uses: Dict[int, int] = {}
 
-    def next(self) -> int:
+    def next(self, uses: int = 1) -> int:
         """ If a buffer is available return it, otherwise
-            allocate a new one and return it.
+            allocate a new one and return it. The buffer is
+            available again after it has been freed uses times.
         """
         if len(self._avail) > 0:
-            return self._avail.pop()
-        nxt = self._next
-        self._next += 1
+            nxt = min(self._avail)
+            self._avail.remove(nxt)
+        else:
+            nxt = self._next
+            self._next += 1
+        self._uses[nxt] = uses
         return nxt
 
     def free(self, n: int) -> None:
-        """ Return a buffer back to the pool to be reused
+        """ Return a buffer back to the pool to be reused,
+            after its last use.
         """
-        self._avail.add(n)
+        self._uses[n] -= 1
+        if self._uses[n] == 0:
+            self._avail.add(n)
 
     def num_allocated(self) -> int:
         """ Return the buffers allocated in so far.
@@ -49,10 +63,16 @@ class BufferAllocator:
 
 
 class ExprCWriter:
+    # the maximum number of cached SIMD codes
+    MAX_CACHED = 1024
+
+    # the SIMD code and its number of buffers, by expression and variable names
+    __SIMD_CACHE: 'OrderedDict[Tuple[str, Union[str, None], str], Tuple[List[str], int]]' = OrderedDict()
+
     def __init__(self, expression: str):
         self.expression = expression
-        self.expr_tree: ExprNode = ExprArpeggioParser.parse_to_ast(expression)
         self.parse_tree: ParseExpr = ExprArpeggioParser.parse(expression)
+        self.expr_tree: ExprNode = ExprArpeggioParser.to_expr_tree(self.parse_tree)
         self.num_buffers: Union[int, None] = None
 
     def to_ast(self) -> ExprNode:
@@ -66,15 +86,42 @@ class ExprCWriter:
         vv_in: Union[str, None] = None,
         v_out: str = ""
     ) -> List[str]:
-        self._simd_bind_variables(vv_in)
-        self._simd_replace_constants()
-        return self._to_c_simd(v_out)
+        """ Returns the SIMD code of the expression, which is generated once per expression.
+            The number of buffers it uses is then available from num_simd_buffers().
+        """
+        key = (self.expression, vv_in, v_out)
+        entry = self.__SIMD_CACHE.get(key)
+        if entry is None:
+            entry = self._generate_simd(vv_in, v_out)
+            self.__SIMD_CACHE[key] = entry
+            if len(self.__SIMD_CACHE) > self.MAX_CACHED:
+                self.__SIMD_CACHE.popitem(last=False)
+        else:
+            self.__SIMD_CACHE.move_to_end(key)
+
+        lines, self.num_buffers = entry
+        return list(lines)
 
     def num_simd_buffers(self) -> int:
+        """ Returns the number of buffers used by the SIMD code. If the code has not been
+            generated yet, it is generated only to count them and is not cached.
+        """
         if self.num_buffers is None:
-            return len(self.to_c_simd())
+            _, self.num_buffers = self._generate_simd("A", "")
         return self.num_buffers
 
+    def _generate_simd(self, vv_in: Union[str, None], v_out: str) -> Tuple[List[str], int]:
+        """ Generates the SIMD code and counts its buffers, from a copy of the expression tree.
+        """
+        writer = copy.copy(self)
+        writer.expr_tree = copy.deepcopy(self.expr_tree)
+        writer._simd_bind_variables(vv_in)
+        writer.expr_tree = ExprOptimiser.fold_constants_f32(writer.expr_tree)
+        writer._simd_replace_constants()
+        lines = writer._to_c_simd(v_out)
+        assert writer.num_buffers is not None
+        return lines, writer.num_buffers
+
     def to_c_nested(self) -> str:
         return self._to_c_nested()
 
@@ -113,49 +160,71 @@ class ExprCWriter:
         node.value = f"{a_name}[{int(parts[2])-1}]"
         node.type = "bound_var"
 
+    def _simd_expand_unary_minus_R(self, tree: ExprNode) -> None:
+        if tree.value == "-" and len(tree.nodes) == 1:
+            # Unary minus, treat as (0-arg) by inserting a 0-const node.
+            zero_node = ExprNode("func", "_load_f", [ExprNode("num_f", "0.0f")])
+            tree.nodes.insert(0, zero_node)
+        for node in tree.nodes:
+            self._simd_expand_unary_minus_R(node)
+
     def _to_c_simd(self, v_out: str) -> List[str]:
         ba = BufferAllocator()
         lines: List[str] = []
 
-        def _to_c_simd_R(expr_tree: ExprNode, r_vec: Union[str, None] = None) -> str:
-            if expr_tree.value == "-" and len(expr_tree.nodes) == 1:
-                # Unary minus, treat as (0-arg) by inserting a 0-const node.
-                zero_node = ExprNode("func", "_load_f", [ExprNode("num_f", "0.0f")])
-                expr_tree.nodes.insert(0, zero_node)
+        if self.expr_tree.type in ("num_i", "num_f"):
+            # a constant expression is loaded directly into the output
+            self.expr_tree = ExprNode("func", f"_load_{self.expr_tree.type[-1]}", [self.expr_tree])
+        self._simd_expand_unary_minus_R(self.expr_tree)
+
+        # Identical subtrees are computed once, count how often each of their values is used.
+        uses: Dict[Tuple, int] = {}
+
+        def _count_uses_R(expr_tree: ExprNode) -> None:
+            key = ExprOptimiser.key(expr_tree)
+            uses[key] = uses.get(key, 0) + 1
+            if uses[key] == 1:
+                for node in expr_tree.nodes:
+                    _count_uses_R(node)
+
+        _count_uses_R(self.expr_tree)
+        computed: Dict[Tuple, str] = {}
 
+        def _to_c_simd_R(expr_tree: ExprNode, r_vec: Union[str, None] = None) -> str:
             if expr_tree.type in ("num_i", "num_f", "var", "bound_var"):
                 return expr_tree.value
 
-            args = []
-            buffers = []
+            key = ExprOptimiser.key(expr_tree)
+            if key in computed:
+                return computed[key]
 
             if (
                 expr_tree.type == "func"
                 and expr_tree.value.startswith("_load_")
             ):
-                next_buf = f"Bf{ba.next()}"
-                args.append(f"&{next_buf}")
                 const_value = _to_c_simd_R(expr_tree.nodes[0])
-                for i in range(8):
-                    args.append(const_value)
+                args = [const_value] * 8
             else:
-                for node in expr_tree.nodes:
-                    val = _to_c_simd_R(node)
-                    args.append(val)
-                    if isinstance(val, str) and val.startswith("Bf"):
-                        buffers.append(val)
-                if r_vec is not None:
-                    next_buf = r_vec
-                    args.append(next_buf)
-                else:
-                    next_buf = f"Bf{ba.next()}"
-                    args.append(f"&{next_buf}")
+                args = [_to_c_simd_R(node) for node in expr_tree.nodes]
+                # the output may reuse a buffer of which this is the last use
+                for val in args:
+                    if val.startswith("Bf"):
+                        ba.free(int(val[2:]))
+
+            if r_vec is not None:
+                next_buf = r_vec
+                out_arg = next_buf
+            else:
+                next_buf = f"Bf{ba.next(uses[key])}"
+                out_arg = f"&{next_buf}"
+            if expr_tree.value.startswith("_load_"):
+                args.insert(0, out_arg)
+            else:
+                args.append(out_arg)
 
             f_name = ExprOpMap.get_hv_func_simd(expr_tree.value)
             lines.append(f"{f_name}({', '.join(args)});")
-            for b in buffers:
-                ba.free(int(b[2]))
-
+            computed[key] = next_buf
             return next_buf
 
         lines.append(_to_c_simd_R(self.expr_tree, v_out))
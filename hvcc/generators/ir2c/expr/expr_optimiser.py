@@ -0,0 +1,198 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import math
+import struct
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from arpeggio import NonTerminal  # type: ignore
+
+from .expr_arpeggio_parser import ExprArpeggioParser, ExprNode, ParseExpr
+
+Number = Union[int, float]
+
+
+class ExprOptimiser:
+    """ Optimisations of expr and expr~ expressions before their C code is generated.
+
+        Constants are folded only where the folded value is exactly the value that the
+        generated code would compute at runtime. Operations are never reassociated, so
+        `$v1*2*3` is not folded, while `$v1*(2*3)` and `2*3*$v1` are.
+    """
+
+    # binary operations which are folded on floats
+    FLOAT_OPS: Dict[str, Callable[[float, float], float]] = {
+        "+": lambda a, b: a + b,
+        "-": lambda a, b: a - b,
+        "*": lambda a, b: a * b,
+        "/": lambda a, b: a / b,
+    }
+
+    @classmethod
+    def key(cls, tree: ExprNode) -> Tuple:
+        """ Returns a key which is equal for trees computing the same value.
+        """
+        return (tree.type, tree.value, tuple(cls.key(n) for n in tree.nodes))
+
+    @classmethod
+    def fold_constants_f32(cls, tree: ExprNode) -> ExprNode:
+        """ Replaces the constant subtrees of a signal expression by their value.
+            Every operation of __hv_*_f is rounded to 32-bit float, and so is every folded
+            operation. Divisions by zero, which give 0 at runtime, are not folded.
+        """
+        tree.nodes = [cls.fold_constants_f32(n) for n in tree.nodes]
+        values = [v for v in (cls._f32_value(n) for n in tree.nodes) if v is not None]
+        if len(values) == 0 or len(values) < len(tree.nodes):
+            return tree
+
+        try:
+            if tree.type == "unary" and tree.value == "-":
+                r = -values[0]
+            elif tree.type == "binary" and tree.value in cls.FLOAT_OPS and values[1] != 0.0:
+                r = cls._f32(cls.FLOAT_OPS[tree.value](values[0], values[1]))
+            else:
+                return tree
+        except OverflowError:
+            return tree
+
+        return ExprNode("num_f", cls._f32_literal(r)) if math.isfinite(r) else tree
+
+    @classmethod
+    def _f32(cls, x: float) -> float:
+        return struct.unpack("f", struct.pack("f", x))[0]
+
+    @classmethod
+    def _f32_value(cls, node: ExprNode) -> Optional[float]:
+        if node.type in ("num_i", "num_f"):
+            try:
+                return cls._f32(float(node.value.rstrip("f")))
+            except OverflowError:
+                return None
+        return None
+
+    @classmethod
+    def _f32_literal(cls, x: float) -> str:
+        """ Returns the shortest literal of a 32-bit float.
+        """
+        for p in range(6, 10):
+            s = f"{x:.{p}g}"
+            if cls._f32(float(s)) == x:
+                break
+        return s if any(c in s for c in ".e") else f"{s}.0"
+
+    @classmethod
+    def fold_constants_c(cls, expr: str) -> str:
+        """ Replaces the constant subexpressions of a control expression by their value,
+            with the semantics of C: operations on two integers are integer operations,
+            all other operations are done in double. Expressions which cannot be parsed
+            are returned unchanged.
+        """
+        try:
+            parse_tree = ExprArpeggioParser.parse(expr)
+        except Exception:
+            return expr
+
+        splices: List[Tuple[int, int, str]] = []
+        value = cls._fold_c_R(parse_tree, splices)
+        if value is not None:
+            cls._splice_c(parse_tree, parse_tree, value, splices)
+
+        for start, end, literal in sorted(splices, reverse=True):
+            expr = expr[:start] + literal + expr[end:]
+        return expr
+
+    # binary operations on integers, in C
+    C_INT_OPS: Dict[str, Callable[[int, int], int]] = {
+        "+": lambda a, b: a + b,
+        "-": lambda a, b: a - b,
+        "*": lambda a, b: a * b,
+        # C integer division and remainder truncate towards zero
+        "/": lambda a, b: abs(a) // abs(b) * (1 if (a < 0) == (b < 0) else -1),
+        "%": lambda a, b: a - b * (abs(a) // abs(b) * (1 if (a < 0) == (b < 0) else -1)),
+    }
+
+    @classmethod
+    def _c_op(cls, op: str, a: Number, b: Number) -> Optional[Number]:
+        """ Returns the result of a binary C operation, or None if it is not folded.
+        """
+        if b == 0 or op not in cls.C_INT_OPS:
+            return None
+        elif isinstance(a, int) and isinstance(b, int):
+            r = cls.C_INT_OPS[op](a, b)
+            return r if -2**31 <= r < 2**31 else None
+        elif op == "%":
+            return None  # not defined for doubles
+        else:
+            return cls.FLOAT_OPS[op](float(a), float(b))
+
+    @classmethod
+    def _fold_c_R(cls, node: ParseExpr, splices: List[Tuple[int, int, str]]) -> Optional[Number]:
+        """ Returns the value of a constant node. Otherwise adds the constant subexpressions
+            of the node to the splices, and returns None.
+        """
+        if node.rule_name == "num_i":
+            # C reads a leading 0 as octal, and larger numbers are not an int
+            i = int(node.value)
+            is_octal = len(node.value) > 1 and node.value[0] == "0"
+            return i if i < 2**31 and not is_octal else None
+        elif node.rule_name == "num_f":
+            return float(node.value)
+        elif not isinstance(node, NonTerminal):
+            return None
+
+        children = list(node)
+        values = [cls._fold_c_R(n, splices) for n in children]
+
+        if node.rule_name == "unary":
+            if children[0].value == "-" and values[1] is not None:
+                return -values[1]
+        elif node.rule_name in ("term", "factor"):
+            # left to right, until the first operand which is not constant
+            value: Optional[Number] = values[0]
+            k = 0
+            while value is not None and k + 2 < len(children):
+                b = values[k + 2]
+                r = cls._c_op(children[k + 1].value, value, b) if b is not None else None
+                if r is None:
+                    break
+                value = r
+                k += 2
+            if k + 1 == len(children):
+                return value
+            elif k > 0 and value is not None:
+                cls._splice_c(children[0], children[k], value, splices)
+                values[:k + 1] = [None] * (k + 1)
+
+        # the constant children of a node which is not constant
+        for n, v in zip(children, values):
+            if v is not None:
+                cls._splice_c(n, n, v, splices)
+        return None
+
+    @classmethod
+    def _splice_c(
+        cls,
+        first: ParseExpr,
+        last: ParseExpr,
+        value: Number,
+        splices: List[Tuple[int, int, str]]
+    ) -> None:
+        """ Replaces the nodes from first to last by the literal of the value,
+            if they contain any operation.
+        """
+        if first is last and (
+            not isinstance(first, NonTerminal)
+            or (first.rule_name == "unary" and not isinstance(first[1], NonTerminal))
+        ):
+            return  # a literal
+        elif isinstance(value, float) and not math.isfinite(value):
+            return
+
+        literal = repr(value)
+        if isinstance(value, float) and not any(c in literal for c in ".e"):
+            literal += ".0"
+        if value < 0:
+            literal = f"({literal})"
+        splices.append((first.position, last.position_end, literal))
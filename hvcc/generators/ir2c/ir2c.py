@@ -53,11 +53,13 @@ from hvcc.generators.ir2c.SignalConvolution import SignalConvolution
 from hvcc.generators.ir2c.SignalBiquad import SignalBiquad
 from hvcc.generators.ir2c.SignalCPole import SignalCPole
 from hvcc.generators.ir2c.SignalDel1 import SignalDel1
+from hvcc.generators.ir2c.SignalDelreadLin import SignalDelreadLin
 from hvcc.generators.ir2c.SignalEnvelope import SignalEnvelope
 from hvcc.generators.ir2c.SignalExpr import SignalExpr
 from hvcc.generators.ir2c.SignalLine import SignalLine
 from hvcc.generators.ir2c.SignalLorenz import SignalLorenz
 from hvcc.generators.ir2c.SignalMath import SignalMath
+from hvcc.generators.ir2c.SignalOsc import SignalOsc
 from hvcc.generators.ir2c.SignalPhasor import SignalPhasor
 from hvcc.generators.ir2c.SignalRPole import SignalRPole
 from hvcc.generators.ir2c.SignalSample import SignalSample
@@ -66,8 +68,9 @@ from hvcc.generators.ir2c.SignalTabhead import SignalTabhead
 from hvcc.generators.ir2c.SignalTabread import SignalTabread
 from hvcc.generators.ir2c.SignalTabwrite import SignalTabwrite
 from hvcc.generators.ir2c.SignalVar import SignalVar
+from hvcc.generators.ir2c.SymbolTable import SymbolTable
 
-from hvcc.types.compiler import CompilerResp, ExternInfo
+from hvcc.types.compiler import CompilerMsg, CompilerNotif, CompilerResp, ExternInfo
 from hvcc.types.IR import IRGraph
 
 
@@ -96,6 +99,7 @@ class ir2c:
         "__line~f": SignalLine,
         "__lorenz~f": SignalLorenz,
         "__del1~f": SignalDel1,
+        "__delread_lin~f": SignalDelreadLin,
         "__tabread~if": SignalTabread,
         "__tabread~f": SignalTabread,
         "__tabreadu~f": SignalTabread,
@@ -105,6 +109,8 @@ class ir2c:
         "__tabwrite_stoppable~f": SignalTabwrite,
         "__phasor~f": SignalPhasor,
         "__phasor_k~f": SignalPhasor,
+        "__osc~f": SignalOsc,
+        "__osc_k~f": SignalOsc,
         "__sample~f": SignalSample,
         "__samphold~f": SignalSamphold,
         "__slice": ControlSlice,
@@ -130,6 +136,15 @@ class ir2c:
         "HvLightPipe.h", "HvLightPipe.c"
     }
 
+    # the templates of Heavy_NAME.cpp, by how process() schedules messages:
+    # frame: the message queue is checked before every frame of HV_N_SIMD samples
+    # split: the block is split at the timestamps of the messages, and the frames in
+    #   between are processed in one run
+    MESSAGE_SCHEDULING_TEMPLATES = {
+        "frame": "Heavy_NAME.cpp",
+        "split": "Heavy_NAME_split.cpp",
+    }
+
     @classmethod
     def filter_hvhash(cls, x: Union[float, str]) -> str:
         """ Return the hash string of an object.
@@ -157,24 +172,49 @@ class ir2c:
         else:
             raise Exception(f"No class found for object type \"{obj_type}\".")
 
+    @classmethod
+    def profile_impl(cls, impl: str, index: int) -> str:
+        """ Counts the time spent in a sendMessage function, from its first statement.
+        """
+        signature, body = impl.split("\n", 1)
+        scope = f"HvProfileScope _profile(&Context(_c)->profileScope, &Context(_c)->profile[{index}]);"
+        return f"{signature}\n  {scope}\n{body}"
+
+    @classmethod
+    def profile_process(cls, lines: List[str], index: int) -> List[str]:
+        """ Counts the time spent in the process lines of a signal object.
+        """
+        scope = f"HvProfileScope _profile(&profileScope, &profile[{index}]);"
+        if len(lines) == 1:
+            return [f"{{ {scope} {lines[0]} }}"]
+        return [f"{{ {scope}", *lines, "}"]
+
     @classmethod
     def compile(
         cls,
-        hv_ir_path: str,
+        hv_ir_path: Optional[str],
         static_dir: str,
         output_dir: str,
         externs: ExternInfo,
         copyright: Optional[str] = None,
-        nodsp: Optional[bool] = False
+        nodsp: Optional[bool] = False,
+        ir: Optional[IRGraph] = None,
+        message_scheduling: str = "frame",
+        profile: bool = False
     ) -> CompilerResp:
-        """ Compiles a HeavyIR file into a C.
-            Returns a tuple of compile time in seconds, a notification dictionary,
-            and a HeavyIR object counter.
+        """ Compiles a HeavyIR graph into C. The graph is read from hv_ir_path,
+            unless an in-memory IRGraph is given. The message scheduling selects
+            the template of Heavy_NAME.cpp, see MESSAGE_SCHEDULING_TEMPLATES.
+            With profile, every signal object and message function counts the
+            time spent in it, which is returned by getProfile().
         """
 
         # keep track of the total compile time
         tick = time.time()
 
+        if message_scheduling not in cls.MESSAGE_SCHEDULING_TEMPLATES:
+            raise Exception(f"Unknown message scheduling \"{message_scheduling}\".")
+
         # establish the jinja environment
         env = jinja2.Environment()
         env.filters["hvhash"] = cls.filter_hvhash
@@ -183,8 +223,10 @@ class ir2c:
             os.path.join(os.path.dirname(__file__), "templates"))
 
         # read the hv.ir.json file
-        with open(hv_ir_path, "r") as f:
-            ir = IRGraph(**json.load(f))
+        if ir is None:
+            assert hv_ir_path is not None, "Either an IR file or an IRGraph must be given."
+            with open(hv_ir_path, "r") as f:
+                ir = IRGraph(**json.load(f))
 
         # the project name to be used as a part of file and function names
         name = ir.name.escaped
@@ -198,6 +240,15 @@ class ir2c:
 
         # Reset the obj_eval_functions state
         SignalExpr.obj_eval_functions = {}
+        SignalExpr.obj_evaluators = {}
+
+        # hash every symbol once, later hashes of the same symbols are cached
+        symbol_table = SymbolTable(ir)
+        notifs = CompilerNotif(warnings=[
+            CompilerMsg(message=f"Symbols {', '.join(symbols)} have the same hash 0x{h:X}, "
+                                "messages to them cannot be told apart.")
+            for h, symbols in symbol_table.get_collisions().items()
+        ])
 
         # generate set of header files to include
         include_set = set([x for o in ir.objects.values() for x in ir2c.get_class(o.type).get_C_header_set()])
@@ -205,6 +256,12 @@ class ir2c:
         # generate set of files to add to project
         file_set = set([x for o in ir.objects.values() for x in ir2c.get_class(o.type).get_C_file_set()])
         file_set.update(ir2c.__BASE_FILE_SET)
+        if profile:
+            include_set.add("HvProfile.hpp")
+            file_set.add("HvProfile.hpp")
+
+        # the profile counters, in the order of the generated code
+        profile_list: List[Dict[str, str]] = []
 
         # generate object definition and initialisation list
         init_list: List = []
@@ -247,7 +304,11 @@ class ir2c:
                 imp_render = env.from_string(imp).render(name=name)
                 impl_render.append(imp_render)
 
-            impl_list.append("\n".join(PrettyfyC.prettyfy_list(impl_render)))
+            impl_c = "\n".join(PrettyfyC.prettyfy_list(impl_render))
+            if profile:
+                impl_c = cls.profile_impl(impl_c, len(profile_list))
+                profile_list.append({"id": obj_id, "type": o.type, "function": "sendMessage"})
+            impl_list.append(impl_c)
             decl_list.extend(obj_class.get_C_decl(o.type, obj_id, o.args))
 
         # generate static table data initialisers
@@ -263,16 +324,22 @@ class ir2c:
         # generate the list of functions to process
         process_list: List = []
         process_classes: set[Type[HeavyObject]] = set()
+        process_sends_messages = False
         for y in ir.signal.processOrder:
             obj_id = y.id
             o = ir.objects[obj_id]
             obj_cls = ir2c.get_class(o.type)
             process_classes.add(obj_cls)
-            process_list.extend(obj_cls.get_C_process(
+            process_sends_messages |= obj_cls.process_sends_messages(o.type)
+            process_lines = obj_cls.get_C_process(
                 y,
                 o.type,
                 obj_id,
-                o.args))
+                o.args)
+            if profile and len(process_lines) > 0:
+                process_lines = cls.profile_process(process_lines, len(profile_list))
+                profile_list.append({"id": obj_id, "type": o.type, "function": "process"})
+            process_list.extend(process_lines)
 
             # Add Expr~ header and impl lines
             obj_header_lines.extend(obj_cls.get_C_obj_header_code(
@@ -308,6 +375,7 @@ class ir2c:
         with open(os.path.join(output_dir, f"Heavy_{name}.hpp"), "w") as f:
             f.write(env.get_template("Heavy_NAME.hpp").render(
                 name=name,
+                profile_list=profile_list,
                 include_set=include_set,
                 decl_list=decl_list,
                 def_list=def_list,
@@ -319,8 +387,9 @@ class ir2c:
 
         # write C++ implementation
         with open(os.path.join(output_dir, f"Heavy_{name}.cpp"), "w") as f:
-            f.write(env.get_template("Heavy_NAME.cpp").render(
+            f.write(env.get_template(cls.MESSAGE_SCHEDULING_TEMPLATES[message_scheduling]).render(
                 name=name,
+                profile_list=profile_list,
                 signal=ir.signal,
                 init_list=init_list,
                 free_list=free_list,
@@ -328,12 +397,20 @@ class ir2c:
                 send_receive=send_receive,
                 send_table=ir.tables,
                 process_list=process_list,
+                process_sends_messages=process_sends_messages,
                 table_data_list=table_data_list,
                 copyright=copyright,
                 class_impl_lines=class_impl_lines,
                 obj_impl_lines=obj_impl_lines,
                 nodsp=nodsp))
 
+        # write the symbol table, Heavy_NAME_symbols.h
+        with open(os.path.join(output_dir, f"Heavy_{name}_symbols.h"), "w") as f:
+            f.write(env.get_template("Heavy_NAME_symbols.h").render(
+                name=name,
+                copyright=copyright,
+                symbols=symbol_table.get_table()))
+
         # write C API, hv_NAME.h
         with open(os.path.join(output_dir, f"Heavy_{name}.h"), "w") as f:
             f.write(env.get_template("Heavy_NAME.h").render(
@@ -352,11 +429,19 @@ class ir2c:
 
         return CompilerResp(
             stage="ir2c",
-            in_dir=os.path.dirname(hv_ir_path),
-            in_file=os.path.basename(hv_ir_path),
+            notifs=notifs,
+            in_dir=os.path.dirname(hv_ir_path or ""),
+            in_file=os.path.basename(hv_ir_path or ""),
             out_dir=output_dir,
             compile_time=(time.time() - tick),
-            obj_counter=ir_counter
+            obj_counter=ir_counter,
+            stats={
+                "symbols": len(symbol_table.hashes),
+                "symbol_duplicates": len(symbol_table.get_duplicates()),
+                "symbol_collisions": len(symbol_table.get_collisions()),
+                **SignalExpr.get_stats(),
+                "profile_counters": len(profile_list),
+            }
         )
 
 
@@ -378,6 +463,11 @@ def main() -> None:
         "--copyright",
         default=None,
         help="A string indicating the owner of the copyright.")
+    parser.add_argument(
+        "--message-scheduling",
+        choices=list(ir2c.MESSAGE_SCHEDULING_TEMPLATES),
+        default="frame",
+        help="How process() schedules messages: check before every frame, or split the block at messages.")
     parser.add_argument("-v", "--verbose", action="count")
     args = parser.parse_args()
 
@@ -388,10 +478,15 @@ def main() -> None:
         args.static_dir,
         args.output_dir,
         externs,
-        args.copyright)
+        args.copyright,
+        message_scheduling=args.message_scheduling)
 
     if args.verbose:
         print("Total ir2c time: {0:.2f}ms".format(results.compile_time * 1000))
+        print("Symbols: {symbols}, used more than once: {symbol_duplicates}, "
+              "hash collisions: {symbol_collisions}".format(**results.stats))
+        print("expr~ objects: {expr_objects}, evaluators: {expr_evaluators}, "
+              "shared evaluators saved: {expr_bytes_saved} bytes".format(**results.stats))
 
 
 if __name__ == "__main__":
@@ -16,12 +16,12 @@
 
 import argparse
 import json
-import os
 
 from collections import Counter, defaultdict
-from typing import Dict
+from typing import Dict, List, Tuple
 
-from hvcc.types.IR import HeavyIRType, IRGraph
+from hvcc.core.registry import HEAVY_IR
+from hvcc.types.IR import IRGraph
 
 
 class ir2c_perf:
@@ -34,10 +34,6 @@ class ir2c_perf:
         mhz: int = 1000,
         verbose: bool = False
     ) -> Dict[str, Dict[str, float]]:
-        # read the hv.ir.json file
-        with open(os.path.join(os.path.dirname(__file__), "../../core/json/heavy.ir.json"), "r") as f:
-            HEAVY_IR_JSON = HeavyIRType(**json.load(f)).root
-
         objects: Counter = Counter()
         perf: Dict[str, float] = defaultdict(float)
         per_object_perf: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
@@ -45,9 +41,9 @@ class ir2c_perf:
         for o in ir.signal.processOrder:
             obj_id = o.id
             obj_type = ir.objects[obj_id].type
-            if obj_type in HEAVY_IR_JSON.keys():
+            if obj_type in HEAVY_IR.keys():
                 objects[obj_type] += 1
-                obj_perf = HEAVY_IR_JSON[obj_type].perf
+                obj_perf = HEAVY_IR[obj_type].perf
                 assert obj_perf is not None
                 c = defaultdict(float, **obj_perf.model_dump())
                 for k, v in c.items():
@@ -96,6 +92,66 @@ class ir2c_perf:
 
         return per_object_perf
 
+    @classmethod
+    def read_profile(cls, profile_path: str) -> List[Tuple[str, str, int, int]]:
+        """ Reads the counters of a profiling build, one counter per line as written by
+            printf("%s %s %s %llu %u\\n", info.id, info.type, info.function, info.ticks, info.count).
+            Returns the id, function, ticks and count of every counter.
+        """
+        counters = []
+        with open(profile_path, "r") as f:
+            for line in f:
+                if len(line.split()) == 5:
+                    obj_id, _, function, ticks, count = line.split()
+                    counters.append((obj_id, function, int(ticks), int(count)))
+        return counters
+
+    @classmethod
+    def profile(
+        cls,
+        ir: IRGraph,
+        counters: List[Tuple[str, str, int, int]],
+        verbose: bool = False
+    ) -> List[Dict]:
+        """ Maps the counters of a profiling build back to the objects of the HeavyIR graph,
+            i.e. their type and the Pd file or abstraction which they come from.
+            Returns the counters in order of the most time spent.
+        """
+        total = sum(c[2] for c in counters)
+        report: List[Dict] = []
+        for obj_id, function, ticks, count in counters:
+            o = ir.objects.get(obj_id)
+            report.append({
+                "id": obj_id,
+                "type": o.type if o is not None else "",
+                "origin": (o.origin or "") if o is not None else "",
+                "function": function,
+                "ticks": ticks,
+                "count": count,
+                "percent": 100.0 * ticks / total if total > 0 else 0.0
+            })
+        report.sort(key=lambda r: r["ticks"], reverse=True)
+
+        if verbose:
+            print("{0:>6} {1:>12} {2:>8} {3:<11} {4:<16} {5:<8} {6}".format(
+                "CPU%", "Ticks", "Calls", "Function", "Object Type", "Id", "Origin"))
+            print("====== ============ ======== =========== ================ ======== ======")
+            for r in report:
+                print("{percent:>5.1f}% {ticks:>12} {count:>8} {function:<11} {type:<16} {id:<8} {origin}".format(**r))
+
+            print()  # new line
+
+            # the time spent in every Pd file and abstraction
+            per_origin: Dict[str, int] = defaultdict(int)
+            for r in report:
+                per_origin[r["origin"]] += r["ticks"]
+            print("{0:>6} {1:>12} {2}".format("CPU%", "Ticks", "Origin"))
+            print("====== ============ ======")
+            for origin, ticks in sorted(per_origin.items(), key=lambda x: x[1], reverse=True):
+                print("{0:>5.1f}% {1:>12} {2}".format(100.0 * ticks / total if total > 0 else 0.0, ticks, origin))
+
+        return report
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -105,14 +161,21 @@ def main() -> None:
         help="The path to the Heavy.IR file to read.")
     parser.add_argument("--mhz", default=1000, type=float, help="the CPU clock frequency in MHz")
     parser.add_argument("--blocksize", default=64, type=int, help="the number of frames per block")
+    parser.add_argument(
+        "--profile",
+        help="The counters of a profiling build (see hvcc --profile), one per line. Prints the measured"
+             " time of every object instead of the estimate.")
     parser.add_argument("-v", "--verbose", action="count")
     args = parser.parse_args()
 
     # read the hv.ir.json file
     with open(args.hv_ir_path, "r") as f:
-        ir = json.load(f)
+        ir = IRGraph(**json.load(f))
 
-    ir2c_perf.perf(ir, args.blocksize, args.mhz, args.verbose)
+    if args.profile is not None:
+        ir2c_perf.profile(ir, ir2c_perf.read_profile(args.profile), verbose=True)
+    else:
+        ir2c_perf.perf(ir, args.blocksize, args.mhz, args.verbose)
 
 
 if __name__ == "__main__":
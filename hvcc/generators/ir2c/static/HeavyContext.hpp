@@ -32,6 +32,9 @@ class HeavyContext : public HeavyContextInterface {
 
   int getSize() override { return (int) numBytes; }
 
+  // only profiling builds have counters
+  int getProfile(int, HvProfileInfo *) override { return 0; }
+
   double getSampleRate() override { return sampleRate; }
 
   hv_uint32_t getCurrentSample() override { return blockStartTimestamp; }
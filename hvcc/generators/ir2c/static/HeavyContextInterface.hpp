@@ -41,6 +41,14 @@ typedef struct HvParameterInfo {
   float defaultVal;     // the default value of this parameter
 } HvParameterInfo;
 
+typedef struct HvProfileInfo {
+  const char *id;       // the id of the object in the HeavyIR graph
+  const char *type;     // the type of the object in the HeavyIR graph
+  const char *function; // "process" for signal processing, "sendMessage" for messages
+  hv_uint64_t ticks;    // the total time spent, in cycles (x86) or nanoseconds
+  hv_uint32_t count;    // the number of calls
+} HvProfileInfo;
+
 typedef void (HvSendHook_t) (HeavyContextInterface *context, const char *sendName, hv_uint32_t sendHash, const HvMessage *msg);
 typedef void (HvPrintHook_t) (HeavyContextInterface *context, const char *printName, const char *str, const HvMessage *msg);
 
@@ -208,6 +216,18 @@ class HeavyContextInterface {
    */
   virtual int getParameterInfo(int index, HvParameterInfo *info) = 0;
 
+  /**
+   * Returns the time spent in each signal object and message function, if the
+   * context has been compiled with profiling. The total number of counters is
+   * always returned.
+   *
+   * @param index  The counter index.
+   * @param info  A pointer to a HvProfileInfo struct. May be null.
+   *
+   * @return  The total number of counters, zero if the context is not profiled.
+   */
+  virtual int getProfile(int index, HvProfileInfo *info) = 0;
+
   /** Returns a pointer to the raw buffer backing this table. DO NOT free it. */
   virtual float *getBufferForTable(hv_uint32_t tableHash) = 0;
 
@@ -286,6 +286,11 @@ HV_EXPORT int hv_getParameterInfo(HeavyContextInterface *c, int index, HvParamet
   return c->getParameterInfo(index, info);
 }
 
+HV_EXPORT int hv_getProfile(HeavyContextInterface *c, int index, HvProfileInfo *info) {
+  hv_assert(c != nullptr);
+  return c->getProfile(index, info);
+}
+
 HV_EXPORT void hv_lock_acquire(HeavyContextInterface *c) {
   hv_assert(c != nullptr);
   c->lockAcquire();
@@ -50,6 +50,14 @@ typedef struct HvParameterInfo {
   float defaultVal;     // the default value of this parameter
 } HvParameterInfo;
 
+typedef struct HvProfileInfo {
+  const char *id;       // the id of the object in the HeavyIR graph
+  const char *type;     // the type of the object in the HeavyIR graph
+  const char *function; // "process" for signal processing, "sendMessage" for messages
+  hv_uint64_t ticks;    // the total time spent, in cycles (x86) or nanoseconds
+  hv_uint32_t count;    // the number of calls
+} HvProfileInfo;
+
 typedef void (HvSendHook_t) (HeavyContextInterface *context, const char *sendName, hv_uint32_t sendHash, const HvMessage *msg);
 typedef void (HvPrintHook_t) (HeavyContextInterface *context, const char *printName, const char *str, const HvMessage *msg);
 
@@ -252,6 +260,18 @@ hv_uint32_t hv_getCurrentSample(HeavyContextInterface *c);
  */
 int hv_getParameterInfo(HeavyContextInterface *c, int index, HvParameterInfo *info);
 
+/**
+ * Returns the time spent in each signal object and message function, if the
+ * context has been compiled with profiling. The total number of counters is
+ * always returned.
+ *
+ * @param index  The counter index.
+ * @param info  A pointer to a HvProfileInfo struct. May be null.
+ *
+ * @return  The total number of counters, zero if the context is not profiled.
+ */
+int hv_getProfile(HeavyContextInterface *c, int index, HvProfileInfo *info);
+
 /** */
 float hv_samplesToMilliseconds(HeavyContextInterface *c, hv_uint32_t numSamples);
 
@@ -48,6 +48,19 @@ static inline void __hv_zero_i(hv_bOuti_t bOut) {
 #endif
 }
 
+// bOut = k, in all lanes
+static inline void __hv_set_f(hv_bOutf_t bOut, float k) {
+#if HV_SIMD_AVX
+  *bOut = _mm256_set1_ps(k);
+#elif HV_SIMD_SSE
+  *bOut = _mm_set1_ps(k);
+#elif HV_SIMD_NEON
+  *bOut = vdupq_n_f32(k);
+#else // HV_SIMD_NONE
+  *bOut = k;
+#endif
+}
+
 static inline void __hv_load_f(float *bIn, hv_bOutf_t bOut) {
 #if HV_SIMD_AVX
   *bOut = _mm256_load_ps(bIn);
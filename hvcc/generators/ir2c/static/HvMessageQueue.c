@@ -16,12 +16,32 @@
 
 #include "HvMessageQueue.h"
 
+static MessageNode *mq_getOrCreateNodeFromPool(HvMessageQueue *q) {
+  if (q->pool == NULL) {
+    // if necessary, create a new empty node
+    q->pool = (MessageNode *) hv_malloc(sizeof(MessageNode));
+    hv_assert(q->pool != NULL);
+    q->pool->next = NULL;
+  }
+  MessageNode *node = q->pool;
+  q->pool = q->pool->next;
+  return node;
+}
+
+#if HV_MESSAGE_QUEUE_HEAP
+
+// the initial number of nodes in the heap, it is doubled when necessary
+#define HV_MESSAGE_QUEUE_HEAP_CAPACITY 64
+
 hv_size_t mq_initWithPoolSize(HvMessageQueue *q, hv_size_t poolSizeKB) {
   hv_assert(poolSizeKB > 0);
-  q->head = NULL;
-  q->tail = NULL;
+  q->size = 0;
+  q->capacity = HV_MESSAGE_QUEUE_HEAP_CAPACITY;
+  q->order = 0;
+  q->heap = (MessageNode **) hv_malloc(q->capacity * sizeof(MessageNode *));
+  hv_assert(q->heap != NULL);
   q->pool = NULL;
-  return mp_init(&q->mp, poolSizeKB);
+  return q->capacity * sizeof(MessageNode *) + mp_init(&q->mp, poolSizeKB);
 }
 
 void mq_free(HvMessageQueue *q) {
@@ -31,19 +51,169 @@ void mq_free(HvMessageQueue *q) {
     q->pool = q->pool->next;
     hv_free(n);
   }
+  hv_free(q->heap);
+  q->heap = NULL;
   mp_free(&q->mp);
 }
 
-static MessageNode *mq_getOrCreateNodeFromPool(HvMessageQueue *q) {
-  if (q->pool == NULL) {
-    // if necessary, create a new empty node
-    q->pool = (MessageNode *) hv_malloc(sizeof(MessageNode));
-    hv_assert(q->pool != NULL);
-    q->pool->next = NULL;
+int mq_size(HvMessageQueue *q) {
+  return (int) q->size;
+}
+
+// true if node a is scheduled before node b
+static inline bool mq_isBefore(const MessageNode *a, const MessageNode *b) {
+  const hv_uint32_t ta = msg_getTimestamp(a->m);
+  const hv_uint32_t tb = msg_getTimestamp(b->m);
+  // messages with the same timestamp are first in first out, also when the order wraps around
+  return (ta < tb) || ((ta == tb) && ((hv_int32_t) (a->order - b->order) < 0));
+}
+
+static void mq_siftUp(HvMessageQueue *q, hv_uint32_t i) {
+  MessageNode *n = q->heap[i];
+  while (i > 0) {
+    const hv_uint32_t parent = (i - 1) >> 1;
+    if (!mq_isBefore(n, q->heap[parent])) break;
+    q->heap[i] = q->heap[parent];
+    i = parent;
   }
-  MessageNode *node = q->pool;
-  q->pool = q->pool->next;
-  return node;
+  q->heap[i] = n;
+}
+
+static void mq_siftDown(HvMessageQueue *q, hv_uint32_t i) {
+  MessageNode *n = q->heap[i];
+  while (true) {
+    hv_uint32_t child = 2*i + 1;
+    if (child >= q->size) break;
+    if ((child + 1 < q->size) && mq_isBefore(q->heap[child+1], q->heap[child])) ++child;
+    if (!mq_isBefore(q->heap[child], n)) break;
+    q->heap[i] = q->heap[child];
+    i = child;
+  }
+  q->heap[i] = n;
+}
+
+// frees the message of the node and puts the node back in the pool
+static void mq_releaseNode(HvMessageQueue *q, MessageNode *n) {
+  mp_freeMessage(&q->mp, n->m);
+  n->m = NULL;
+  n->let = 0;
+  n->sendMessage = NULL;
+  n->next = q->pool;
+  n->prev = NULL;
+  q->pool = n;
+}
+
+// removes the node at index i from the heap
+static void mq_removeNodeAt(HvMessageQueue *q, hv_uint32_t i) {
+  mq_releaseNode(q, q->heap[i]);
+
+  // move the last node into the gap
+  --q->size;
+  if (i < q->size) {
+    q->heap[i] = q->heap[q->size];
+    if ((i > 0) && mq_isBefore(q->heap[i], q->heap[(i - 1) >> 1])) {
+      mq_siftUp(q, i);
+    } else {
+      mq_siftDown(q, i);
+    }
+  }
+}
+
+HvMessage *mq_addMessageByTimestamp(HvMessageQueue *q, const HvMessage *m, int let,
+    void (*sendMessage)(HeavyContextInterface *, int, const HvMessage *)) {
+  if (q->size == q->capacity) {
+    // grow the heap
+    MessageNode **heap = (MessageNode **) hv_malloc(2 * q->capacity * sizeof(MessageNode *));
+    hv_assert(heap != NULL);
+    hv_memcpy(heap, q->heap, q->size * sizeof(MessageNode *));
+    hv_free(q->heap);
+    q->heap = heap;
+    q->capacity *= 2;
+  }
+
+  MessageNode *n = mq_getOrCreateNodeFromPool(q);
+  n->m = mp_addMessage(&q->mp, m);
+  n->let = let;
+  n->sendMessage = sendMessage;
+  n->prev = NULL;
+  n->next = NULL;
+  n->order = q->order++;
+
+  q->heap[q->size] = n;
+  ++q->size;
+  mq_siftUp(q, q->size - 1);
+  return mq_node_getMessage(n);
+}
+
+HvMessage *mq_addMessage(HvMessageQueue *q, const HvMessage *m, int let,
+    void (*sendMessage)(HeavyContextInterface *, int, const HvMessage *)) {
+  return mq_addMessageByTimestamp(q, m, let, sendMessage);
+}
+
+void mq_pop(HvMessageQueue *q) {
+  if (mq_hasMessage(q)) {
+    mq_removeNodeAt(q, 0);
+  }
+}
+
+bool mq_removeMessage(HvMessageQueue *q, HvMessage *m, void (*sendMessage)(HeavyContextInterface *, int, const HvMessage *)) {
+  for (hv_uint32_t i = 0; i < q->size; ++i) {
+    if (q->heap[i]->m == m) {
+      // only remove the message if sendMessage is the same as the stored one,
+      // if the sendMessage argument is NULL, it is not checked and will remove any matching message pointer
+      if (sendMessage == NULL || q->heap[i]->sendMessage == sendMessage) {
+        mq_removeNodeAt(q, i);
+        return true;
+      }
+      return false;
+    }
+  }
+  return false;
+}
+
+void mq_clear(HvMessageQueue *q) {
+  while (mq_hasMessage(q)) {
+    mq_pop(q);
+  }
+}
+
+void mq_clearAfter(HvMessageQueue *q, const hv_uint32_t timestamp) {
+  // keep the nodes before the timestamp
+  hv_uint32_t size = 0;
+  for (hv_uint32_t i = 0; i < q->size; ++i) {
+    MessageNode *n = q->heap[i];
+    if (msg_getTimestamp(n->m) < timestamp) {
+      q->heap[size++] = n;
+    } else {
+      mq_releaseNode(q, n);
+    }
+  }
+  q->size = size;
+
+  // and restore the heap order
+  for (hv_uint32_t i = size / 2; i > 0; --i) {
+    mq_siftDown(q, i - 1);
+  }
+}
+
+#else // linked list
+
+hv_size_t mq_initWithPoolSize(HvMessageQueue *q, hv_size_t poolSizeKB) {
+  hv_assert(poolSizeKB > 0);
+  q->head = NULL;
+  q->tail = NULL;
+  q->pool = NULL;
+  return mp_init(&q->mp, poolSizeKB);
+}
+
+void mq_free(HvMessageQueue *q) {
+  mq_clear(q);
+  while (q->pool != NULL) {
+    MessageNode *n = q->pool;
+    q->pool = q->pool->next;
+    hv_free(n);
+  }
+  mp_free(&q->mp);
 }
 
 int mq_size(HvMessageQueue *q) {
@@ -212,4 +382,7 @@ void mq_clearAfter(HvMessageQueue *q, const hv_uint32_t timestamp) {
   }
 
   if (q->tail == NULL) q->head = NULL;
+  else q->tail->next = NULL;
 }
+
+#endif // HV_MESSAGE_QUEUE_HEAP
@@ -20,6 +20,13 @@
 #include "HvMessage.h"
 #include "HvMessagePool.h"
 
+// Scheduled messages are kept in a sorted doubly linked list by default, in which
+// inserting a message out of order is O(n). Compile with -DHV_MESSAGE_QUEUE_HEAP=1
+// to keep them in a binary heap instead, where every insert and pop is O(log n).
+#ifndef HV_MESSAGE_QUEUE_HEAP
+#define HV_MESSAGE_QUEUE_HEAP 0
+#endif
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -36,8 +43,22 @@ typedef struct MessageNode {
   HvMessage *m;
   void (*sendMessage)(HeavyContextInterface *, int, const HvMessage *);
   int let;
+#if HV_MESSAGE_QUEUE_HEAP
+  hv_uint32_t order; // orders messages with the same timestamp by insertion
+#endif
 } MessageNode;
 
+#if HV_MESSAGE_QUEUE_HEAP
+/** A binary min-heap containing scheduled messages, by timestamp and insertion order. */
+typedef struct HvMessageQueue {
+  MessageNode **heap; // the nodes of the heap, the first one is the next message
+  hv_uint32_t size; // the number of messages in the heap
+  hv_uint32_t capacity; // the number of allocated nodes in the heap
+  hv_uint32_t order; // the order of the next message that is added
+  MessageNode *pool; // the head of the reserve pool
+  HvMessagePool mp;
+} HvMessageQueue;
+#else
 /** A doubly linked list containing scheduled messages. */
 typedef struct HvMessageQueue {
   MessageNode *head; // the head of the queue
@@ -45,6 +66,7 @@ typedef struct HvMessageQueue {
   MessageNode *pool; // the head of the reserve pool
   HvMessagePool mp;
 } HvMessageQueue;
+#endif
 
 hv_size_t mq_initWithPoolSize(HvMessageQueue *q, hv_size_t poolSizeKB);
 
@@ -60,20 +82,27 @@ static inline int mq_node_getLet(MessageNode *n) {
   return n->let;
 }
 
+static inline MessageNode *mq_peek(HvMessageQueue *q) {
+#if HV_MESSAGE_QUEUE_HEAP
+  return (q->size > 0) ? q->heap[0] : NULL;
+#else
+  return q->head;
+#endif
+}
+
 static inline bool mq_hasMessage(HvMessageQueue *q) {
-  return (q->head != NULL);
+  return (mq_peek(q) != NULL);
 }
 
 // true if there is a message and it occurs before (<) timestamp
 static inline bool mq_hasMessageBefore(HvMessageQueue *const q, const hv_uint32_t timestamp) {
-  return mq_hasMessage(q) && (msg_getTimestamp(mq_node_getMessage(q->head)) < timestamp);
-}
-
-static inline MessageNode *mq_peek(HvMessageQueue *q) {
-  return q->head;
+  return mq_hasMessage(q) && (msg_getTimestamp(mq_node_getMessage(mq_peek(q))) < timestamp);
 }
 
-/** Appends the message to the end of the queue. */
+/**
+ * Appends the message to the end of the queue.
+ * In the heap, the message is inserted by its timestamp like mq_addMessageByTimestamp.
+ */
 HvMessage *mq_addMessage(HvMessageQueue *q, const HvMessage *m, int let,
     void (*sendMessage)(HeavyContextInterface *, int, const HvMessage *));
 
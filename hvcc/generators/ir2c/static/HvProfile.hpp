@@ -0,0 +1,67 @@
+/**
+ * Heavy Compiler Collection
+ * Copyright (C) 2025 Wasted Audio
+ *
+ * SPDX-License-Identifier: GPL-3.0-only
+ */
+
+#ifndef _HEAVY_PROFILE_H_
+#define _HEAVY_PROFILE_H_
+
+#include "HeavyContextInterface.hpp"
+
+#if defined(__x86_64__) || defined(__i386__) || defined(_M_X64) || defined(_M_IX86)
+  #define HV_PROFILE_CYCLES 1
+  #if HV_WIN
+    #include <intrin.h>
+  #else
+    #include <x86intrin.h>
+  #endif
+#else
+  #define HV_PROFILE_CYCLES 0
+  #include <chrono>
+#endif
+
+/**
+ * Returns the time stamp counter in cycles, or on platforms without one,
+ * a monotonic clock in nanoseconds.
+ */
+static inline hv_uint64_t hv_profile_ticks() {
+#if HV_PROFILE_CYCLES
+  return (hv_uint64_t) __rdtsc();
+#else
+  return (hv_uint64_t) std::chrono::duration_cast<std::chrono::nanoseconds>(
+      std::chrono::steady_clock::now().time_since_epoch()).count();
+#endif
+}
+
+/**
+ * Adds the time between its construction and destruction to a profile counter.
+ * Scopes nest, e.g. when an object sends a message to another object. The time
+ * of a nested scope is only added to its own counter, not to that of its parent.
+ */
+class HvProfileScope {
+
+ public:
+  HvProfileScope(HvProfileScope **top, HvProfileInfo *info) :
+      top(top), parent(*top), info(info), nested(0), start(hv_profile_ticks()) {
+    *top = this;
+  }
+
+  ~HvProfileScope() {
+    const hv_uint64_t ticks = hv_profile_ticks() - start;
+    info->ticks += ticks - nested;
+    info->count++;
+    if (parent != nullptr) parent->nested += ticks;
+    *top = parent;
+  }
+
+ private:
+  HvProfileScope **top;   // the innermost scope of the context
+  HvProfileScope *parent; // the enclosing scope, or null
+  HvProfileInfo *info;    // the counter of this scope
+  hv_uint64_t nested;     // the time of the nested scopes
+  hv_uint64_t start;      // the time at which the scope was entered
+};
+
+#endif // _HEAVY_PROFILE_H_
@@ -0,0 +1,25 @@
+/**
+ * Heavy Compiler Collection
+ * Copyright (C) 2025 Wasted Audio
+ *
+ * SPDX-License-Identifier: GPL-3.0-only
+ */
+
+#include "HvSignalDelreadLin.h"
+
+static void sDelreadLin_setSize(SignalDelreadLin *o, float size) {
+  __hv_set_f(&o->size, size);
+  __hv_set_f(&o->maxDelay, size - 1.0f);
+}
+
+hv_size_t sDelreadLin_init(SignalDelreadLin *o, HvTable *table, double sampleRate) {
+  // the same conversion as [samplerate~] into [/ 1000]
+  __hv_set_f(&o->msToSamples, ((float) sampleRate) / 1000.0f);
+  __hv_var_k_f_r(&o->offsets, -1.0f, -2.0f, -3.0f, -4.0f, -5.0f, -6.0f, -7.0f, -8.0f);
+  sDelreadLin_setSize(o, 0.0f); // set on load, once the delwrite~ has resized the table
+  return sTabread_init(&o->tabread, table, false);
+}
+
+void sDelreadLin_onMessage(HeavyContextInterface *_c, SignalDelreadLin *o, const HvMessage *m) {
+  sDelreadLin_setSize(o, (float) hTable_getSize(o->tabread.table));
+}
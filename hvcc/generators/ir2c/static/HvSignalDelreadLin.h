@@ -0,0 +1,76 @@
+/**
+ * Heavy Compiler Collection
+ * Copyright (C) 2025 Wasted Audio
+ *
+ * SPDX-License-Identifier: GPL-3.0-only
+ */
+
+#ifndef _HEAVY_SIGNAL_DELREAD_LIN_H_
+#define _HEAVY_SIGNAL_DELREAD_LIN_H_
+
+#include "HvHeavyInternal.h"
+#include "HvSignalTabread.h"
+#include "HvSignalVar.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * A variable delay line read, behind the write head of the table of a delwrite~.
+ * The delay is given in milliseconds and is clamped to [0, size-1] samples. The delayed
+ * value is interpolated linearly between the two neighbouring samples. This is the
+ * interpolation of the former vd~.pd abstraction, not the 4-point one of Pd's vd~.
+ */
+
+typedef struct SignalDelreadLin {
+  SignalTabread tabread;    // the table of the delay line
+  hv_bufferf_t msToSamples; // the number of samples per millisecond
+  hv_bufferf_t maxDelay;    // the longest delay in samples, size-1
+  hv_bufferf_t size;        // the length of the delay line in samples, read on load
+  hv_bufferf_t offsets;     // -1, -2, ... the offsets of the lanes behind the write head
+} SignalDelreadLin;
+
+hv_size_t sDelreadLin_init(SignalDelreadLin *o, HvTable *table, double sampleRate);
+
+// reads the size of the delay line, on load
+void sDelreadLin_onMessage(HeavyContextInterface *_c, SignalDelreadLin *o, const HvMessage *m);
+
+static inline void __hv_delread_lin_f(SignalDelreadLin *o, hv_bInf_t bIn, hv_bOutf_t bOut) {
+  hv_bufferf_t k, d, x, f, w, a, b;
+  hv_bufferi_t i, j;
+
+  // the delay in samples, in [0, size-1]
+  __hv_mul_f(bIn, VIf(o->msToSamples), VOf(d));
+  __hv_min_f(VIf(d), VIf(o->maxDelay), VOf(d));
+  __hv_zero_f(VOf(k));
+  __hv_max_f(VIf(d), VIf(k), VOf(d));
+
+  // the read position of every sample, behind the write head
+  __hv_set_f(VOf(x), (float) hTable_getHead(o->tabread.table));
+  __hv_add_f(VIf(x), VIf(o->offsets), VOf(x));
+  __hv_sub_f(VIf(x), VIf(d), VOf(x));
+  __hv_floor_f(VIf(x), VOf(f));
+
+  // wrap the index around the start of the table
+  __hv_zero_f(VOf(k));
+  __hv_lt_f(VIf(f), VIf(k), VOf(w));
+  __hv_and_f(VIf(o->size), VIf(w), VOf(w));
+  __hv_add_f(VIf(f), VIf(w), VOf(w));
+  __hv_cast_fi(VIf(w), VOi(i));
+  __hv_var_k_i(VOi(j), 1, 1, 1, 1, 1, 1, 1, 1);
+  __hv_add_i(VIi(i), VIi(j), VOi(j));
+
+  // linear interpolation between the index and the next sample
+  __hv_tabread_if(&o->tabread, VIi(j), VOf(b));
+  __hv_tabread_if(&o->tabread, VIi(i), VOf(a));
+  __hv_sub_f(VIf(b), VIf(a), VOf(b));
+  __hv_sub_f(VIf(x), VIf(f), VOf(x));
+  __hv_fma_f(VIf(b), VIf(x), VIf(a), bOut);
+}
+
+#ifdef __cplusplus
+} // extern "C"
+#endif
+
+#endif // _HEAVY_SIGNAL_DELREAD_LIN_H_
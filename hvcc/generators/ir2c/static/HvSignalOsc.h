@@ -0,0 +1,59 @@
+/**
+ * Heavy Compiler Collection
+ * Copyright (C) 2025 Wasted Audio
+ *
+ * SPDX-License-Identifier: GPL-3.0-only
+ */
+
+#ifndef _HEAVY_SIGNAL_OSC_H_
+#define _HEAVY_SIGNAL_OSC_H_
+
+#include "HvHeavyInternal.h"
+#include "HvSignalPhasor.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * A cosine oscillator: a phasor of which the phase is turned into a cosine, in registers.
+ * The state, initialisation and messages are those of the phasor. The cosine is the
+ * Taylor approximation of the former osc~.pd abstraction, term by term.
+ */
+
+// bOut = cos(2*pi*bIn), for a phase in [0,1)
+static inline void __hv_osc_cos_f(hv_bInf_t bIn, hv_bOutf_t bOut) {
+  hv_bufferf_t k, x, x2, x3, x5;
+  __hv_set_f(VOf(k), 0.5f);
+  __hv_sub_f(bIn, VIf(k), VOf(x));
+  __hv_abs_f(VIf(x), VOf(x));
+  __hv_set_f(VOf(k), 0.25f);
+  __hv_sub_f(VIf(x), VIf(k), VOf(x)); // [-0.25, +0.25]
+  __hv_set_f(VOf(k), 6.283185307179586f);
+  __hv_mul_f(VIf(x), VIf(k), VOf(x));
+  __hv_mul_f(VIf(x), VIf(x), VOf(x2));
+  __hv_mul_f(VIf(x), VIf(x2), VOf(x3));
+  __hv_mul_f(VIf(x3), VIf(x2), VOf(x5));
+  __hv_set_f(VOf(k), -0.166666666666667f);
+  __hv_fma_f(VIf(x3), VIf(k), VIf(x), VOf(x));
+  __hv_set_f(VOf(k), 0.007833333333333f); // -5% to adjust for the taylor expansion
+  __hv_fma_f(VIf(x5), VIf(k), VIf(x), bOut);
+}
+
+static inline void __hv_osc_f(SignalPhasor *o, hv_bInf_t bIn, hv_bOutf_t bOut) {
+  hv_bufferf_t p;
+  __hv_phasor_f(o, bIn, VOf(p));
+  __hv_osc_cos_f(VIf(p), bOut);
+}
+
+static inline void __hv_osc_k_f(SignalPhasor *o, hv_bOutf_t bOut) {
+  hv_bufferf_t p;
+  __hv_phasor_k_f(o, VOf(p));
+  __hv_osc_cos_f(VIf(p), bOut);
+}
+
+#ifdef __cplusplus
+} // extern "C"
+#endif
+
+#endif // _HEAVY_SIGNAL_OSC_H_
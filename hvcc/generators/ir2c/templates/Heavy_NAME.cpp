@@ -60,6 +60,12 @@ extern "C" {
 
 Heavy_{{name}}::Heavy_{{name}}(double sampleRate, int poolKb, int inQueueKb, int outQueueKb)
     : HeavyContext(sampleRate, poolKb, inQueueKb, outQueueKb) {
+  {%- if profile_list|length > 0 %}
+  {%- for p in profile_list %}
+  profile[{{loop.index0}}] = {"{{p.id}}", "{{p.type}}", "{{p.function}}", 0, 0};
+  {%- endfor %}
+  profileScope = nullptr;
+  {% endif %}
   {%- for x in init_list %}
   numBytes += {{x}}
   {%- endfor %}
@@ -140,6 +146,13 @@ int Heavy_{{name}}::getParameterInfo(int index, HvParameterInfo *info) {
   }
   return {{send_receive|extern|length}};
 }
+{%- if profile_list|length > 0 %}
+
+int Heavy_{{name}}::getProfile(int index, HvProfileInfo *info) {
+  if (info != nullptr && index >= 0 && index < {{profile_list|length}}) *info = profile[index];
+  return {{profile_list|length}};
+}
+{%- endif %}
 
 
 
@@ -209,6 +222,7 @@ int Heavy_{{name}}::process(float **inputBuffers, float **outputBuffers, int n)
   hv_bufferf_t ZERO; __hv_zero_f(VOf(ZERO));
 
   hv_uint32_t nextBlock = blockStartTimestamp;
+  {%- block process_loop %}
   for (int n = 0; n < n4; n += HV_N_SIMD) {
 
     // process all of the messages for this block
@@ -218,6 +232,7 @@ int Heavy_{{name}}::process(float **inputBuffers, float **outputBuffers, int n)
       node->sendMessage(this, node->let, node->m);
       mq_pop(&mq);
     }
+    {%- block process_frame %}
 
     {% if signal.numInputBuffers > 0 -%}
     // load input buffers
@@ -246,7 +261,9 @@ int Heavy_{{name}}::process(float **inputBuffers, float **outputBuffers, int n)
     {%- else %}
     // no output channels
     {%- endif %}
+    {%- endblock %}
   }
+  {%- endblock %}
 
   blockStartTimestamp = nextBlock;
 
@@ -24,6 +24,9 @@ class Heavy_{{name}} : public HeavyContext {
   int processInlineInterleaved(float *inputBuffers, float *outputBuffer, int n) override;
 
   int getParameterInfo(int index, HvParameterInfo *info) override;
+  {%- if profile_list|length > 0 %}
+  int getProfile(int index, HvProfileInfo *info) override;
+  {%- endif %}
 
   {%- if externs.parameters.inParam|length > 0 or externs.parameters.outParam|length > 0 %}
   struct Parameter {
@@ -111,6 +114,12 @@ class Heavy_{{name}} : public HeavyContext {
   {%- for d in def_list %}
   {{d}}
   {%- endfor %}
+  {%- if profile_list|length > 0 %}
+
+  // profile counters
+  HvProfileInfo profile[{{profile_list|length}}];
+  HvProfileScope *profileScope;
+  {%- endif %}
 };
 
 #endif // _HEAVY_CONTEXT_{{name|upper}}_HPP_
@@ -0,0 +1,37 @@
+{#-
+  Heavy_NAME.cpp, of which process() checks the message queue only when a message is due.
+  The block is split at the timestamps of the messages, and the frames between them are
+  processed in one run. Messages are sent before the same frame as in Heavy_NAME.cpp.
+-#}
+{%- extends "Heavy_NAME.cpp" %}
+
+{%- block process_loop %}
+  for (int n = 0; n < n4;) {
+
+    // process all of the messages for the next frame
+    while (mq_hasMessageBefore(&mq, nextBlock + HV_N_SIMD)) {
+      MessageNode *const node = mq_peek(&mq);
+      node->sendMessage(this, node->let, node->m);
+      mq_pop(&mq);
+    }
+
+    // the frames before the frame of the next message
+    int end = n4;
+    if (mq_hasMessage(&mq)) {
+      const hv_uint32_t numSamples = msg_getTimestamp(mq_node_getMessage(mq_peek(&mq))) - nextBlock;
+      if (numSamples < (hv_uint32_t) (n4 - n)) end = n + (int) (numSamples & ~HV_N_SIMD_MASK);
+    }
+
+    while (n < end) {
+      {{- self.process_frame() | indent(2) }}
+
+      n += HV_N_SIMD;
+      nextBlock += HV_N_SIMD;
+      {%- if process_sends_messages %}
+
+      // signal objects may have scheduled messages for the next frame
+      if (mq_hasMessageBefore(&mq, nextBlock + HV_N_SIMD)) break;
+      {%- endif %}
+    }
+  }
+{%- endblock %}
@@ -0,0 +1,25 @@
+{{copyright}}
+
+#ifndef _HEAVY_SYMBOLS_{{name|upper}}_H_
+#define _HEAVY_SYMBOLS_{{name|upper}}_H_
+
+#include "HvUtils.h"
+
+// all symbols of the patch and their hashes, as returned by hv_string_to_hash(), ordered by hash
+typedef struct {
+  const char *symbol;
+  hv_uint32_t hash;
+} HvSymbol_{{name}};
+
+#define HV_{{name|upper}}_NUM_SYMBOLS {{symbols|length}}
+
+{% if symbols|length > 0 -%}
+static const HvSymbol_{{name}} hv_{{name}}_symbols[HV_{{name|upper}}_NUM_SYMBOLS] = {
+  {%- for s in symbols %}
+  { {{s.symbol}}, {{s.hash}} }, // {{s.uses}}
+  {%- endfor %}
+};
+{%- endif %}
+
+#endif // _HEAVY_SYMBOLS_{{name|upper}}_H_
+{# force a new line #}
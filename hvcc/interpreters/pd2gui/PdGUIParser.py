@@ -5,8 +5,10 @@
 
 import os
 
-from typing import Generator, Optional, Union
+from typing import Iterator, Optional, Union
 
+from hvcc.core.directory_index import DirectoryIndex
+from hvcc.interpreters.pd2hv.PdFile import PdFiles
 from hvcc.interpreters.pd2hv.PdParser import PdParser
 from hvcc.types.GUI import (
     Size, Coords, Font, LabelShow, LabelPos, Label, Color, Canvas,
@@ -16,7 +18,11 @@ from hvcc.types.GUI import (
 
 
 class PdGUIParser(PdParser):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pd_files: Optional[PdFiles] = None,
+        directory_index: Optional[DirectoryIndex] = None
+    ) -> None:
         # the current global value of $0
         # Note(joe): set a high starting value to avoid potential user naming conflicts
         self.__DOLLAR_ZERO = 1000
@@ -24,6 +30,12 @@ class PdGUIParser(PdParser):
         # search paths at this graph level
         self.search_paths: list[str] = []
 
+        # the files in the searched directories, listed once per compile
+        self.directory_index = directory_index or DirectoryIndex()
+
+        # the tokenized .pd files of this compile
+        self.pd_files = pd_files or PdFiles()
+
     def gui_from_file(
         self,
         file_path: str,
@@ -33,8 +45,8 @@ class PdGUIParser(PdParser):
         if is_root:
             self.search_paths.append(os.path.dirname(file_path))
 
-        file_iterator = self.get_pd_line(file_path)
-        canvas_line: str = file_iterator.__next__()
+        file_iterator = iter(self.pd_files.load(file_path).lines)
+        canvas_line: str = file_iterator.__next__()[0]
 
         self.__DOLLAR_ZERO += 1  # increment $0
         graph_args = [self.__DOLLAR_ZERO] + (obj_args or [])
@@ -54,7 +66,7 @@ class PdGUIParser(PdParser):
 
     def gui_from_canvas(
         self,
-        file_iterator: Generator,
+        file_iterator: Iterator[tuple[str, list[str]]],
         canvas_line: str,
         graph_args: list,
         pd_path: str,
@@ -73,8 +85,7 @@ class PdGUIParser(PdParser):
         obj_args = []
 
         try:
-            for li in file_iterator:
-                line = self.split_line(li)
+            for li, line in file_iterator:
 
                 if line[0] == "#N":
                     if line[1] == "canvas":
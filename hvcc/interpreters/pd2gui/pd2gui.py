@@ -9,7 +9,9 @@ import time
 
 from typing import Optional
 
+from hvcc.core.directory_index import DirectoryIndex
 from hvcc.interpreters.pd2hv.NotificationEnum import NotificationEnum
+from hvcc.interpreters.pd2hv.PdFile import PdFiles
 from hvcc.interpreters.pd2gui.PdGUIParser import PdGUIParser
 from hvcc.types.compiler import CompilerResp, CompilerNotif, CompilerMsg
 
@@ -35,11 +37,13 @@ class pd2gui:
         pd_path: str,
         ir_dir: str,
         search_paths: Optional[list] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        pd_files: Optional[PdFiles] = None,
+        directory_index: Optional[DirectoryIndex] = None
     ):
         tick = time.time()
 
-        parser = PdGUIParser()
+        parser = PdGUIParser(pd_files, directory_index)
         if search_paths is not None:
             for p in search_paths:
                 parser.add_absolute_search_directory(p)
@@ -0,0 +1,162 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .PdGraph import PdGraph
+from .PdObject import PdObject
+
+from hvcc.types.compiler import CompilerMsg, CompilerNotif
+from hvcc.version import VERSION
+
+if TYPE_CHECKING:
+    from .PdParser import PdParser
+
+
+class CachedGraph(PdObject):
+    """ An abstraction instance that has been restored from the AbstractionCache.
+        It stands in for the fully parsed and validated PdGraph.
+    """
+
+    def __init__(self, entry: Dict, pos_x: int = 0, pos_y: int = 0) -> None:
+        super().__init__("graph", entry["obj_args"], pos_x, pos_y)
+        self.__entry = entry
+
+    def get_inlet_connection_type(self, inlet_index: int) -> Optional[str]:
+        return self.__entry["inlets"][inlet_index]
+
+    def get_outlet_connection_type(self, outlet_index: int) -> Optional[str]:
+        return self.__entry["outlets"][outlet_index]
+
+    def get_notices(self) -> CompilerNotif:
+        return CompilerNotif(warnings=[CompilerMsg(**w) for w in self.__entry["warnings"]])
+
+    def to_hv(self) -> Dict:
+        properties = dict(self.__entry["hv"].get("properties", {}), x=self.pos_x, y=self.pos_y)
+        return dict(self.__entry["hv"], properties=properties)
+
+    def __repr__(self) -> str:
+        return self.__entry["name"]
+
+
+class AbstractionCache:
+    """ Stores the parsed and validated Heavy graph of every abstraction instance,
+        such that only abstractions that changed (and the abstractions using them)
+        are parsed again on the next compile.
+
+        An entry is keyed on the contents of the abstraction and all abstractions it
+        uses, its resolved arguments, its $0 and its place in the graph hierarchy.
+        The $0 values only stay the same as long as the number of abstraction instances
+        before it does not change.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+        self.num_reused = 0
+        self.num_parsed = 0
+
+        # graphs parsed during this compile, stored once the root graph is validated
+        self.__pending: List[Tuple[str, PdGraph, int, Counter]] = []
+
+        # memoised hashes of abstraction files and everything they use
+        self.__tree_hashes: Dict[Tuple, Optional[str]] = {}
+
+    def tree_hash(self, pd_path: str, parser: "PdParser", call_stack: Tuple[str, ...] = ()) -> Optional[str]:
+        """ Returns a hash of the abstraction file and all abstractions it resolves.
+            Returns None if these cannot be determined statically, i.e. when object
+            names contain $ arguments or abstractions are used recursively.
+        """
+        memo_key = (pd_path, tuple(parser.search_paths))
+        if memo_key in self.__tree_hashes:
+            return self.__tree_hashes[memo_key]
+
+        pd_file = parser.pd_files.load(pd_path)
+        h = hashlib.sha256()
+        h.update(pd_file.sha256.encode("utf-8"))
+
+        tree_hash: Optional[str] = None
+        for _, line in pd_file.lines:
+            if len(line) < 5 or line[0] != "#X" or line[1] != "obj":
+                continue
+            if "$" in line[4]:
+                break
+            abs_path = parser.find_abstraction_path(os.path.dirname(pd_path), line[4])
+            if abs_path is not None:
+                if abs_path == pd_path or abs_path in call_stack:
+                    break
+                child_hash = self.tree_hash(abs_path, parser, call_stack + (pd_path,))
+                if child_hash is None:
+                    break
+                h.update(f"{abs_path}:{child_hash}".encode("utf-8"))
+        else:
+            tree_hash = h.hexdigest()
+
+        self.__tree_hashes[memo_key] = tree_hash
+        return tree_hash
+
+    def key(self, pd_path: str, obj_args: List, dollar_zero: int, parent: PdGraph, parser: "PdParser") -> Optional[str]:
+        """ Returns the cache key of an abstraction instance, or None if it can not be cached.
+        """
+        try:
+            tree_hash = self.tree_hash(pd_path, parser)
+        except OSError:
+            return None
+        if tree_hash is None:
+            return None
+
+        h = hashlib.sha256()
+        h.update(f"hvcc {VERSION}\n{pd_path}\n{tree_hash}\n".encode("utf-8"))
+        h.update(f"{obj_args}\n{dollar_zero}\n{parser.search_paths}\n".encode("utf-8"))
+        h.update("/".join(parent.get_graph_heirarchy()).encode("utf-8"))
+        return h.hexdigest()
+
+    def load(self, key: str) -> Optional[Dict]:
+        entry_path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+            os.utime(entry_path)  # mark the entry as recently used
+        except (OSError, ValueError):
+            return None
+
+        self.num_reused += 1
+        return entry
+
+    def add(self, key: str, graph: PdGraph, num_dollar_zero: int, obj_counter: Counter) -> None:
+        """ Registers a freshly parsed abstraction instance. It is only stored once the
+            whole patch has been validated, as validation may still modify the graph.
+        """
+        self.num_parsed += 1
+        self.__pending.append((key, graph, num_dollar_zero, obj_counter))
+
+    def store(self) -> None:
+        """ Stores all abstraction instances parsed during this compile that have no errors.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for key, graph, num_dollar_zero, obj_counter in self.__pending:
+            notices = graph.get_notices()
+            if notices.has_error or len(notices.errors) > 0:
+                continue
+            entry = {
+                "name": str(graph),
+                "obj_args": graph.obj_args,
+                "hv": graph.to_hv(),
+                "inlets": [graph.get_inlet_connection_type(i) for i in range(graph.num_inlets)],
+                "outlets": [graph.get_outlet_connection_type(i) for i in range(graph.num_outlets)],
+                "warnings": [w.model_dump(mode="json") for w in notices.warnings],
+                "num_dollar_zero": num_dollar_zero,
+                "obj_counter": dict(obj_counter)
+            }
+            # write to a temporary file first, such that concurrent compiles never read partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+        self.__pending = []
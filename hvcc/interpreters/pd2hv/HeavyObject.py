@@ -15,28 +15,21 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import decimal
-import json
-from importlib import resources
-from pathlib import Path
 from typing import Optional, List, Dict, Any, Union, cast
 
 from .Connection import Connection
 from .NotificationEnum import NotificationEnum
 from .PdObject import PdObject
 
-from hvcc.types.IR import HeavyIRType, IRNode, IRArg
-from hvcc.types.Lang import HeavyLangType, LangNode, LangArg
+from hvcc.core.registry import HEAVY_IR, HEAVY_LANG
+from hvcc.types.IR import IRNode, IRArg
+from hvcc.types.Lang import LangNode, LangArg
 
 
 class HeavyObject(PdObject):
 
-    heavy_lang_json = str(resources.files('hvcc') / 'core/json/heavy.lang.json')
-    with open(Path(heavy_lang_json), "r") as f:
-        __HEAVY_LANG_OBJS = HeavyLangType(**json.load(f)).root
-
-    heavy_ir_json = str(resources.files('hvcc') / 'core/json/heavy.ir.json')
-    with open(Path(heavy_ir_json), "r") as f:
-        __HEAVY_IR_OBJS = HeavyIRType(**json.load(f)).root
+    __HEAVY_LANG_OBJS = HEAVY_LANG
+    __HEAVY_IR_OBJS = HEAVY_IR
 
     def __init__(
         self,
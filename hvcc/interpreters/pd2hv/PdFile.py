@@ -0,0 +1,136 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import hashlib
+import io
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class PdFile:
+    """ A tokenized .pd file. Within a compile, every file is read, hashed and split into
+        lines once by PdFiles, and shared by the parsers of pd2hv and pd2gui and the compile
+        caches. Across compiles, load() reuses the tokenization of a file while its contents
+        are unchanged.
+
+        The values of "#A" (table data) lines are not split into arguments, they are parsed
+        by array_values() directly into the table that they belong to.
+    """
+
+    # detect width parameter e.g. "#X obj 172 79 t b b, f 22;"
+    RE_WIDTH = re.compile(r", f \d+$")
+
+    # split arguments on non-escaped spaces e.g. "test\ ing"
+    RE_SPACE = re.compile(r'(?<!\\)\ ')
+
+    # the end of a line, a non-escaped ";" at the end of a line in the file
+    RE_END = re.compile(r'(?<!\\);\n')
+
+    # the maximum number of cached files
+    MAX_CACHED = 1024
+
+    # the tokenized files, by the hash of their contents
+    __CACHE: 'OrderedDict[str, PdFile]' = OrderedDict()
+
+    def __init__(self, data: bytes, sha256: Optional[str] = None) -> None:
+        # a hash of the file contents
+        self.sha256 = sha256 or hashlib.sha256(data).hexdigest()
+
+        # every line, without its terminating ";", and its arguments
+        self.lines: List[Tuple[str, List[str]]] = []
+
+        # the "@hv_arg" lines of every "#N canvas" line
+        self.hv_args: Dict[str, List[str]] = OrderedDict()
+
+        stack: List[List[str]] = []
+        for li in self.join_lines(data):
+            line = li.split(" ", 2)[:2] if li.startswith("#A ") else self.split_line(li)
+            self.lines.append((li, line))
+
+            if li.startswith("#N canvas"):
+                stack.append([])
+                self.hv_args[li] = stack[-1]
+            elif "@hv_arg" in li and len(stack) > 0:
+                stack[-1].append(li)
+            elif li.startswith("#X restore") and len(stack) > 1:
+                stack.pop()
+
+    @classmethod
+    def load(cls, pd_path: str) -> 'PdFile':
+        """ Returns the tokenized file, from the cache if its contents have not changed.
+            The file is read and hashed on every call, see PdFiles.
+        """
+        with open(pd_path, "rb") as f:
+            data = f.read()
+        sha256 = hashlib.sha256(data).hexdigest()
+        pd_file = cls.__CACHE.get(sha256)
+        if pd_file is not None:
+            cls.__CACHE.move_to_end(sha256)
+            return pd_file
+
+        pd_file = PdFile(data, sha256)
+        cls.__CACHE[sha256] = pd_file
+        if len(cls.__CACHE) > cls.MAX_CACHED:
+            cls.__CACHE.popitem(last=False)
+        return pd_file
+
+    @classmethod
+    def join_lines(cls, data: bytes) -> List[str]:
+        """ Returns the lines of the file, with lines that are split over multiple lines joined.
+        """
+        # decode and translate newlines (e.g. windows CRLF) in the same way as reading a file in text mode
+        text = io.TextIOWrapper(io.BytesIO(data)).read()
+        if not text.endswith("\n"):
+            text += "\n"
+
+        # the last line is not terminated by ";" and is ignored
+        *lines, _ = cls.RE_END.split(text)
+
+        # concatenate split lines, skipping any empty lines in front of them
+        return [li.lstrip("\n").replace("\n", " ") for li in lines]
+
+    @classmethod
+    def split_line(cls, li: str) -> List[str]:
+        # remove width parameter
+        if ", f " in li:
+            li = cls.RE_WIDTH.sub("", li)
+
+        # without escaped spaces, split on all spaces
+        if "\\ " not in li:
+            return li.split(" ")
+
+        # split on non-escaped spaces
+        line = cls.RE_SPACE.split(li)
+        # replace escaped spaces
+        line = [i.replace('\\ ', ' ') for i in line]
+
+        return line
+
+    @classmethod
+    def array_values(cls, li: str) -> Iterator[float]:
+        """ Returns the values of an "#A" line.
+        """
+        values = li.split(" ", 2)
+        return map(float, values[2].split(" ")) if len(values) > 2 else iter(())
+
+
+class PdFiles:
+    """ The tokenized .pd files of one compile, by their path. A file is loaded on
+        first use and the same PdFile is returned for the rest of the compile, so the
+        files are assumed not to change while they are compiled.
+    """
+
+    def __init__(self) -> None:
+        self.__files: Dict[str, PdFile] = {}
+
+    def load(self, pd_path: str) -> PdFile:
+        pd_path = os.path.abspath(pd_path)
+        pd_file = self.__files.get(pd_path)
+        if pd_file is None:
+            pd_file = PdFile.load(pd_path)
+            self.__files[pd_path] = pd_file
+        return pd_file
@@ -57,7 +57,7 @@ class PdGraph(PdObject):
 
         # TODO(dromer) these are virtual attributes that are only instantiated with internal representation
         self._PdGraph__connections: List[Connection] = []
-        self._PdGraph__pd_path: str = ""
+        self._PdGraph__pd_path: str
 
     @property
     def dollar_zero(self) -> str:
@@ -149,6 +149,14 @@ class PdGraph(PdObject):
     def get_objects(self) -> List[PdObject]:
         return self.__objs
 
+    @property
+    def num_inlets(self) -> int:
+        return len(self.__inlet_objects)
+
+    @property
+    def num_outlets(self) -> int:
+        return len(self.__outlet_objects)
+
     def get_inlet_connection_type(self, inlet_index: int) -> str:
         return self.__inlet_objects[inlet_index].get_inlet_connection_type(inlet_index)
 
@@ -233,7 +241,9 @@ class PdGraph(PdObject):
             "connections": [c.to_hv() for c in self.__connections],
             "properties": {
                 "x": self.pos_x,
-                "y": self.pos_y
+                "y": self.pos_y,
+                # the Pd file or subpatch, reported by profiling builds
+                "origin": f"[pd {self.subpatch_name}]" if self.subpatch_name else os.path.basename(self.__pd_path)
             }
         }
 
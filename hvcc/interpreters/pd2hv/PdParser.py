@@ -18,16 +18,17 @@ import decimal
 import os
 import re
 from collections import Counter
-from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Type, Any, Generator
+from typing import Optional, Type, Any, Generator, Iterator
 
+from .AbstractionCache import AbstractionCache, CachedGraph
 from .HeavyObject import HeavyObject
 from .HeavyGraph import HeavyGraph              # pre-converted Heavy graphs
 from .HvSwitchcase import HvSwitchcase          # __switchcase
 from .PdAudioIoObject import PdAudioIoObject    # adc~/dac~
 from .PdBinopObject import PdBinopObject        # binary arithmatic operators
 from .PdExprObject import PdExprObject          # expr/expr~
+from .PdFile import PdFile, PdFiles             # tokenized .pd files
 from .PdGraph import PdGraph                    # canvas
 from .PdLetObject import PdLetObject            # inlet/inlet~/outlet/outlet~
 from .PdMessageObject import PdMessageObject    # msg
@@ -40,9 +41,12 @@ from .PdTriggerObject import PdTriggerObject    # trigger/t
 from .PdTableObject import PdTableObject        # table
 from .PdUnpackObject import PdUnpackObject      # unpack
 from .PdLibSignalGraph import PdLibSignalGraph  # pd/lib abstraction connection checks
+from .PdObject import PdObject
 
 from .NotificationEnum import NotificationEnum
 
+from hvcc.core.directory_index import DirectoryIndex
+
 
 class PdParser:
 
@@ -58,12 +62,17 @@ class PdParser:
     RE_DOLLAR = re.compile(r"\$(\d+)")
 
     # detect width parameter e.g. "#X obj 172 79 t b b, f 22;"
-    RE_WIDTH = re.compile(r", f \d+$")
+    RE_WIDTH = PdFile.RE_WIDTH
 
     # split arguments on non-escaped spaces e.g. "test\ ing"
-    RE_SPACE = re.compile(r'(?<!\\)\ ')
+    RE_SPACE = PdFile.RE_SPACE
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        abstraction_cache: Optional[AbstractionCache] = None,
+        pd_files: Optional[PdFiles] = None,
+        directory_index: Optional[DirectoryIndex] = None
+    ) -> None:
         # the current global value of $0
         # Note(joe): set a high starting value to avoid potential user naming conflicts
         self.__DOLLAR_ZERO = 1000
@@ -74,6 +83,15 @@ class PdParser:
         # search paths at this graph level
         self.search_paths: list = []
 
+        # parsed abstraction instances from previous compiles
+        self.abstraction_cache = abstraction_cache
+
+        # the tokenized .pd files of this compile
+        self.pd_files = pd_files or PdFiles()
+
+        # the files in the searched directories, listed once per compile
+        self.directory_index = directory_index or DirectoryIndex()
+
     @classmethod
     def get_supported_objects(cls) -> list:
         """ Returns a set of all pd objects names supported by the parser.
@@ -83,53 +101,14 @@ class PdParser:
         pd_objects.extend(cls.__PD_CLASSES.keys())
         return pd_objects
 
-    @classmethod
-    def __get_hv_args(cls, pd_path: str) -> OrderedDict:
-        """ Pre-parse the file for Heavy arguments, such that they are available
-            as soon as a graph is created.
-        """
-        num_canvas = -1
-        hv_arg_dict = OrderedDict()
-        hv_arg_list: Optional[list] = None
-        with open(pd_path, "r") as f:
-            for li in f:
-                if li.startswith("#N canvas"):
-                    hv_arg_list = []
-                    hv_arg_dict[li.rstrip(";\r\n")] = hv_arg_list
-                    num_canvas += 1
-                elif "@hv_arg" in li and hv_arg_list is not None:
-                    hv_arg_list.append(li.rstrip(";\r\n"))
-                elif li.startswith("#X restore"):
-                    num_canvas -= 1
-                    hv_arg_list = list(hv_arg_dict.values())[num_canvas]
-        return hv_arg_dict
-
     @classmethod
     def get_pd_line(cls, pd_path: str) -> Generator:
-        concat = ""  # concatination state
-        with open(pd_path, "r") as f:
-            for li in f:
-                # concatenate split lines in the Pd file here
-                li = li.rstrip("\r\n")  # account for windows CRLF
-                if li.endswith(";") and not li.endswith(r"\;"):
-                    out = li[:-1]  # remove single ";"
-                    if len(concat) > 0:
-                        out = f'{concat} {out}'
-                        concat = ""  # reset concatenation state
-                    yield out
-                else:
-                    concat = (f'{concat} {li}') if len(concat) > 0 else f'{li}'
+        for li, _ in PdFile.load(pd_path).lines:
+            yield li
 
     @classmethod
     def split_line(cls, li: str) -> list[str]:
-        # remove width parameter
-        li = cls.RE_WIDTH.sub("", li)
-        # split on non-escaped spaces
-        line = cls.RE_SPACE.split(li)
-        # replace escaped spaces
-        line = [i.replace('\\ ', ' ') for i in line]
-
-        return line
+        return PdFile.split_line(li)
 
     def add_absolute_search_directory(self, search_dir: str) -> bool:
         if os.path.isdir(search_dir):
@@ -142,7 +121,12 @@ class PdParser:
         search_dir = os.path.abspath(os.path.join(
             self.search_paths[0],
             search_dir))
-        return self.add_absolute_search_directory(search_dir)
+        if not self.add_absolute_search_directory(search_dir):
+            return False
+
+        # a [declare -path] directory may have been listed before it was declared
+        self.directory_index.invalidate(search_dir)
+        return True
 
     def find_abstraction_path(self, local_dir: str, abs_name: str) -> Optional[str]:
         """ Finds the full path for an abstraction.
@@ -153,13 +137,13 @@ class PdParser:
 
         # check local directory first
         abs_path = os.path.join(os.path.abspath(local_dir), abs_filename)
-        if os.path.isfile(abs_path):
+        if self.directory_index.isfile(abs_path):
             return abs_path
 
         # check search paths in reverse order (last added search path first)
         for d in reversed(self.search_paths):
             abs_path = os.path.join(d, abs_filename)
-            if os.path.isfile(abs_path):
+            if self.directory_index.isfile(abs_path):
                 return abs_path
 
         return None
@@ -183,9 +167,9 @@ class PdParser:
         if is_root:
             self.search_paths.append(os.path.dirname(file_path))
 
-        file_hv_arg_dict = self.__get_hv_args(file_path)
-        file_iterator = self.get_pd_line(file_path)
-        canvas_line: str = file_iterator.__next__()
+        pd_file = self.pd_files.load(file_path)
+        file_iterator = iter(pd_file.lines)
+        canvas_line: str = file_iterator.__next__()[0]
 
         self.__DOLLAR_ZERO += 1  # increment $0
         graph_args = [self.__DOLLAR_ZERO] + (obj_args or [])
@@ -197,7 +181,7 @@ class PdParser:
 
         g: PdGraph = self.graph_from_canvas(
             file_iterator,
-            file_hv_arg_dict,
+            pd_file.hv_args,
             canvas_line,
             graph_args,
             file_path,
@@ -212,11 +196,42 @@ class PdParser:
                 return g
             g.validate_configuration()
 
+            if self.abstraction_cache is not None:
+                self.abstraction_cache.store()
+
         return g
 
+    def abstraction_from_file(
+        self,
+        file_path: str,
+        obj_args: list,
+        parent: PdGraph,
+        pos_x: int = 0,
+        pos_y: int = 0
+    ) -> PdObject:
+        """ Instantiate an abstraction, reusing the graph of a previous compile
+            from the abstraction cache if nothing has changed.
+        """
+        if self.abstraction_cache is None:
+            return self.graph_from_file(file_path, obj_args, pos_x, pos_y, is_root=False)
+
+        key = self.abstraction_cache.key(file_path, obj_args, self.__DOLLAR_ZERO + 1, parent, self)
+        entry = self.abstraction_cache.load(key) if key is not None else None
+        if entry is not None:
+            self.__DOLLAR_ZERO += entry["num_dollar_zero"]
+            self.obj_counter.update(entry["obj_counter"])
+            return CachedGraph(entry, pos_x, pos_y)
+
+        dollar_zero = self.__DOLLAR_ZERO
+        obj_counter = self.obj_counter.copy()
+        x = self.graph_from_file(file_path, obj_args, pos_x, pos_y, is_root=False)
+        if key is not None:
+            self.abstraction_cache.add(key, x, self.__DOLLAR_ZERO - dollar_zero, self.obj_counter - obj_counter)
+        return x
+
     def graph_from_canvas(
         self,
-        file_iterator: Generator,
+        file_iterator: Iterator[tuple[str, list[str]]],
         file_hv_arg_dict: dict[str, list[str]],
         canvas_line: str,
         graph_args: list,
@@ -255,9 +270,7 @@ class PdParser:
                 required=is_required)
 
         try:  # this try will capture any critical errors
-            for li in file_iterator:
-                line = self.split_line(li)
-
+            for li, line in file_iterator:
                 if line[0] == "#N":
                     if line[1] == "canvas":
                         x = self.graph_from_canvas(
@@ -371,14 +384,15 @@ class PdParser:
                         abs_path = self.find_abstraction_path(os.path.dirname(pd_path), obj_type)
                         if abs_path is not None and not g.is_abstraction_on_call_stack(abs_path):
                             # ensure that infinite recursion into abstractions is not possible
-                            x = self.graph_from_file(
+                            x = self.abstraction_from_file(
                                 file_path=abs_path,
                                 obj_args=obj_args,
-                                pos_x=int(line[2]), pos_y=int(line[3]),
-                                is_root=False)
+                                parent=g,
+                                pos_x=int(line[2]), pos_y=int(line[3]))
 
                         # is this object in lib/pd_converted?
-                        elif os.path.isfile(os.path.join(self.__PDLIB_CONVERTED_DIR, f"{obj_type}.hv.json")):
+                        elif self.directory_index.isfile(
+                                os.path.join(self.__PDLIB_CONVERTED_DIR, f"{obj_type}.hv.json")):
                             self.obj_counter[obj_type] += 1
                             hv_path = os.path.join(self.__PDLIB_CONVERTED_DIR, f"{obj_type}.hv.json")
                             x = HeavyGraph(
@@ -387,7 +401,8 @@ class PdParser:
                                 pos_x=int(line[2]), pos_y=int(line[3]))
 
                         # is this object in lib/heavy_converted?
-                        elif os.path.isfile(os.path.join(self.__HVLIB_CONVERTED_DIR, f"{obj_type}.hv.json")):
+                        elif self.directory_index.isfile(
+                                os.path.join(self.__HVLIB_CONVERTED_DIR, f"{obj_type}.hv.json")):
                             self.obj_counter[obj_type] += 1
                             hv_path = os.path.join(self.__HVLIB_CONVERTED_DIR, f"{obj_type}.hv.json")
                             x = HeavyGraph(
@@ -396,7 +411,7 @@ class PdParser:
                                 pos_x=int(line[2]), pos_y=int(line[3]))
 
                         # is this object in lib/pd?
-                        elif os.path.isfile(os.path.join(self.__PDLIB_DIR, f"{obj_type}.pd")):
+                        elif self.directory_index.isfile(os.path.join(self.__PDLIB_DIR, f"{obj_type}.pd")):
                             self.obj_counter[obj_type] += 1
                             pdlib_path = os.path.join(self.__PDLIB_DIR, f"{obj_type}.pd")
 
@@ -436,7 +451,7 @@ class PdParser:
                                     "Arguments and control connections are ignored.")
 
                         # is this object in lib/heavy?
-                        elif os.path.isfile(os.path.join(self.__HVLIB_DIR, f"{obj_type}.pd")):
+                        elif self.directory_index.isfile(os.path.join(self.__HVLIB_DIR, f"{obj_type}.pd")):
                             self.obj_counter[obj_type] += 1
                             hvlib_path = os.path.join(self.__HVLIB_DIR, f"{obj_type}.pd")
                             x = self.graph_from_file(
@@ -446,7 +461,7 @@ class PdParser:
                                 is_root=False)
 
                         # is this object in lib/else?
-                        elif os.path.isfile(os.path.join(self.__ELSELIB_DIR, f"{obj_type}.pd")):
+                        elif self.directory_index.isfile(os.path.join(self.__ELSELIB_DIR, f"{obj_type}.pd")):
                             self.obj_counter[obj_type] += 1
                             hvlib_path = os.path.join(self.__ELSELIB_DIR, f"{obj_type}.pd")
                             x = self.graph_from_file(
@@ -456,7 +471,7 @@ class PdParser:
                                 is_root=False)
 
                         # is this object in lib? (sub-directory)
-                        elif os.path.isfile(os.path.join(self.__LIB_DIR, f"{obj_type}.pd")):
+                        elif self.directory_index.isfile(os.path.join(self.__LIB_DIR, f"{obj_type}.pd")):
                             self.obj_counter[obj_type] += 1
                             hvlib_path = os.path.join(self.__LIB_DIR, f"{obj_type}.pd")
                             x = self.graph_from_file(
@@ -618,7 +633,7 @@ class PdParser:
                         g.add_error(f"Don't know how to parse line: {' '.join(line)}")
 
                 elif line[0] == "#A" and obj_array is not None:
-                    obj_array.obj_dict["values"].extend([float(f) for f in line[2:]])
+                    obj_array.obj_dict["values"].extend(PdFile.array_values(li))
 
                 else:
                     g.add_error(f"Don't know how to parse line: {' '.join(line)}")
@@ -20,8 +20,11 @@ import os
 import time
 from typing import List, Optional
 
+from hvcc.core.directory_index import DirectoryIndex
 from hvcc.interpreters.pd2hv.PdParser import PdParser
 from hvcc.types.compiler import CompilerResp, CompilerNotif
+from .AbstractionCache import AbstractionCache
+from .PdFile import PdFiles
 from .PdGraph import PdGraph
 
 
@@ -48,15 +51,25 @@ class pd2hv:
     def compile(
         cls,
         pd_path: str,
-        hv_dir: str,
+        hv_dir: Optional[str] = None,
         search_paths: Optional[List] = None,
         verbose: bool = False,
-        export_args: bool = False
+        export_args: bool = False,
+        abstraction_cache_dir: Optional[str] = None,
+        pd_files: Optional[PdFiles] = None,
+        directory_index: Optional[DirectoryIndex] = None
     ) -> CompilerResp:
+        """ Converts a Pd patch into a Heavy graph. The graph is returned in-memory
+            with the response. It is only written to a .hv.json file if hv_dir is given.
+            Unchanged abstractions are reused from abstraction_cache_dir if it is given.
+            The .pd files are read from pd_files and the abstractions are looked up in
+            directory_index, if they are given, to share them with the other stages of a compile.
+        """
 
         tick = time.time()
 
-        parser = PdParser()  # create parser state
+        abstraction_cache = AbstractionCache(abstraction_cache_dir) if abstraction_cache_dir is not None else None
+        parser = PdParser(abstraction_cache, pd_files, directory_index)  # create parser state
         if search_paths is not None:
             for p in search_paths:
                 parser.add_absolute_search_directory(p)
@@ -79,13 +92,25 @@ class pd2hv:
                 compile_time=(time.time() - tick)
             )
 
-        if not os.path.exists(hv_dir):
-            os.makedirs(hv_dir)
-
+        stats = {}
+        if abstraction_cache is not None:
+            stats = {
+                "abstractions_parsed": abstraction_cache.num_parsed,
+                "abstractions_reused": abstraction_cache.num_reused
+            }
+            if verbose:
+                print(f"--> Reused {abstraction_cache.num_reused} abstraction instances, "
+                      f"parsed {abstraction_cache.num_parsed}")
+
+        hv_graph = pd_graph.to_hv(export_args=export_args)
         hv_file = f"{os.path.splitext(os.path.basename(pd_path))[0]}.hv.json"
-        hv_path = os.path.join(hv_dir, hv_file)
-        with open(hv_path, "w") as f:
-            json.dump(pd_graph.to_hv(export_args=export_args), f, indent=4)
+
+        if hv_dir is not None:
+            if not os.path.exists(hv_dir):
+                os.makedirs(hv_dir)
+
+            with open(os.path.join(hv_dir, hv_file), "w") as f:
+                json.dump(hv_graph, f, indent=4)
 
         return CompilerResp(
             stage="pd2hv",
@@ -95,9 +120,11 @@ class pd2hv:
             ),
             in_dir=os.path.dirname(pd_path),
             in_file=os.path.basename(pd_path),
-            out_dir=hv_dir,
-            out_file=hv_file,
-            compile_time=(time.time() - tick)
+            out_dir=hv_dir or "",
+            out_file=hv_file if hv_dir is not None else "",
+            compile_time=(time.time() - tick),
+            stats=stats,
+            hv=hv_graph
         )
 
 
@@ -20,8 +20,11 @@ import os
 import sys
 import time
 
+from hvcc import batch
 from hvcc.version import VERSION
 from hvcc.compiler import compile_dataflow
+from hvcc.core.hv2ir.SignalScheduler import SignalScheduler
+from hvcc.core.hv2ir.hv2ir import hv2ir
 
 
 class Colours:
@@ -38,11 +41,14 @@ class Colours:
 
 
 def main() -> bool:
+    if sys.argv[1:2] == ["batch"]:
+        return batch.main(sys.argv[2:])
+
     tick = time.time()
 
     parser = argparse.ArgumentParser(
         description="This is the Wasted Audio Heavy compiler. It compiles supported dataflow languages into C,"
-                    " and other supported frameworks.")
+                    " and other supported frameworks. Use 'hvcc batch' to compile many patches at once.")
     parser.add_argument(
         "in_path",
         help="The input dataflow file.")
@@ -74,7 +80,11 @@ def main() -> bool:
         "-G",
         "--ext-gen",
         nargs="*",
-        help="Name of a Python module that implements a generator, see 'External Generators' docs page.")
+        help="Entry point name or Python module of an external generator, see 'External Generators' docs page.")
+    parser.add_argument(
+        "--sequential-generators",
+        action='store_true',
+        help="Run the generators one after another instead of concurrently, e.g. for debugging.")
     parser.add_argument(
         "--results_path",
         help="Write results dictionary to the given path as a JSON-formatted string."
@@ -84,6 +94,49 @@ def main() -> bool:
         action='store_true',
         help="Disable DSP. Run as control-only patch."
     )
+    parser.add_argument(
+        "--intermediates",
+        action='store_true',
+        help="Write the intermediate Heavy (hv/) and HeavyIR (ir/) json files to the output directory."
+    )
+    parser.add_argument(
+        "--buffer-allocator",
+        choices=hv2ir.BUFFER_ALLOCATORS,
+        default="greedy",
+        help="Allocator of the temporary signal buffers. 'interval' assigns them from their live ranges,"
+             " using the minimal number of buffers for the signal order."
+    )
+    parser.add_argument(
+        "--signal-scheduler",
+        choices=SignalScheduler.SCHEDULERS,
+        default="depth-first",
+        help="Scheduler of the signal process order. 'locality' reorders independent signal objects to keep"
+             " producers next to their consumers and to shorten the lifetime of signal buffers."
+    )
+    parser.add_argument(
+        "--message-scheduling",
+        choices=["frame", "split"],
+        default="frame",
+        help="How the generated process() schedules messages. 'frame' checks the message queue before every"
+             " frame of HV_N_SIMD samples, 'split' splits the block at the next message and processes the frames"
+             " in between in one run."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Count the time spent in every signal object and message function of the generated C. The counters"
+             " are returned by getProfile(), see ir2c_perf for a report."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory of the compile cache. Unchanged patches are restored from it instead of being recompiled."
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=512,
+        help="Maximum size of the compile cache in MiB. Least recently used entries are evicted first."
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -112,7 +165,15 @@ def main() -> bool:
         ext_generators=args.ext_gen,
         verbose=args.verbose,
         copyright=args.copyright,
-        nodsp=args.nodsp
+        nodsp=args.nodsp,
+        intermediates=args.intermediates,
+        cache_dir=args.cache_dir,
+        cache_size=args.cache_size * 1024 * 1024,
+        sequential_generators=args.sequential_generators,
+        buffer_allocator=args.buffer_allocator,
+        signal_scheduler=args.signal_scheduler,
+        message_scheduling=args.message_scheduling,
+        profile=args.profile
     )
 
     errorCount = 0
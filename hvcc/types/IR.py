@@ -62,6 +62,7 @@ class IRName(BaseModel):
 class IRObjectdict(BaseModel):
     args: Dict
     type: str
+    origin: Optional[str] = None
 
 
 class IRInit(BaseModel):
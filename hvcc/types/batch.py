@@ -0,0 +1,39 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from hvcc.types.compiler import CompilerResults
+
+
+class BatchJob(BaseModel):
+    in_path: str
+    out_dir: Optional[str] = None
+    patch_name: str = "heavy"
+    patch_meta_file: Optional[str] = None
+    search_paths: Optional[List[str]] = None
+    generators: Optional[List[str]] = None
+    ext_generators: Optional[List[str]] = None
+    copyright: Optional[str] = None
+    nodsp: bool = False
+    buffer_allocator: str = "greedy"
+    signal_scheduler: str = "depth-first"
+    message_scheduling: str = "frame"
+    profile: bool = False
+
+
+class BatchResult(BaseModel):
+    job: BatchJob
+    compile_time: float = 0.0
+    errors: List[str] = []
+    results: Optional[CompilerResults] = None
+
+
+class BatchResults(BaseModel):
+    patches: List[BatchResult] = []
+    num_errors: int = 0
+    total_time: float = 0.0
@@ -4,10 +4,10 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
 from abc import ABC, abstractmethod
-from collections import Counter, defaultdict
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, Field, RootModel
 
 from hvcc.interpreters.pd2hv.NotificationEnum import NotificationEnum
 from hvcc.types.meta import Meta
@@ -35,8 +35,14 @@ class CompilerResp(BaseModel):
     out_file: str = ""
     compile_time: float = 0.0
     obj_counter: Counter = Counter()
-    obj_perf: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    obj_perf: Dict[str, Dict[str, float]] = {}
     ir: Optional[IRGraph] = None
+    # the stage was skipped and its results restored from the compile cache
+    cached: bool = False
+    # stage specific counters, e.g. reused abstractions
+    stats: Dict[str, int] = {}
+    # in-memory Heavy graph handed from pd2hv to hv2ir, not part of the results output
+    hv: Optional[Dict] = Field(default=None, exclude=True)
 
 
 class CompilerResults(RootModel):
@@ -0,0 +1,122 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+""" Benchmarks signal buffer assignment in hv2ir on synthetic graphs.
+
+    python -m tests.benchmarks.bench_buffer_pool [--grains 2500]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+from hvcc.core.hv2ir.BufferPool import BufferPool
+from hvcc.core.hv2ir.HeavyGraph import HeavyGraph
+from hvcc.interpreters.pd2hv import pd2hv
+from hvcc.core.hv2ir import hv2ir
+
+
+def synthetic_patch(num_grains: int) -> str:
+    """ Returns a Pd patch with 5 signal objects per grain. Every grain fans out
+        into two branches, and all grains are summed in a balanced tree into a dac~.
+    """
+    lines = ["#N canvas 0 50 450 300 12;"]
+    connections = []
+
+    def add_obj(text: str) -> int:
+        lines.append(f"#X obj 0 0 {text};")
+        return len(lines) - 2
+
+    outputs: List[int] = []
+    for i in range(num_grains):
+        src = add_obj(f"sig~ {i}")
+        a = add_obj("*~ 0.5")
+        b = add_obj("*~ 0.25")
+        c = add_obj("*~ 0.125")
+        mix = add_obj("+~")
+        connections += [(src, a), (a, b), (a, c), (b, mix), (c, mix, 1)]
+        outputs.append(mix)
+
+    # sum all grains in a balanced tree
+    while len(outputs) > 1:
+        summed = []
+        for left, right in zip(outputs[0::2], outputs[1::2]):
+            s = add_obj("+~")
+            connections += [(left, s), (right, s, 1)]
+            summed.append(s)
+        if len(outputs) % 2 == 1:
+            summed.append(outputs[-1])
+        outputs = summed
+
+    dac = add_obj("dac~")
+    connections.append((outputs[0], dac))
+
+    for c in connections:
+        lines.append(f"#X connect {c[0]} 0 {c[1]} {c[2] if len(c) > 2 else 0};")
+    return "\n".join(lines) + "\n"
+
+
+def bench_graph(num_grains: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pd_path = os.path.join(tmp_dir, "grains.pd")
+        with open(pd_path, "w") as f:
+            f.write(synthetic_patch(num_grains))
+
+        hv = pd2hv.pd2hv.compile(pd_path).hv
+
+        # time only the buffer assignment pass
+        elapsed = 0.0
+        original = HeavyGraph.assign_signal_buffers
+
+        def timed(self: HeavyGraph, buffer_pool: BufferPool = None) -> None:  # type: ignore
+            nonlocal elapsed
+            tick = time.time()
+            original(self, buffer_pool)
+            if buffer_pool is None:
+                elapsed = time.time() - tick
+
+        HeavyGraph.assign_signal_buffers = timed  # type: ignore
+        try:
+            tick = time.time()
+            results = hv2ir.hv2ir.compile(pd_path, patch_name="grains", hv_json=hv)
+            total = time.time() - tick
+        finally:
+            HeavyGraph.assign_signal_buffers = original  # type: ignore
+
+        assert results.ir is not None
+        print(f"graph: {sum(results.obj_counter.values())} IR objects, "
+              f"{results.ir.signal.numTemporaryBuffers.float} float buffers")
+        print(f"  assign_signal_buffers: {1000 * elapsed:.1f}ms, hv2ir total: {1000 * total:.1f}ms")
+
+
+def bench_pool(num_buffers: int) -> None:
+    """ Keeps num_buffers buffers alive at the same time, and releases them in order.
+    """
+    pool = BufferPool()
+    tick = time.time()
+    buffers = [pool.get_buffer("~f>", 2) for _ in range(num_buffers)]
+    for b in buffers:
+        pool.retain_buffer(b)
+    for b in buffers:
+        pool.release_buffer(b, 3)
+    for _ in range(num_buffers):
+        pool.get_buffer("~f>")
+    print(f"pool: {num_buffers} live buffers, {1000 * (time.time() - tick):.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark hv2ir signal buffer assignment.")
+    parser.add_argument("--grains", type=int, default=2500, help="Number of 5-object grains in the graph.")
+    parser.add_argument("--buffers", type=int, default=10000, help="Number of live buffers in the pool.")
+    args = parser.parse_args()
+
+    bench_graph(args.grains)
+    bench_pool(args.buffers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+""" Benchmarks the tokenizing of .pd files on a synthetic patch.
+
+    python -m tests.benchmarks.bench_pd_file [--lines 100000]
+"""
+
+import argparse
+import io
+import random
+import time
+from typing import List
+
+from hvcc.interpreters.pd2hv.PdFile import PdFile
+
+
+def synthetic_patch(num_lines: int, table_size: int = 1024) -> bytes:
+    """ Returns a Pd patch with CRLF line endings of about num_lines lines. It contains objects
+        with escaped spaces and width parameters, lines wrapped over multiple lines in the file,
+        connections, and tables of which the values are wrapped into lines of 1000 values.
+    """
+    rng = random.Random(0)
+    lines = ["#N canvas 0 50 450 300 12;"]
+    num_objs = 0
+    num_connections = num_lines // 5
+    while len(lines) < num_lines - num_connections:
+        i = num_objs % 100
+        if i == 0:
+            lines.append(f"#X array table{num_objs} {table_size} float 2;")
+            for onset in range(0, table_size, 1000):
+                values = " ".join(f"{rng.uniform(-1, 1):.6g}" for _ in range(min(1000, table_size - onset)))
+                lines.append(f"#A {onset} {values};")
+            lines.append("#X coords 0 1 1024 -1 200 140 1 0 0;")
+            lines.append("#X restore 10 10 graph;")
+        elif i % 4 == 1:
+            lines.append(f"#X obj 10 10 s test\\ {num_objs}, f 12;")
+        elif i % 4 == 2:
+            lines.append(f"#X msg 10 10 1 2 3 \\; r {num_objs} bang;")
+        elif i % 4 == 3:
+            # a line which is wrapped over two lines in the file
+            lines.append("#X obj 10 10 t b b b b b b b b b b b b b b b b b b b b b b b b b b\nb b b;")
+        else:
+            lines.append(f"#X obj 10 10 +~ {num_objs};")
+        num_objs += 1
+    for i in range(num_connections):
+        lines.append(f"#X connect {i % num_objs} 0 {(i + 1) % num_objs} 0;")
+    return "\r\n".join(lines).encode("utf-8") + b"\r\n"
+
+
+def legacy_lines(data: bytes) -> List[List[str]]:
+    """ Tokenizes the file line by line, as PdParser.get_pd_line and PdParser.split_line did before.
+    """
+    lines = []
+    concat = ""
+    for li in io.TextIOWrapper(io.BytesIO(data)):
+        li = li.rstrip("\r\n")
+        if li.endswith(";") and not li.endswith(r"\;"):
+            out = li[:-1]
+            if len(concat) > 0:
+                out = concat + " " + out
+                concat = ""
+            li = PdFile.RE_WIDTH.sub("", out)
+            line = [i.replace('\\ ', ' ') for i in PdFile.RE_SPACE.split(li)]
+            lines.append(line)
+        else:
+            concat = (concat + " " + li) if len(concat) > 0 else li
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the tokenizing of .pd files.")
+    parser.add_argument("--lines", type=int, default=100000, help="Number of lines in the patch.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs, the fastest one is reported.")
+    args = parser.parse_args()
+
+    data = synthetic_patch(args.lines)
+
+    def best(f) -> float:  # type: ignore
+        timings = []
+        for _ in range(args.repeat):
+            tick = time.perf_counter()
+            f(data)
+            timings.append(time.perf_counter() - tick)
+        return min(timings)
+
+    pd_file = PdFile(data)
+    arrays = [li for li, line in pd_file.lines if line[0] == "#A"]
+    num_values = sum(len(list(PdFile.array_values(li))) for li in arrays)
+    print(f"patch: {len(pd_file.lines)} lines, {len(arrays)} #A lines with {num_values} values, "
+          f"{len(data) / 1e6:.1f}MB")
+
+    # both tokenizers must agree, the values of "#A" lines are parsed into their table later
+    legacy = legacy_lines(data)
+    assert len(legacy) == len(pd_file.lines)
+    for (li, line), expected in zip(pd_file.lines, legacy):
+        if line[0] == "#A":
+            assert line == expected[:2] and list(PdFile.array_values(li)) == [float(f) for f in expected[2:]]
+        else:
+            assert line == expected
+
+    legacy_time = best(legacy_lines)
+    pd_file_time = best(PdFile)
+    print(f"  line by line: {1000 * legacy_time:.1f}ms")
+    print(f"  PdFile: {1000 * pd_file_time:.1f}ms ({legacy_time / pd_file_time:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,621 @@
+/**
+ * Copyright (c) 2026 Enzien Audio, Ltd.
+ * 
+ * Redistribution and use in source and binary forms, with or without modification,
+ * are permitted provided that the following conditions are met:
+ * 
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions, and the following disclaimer.
+ * 
+ * 2. Redistributions in binary form must reproduce the phrase "powered by heavy",
+ *    the heavy logo, and a hyperlink to https://enzienaudio.com, all in a visible
+ *    form.
+ * 
+ *   2.1 If the Application is distributed in a store system (for example,
+ *       the Apple "App Store" or "Google Play"), the phrase "powered by heavy"
+ *       shall be included in the app description or the copyright text as well as
+ *       the in the app itself. The heavy logo will shall be visible in the app
+ *       itself as well.
+ * 
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+ * THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF
+ * THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ * 
+ */
+
+#include "Heavy_heavy.hpp"
+
+#include <new>
+
+#define Context(_c) static_cast<Heavy_heavy *>(_c)
+
+
+/*
+ * C Functions
+ */
+
+extern "C" {
+  HV_EXPORT HeavyContextInterface *hv_heavy_new(double sampleRate) {
+    // allocate aligned memory
+    void *ptr = hv_malloc(sizeof(Heavy_heavy));
+    // ensure non-null
+    if (!ptr) return nullptr;
+    // call constructor
+    new(ptr) Heavy_heavy(sampleRate);
+    return Context(ptr);
+  }
+
+  HV_EXPORT HeavyContextInterface *hv_heavy_new_with_options(double sampleRate,
+      int poolKb, int inQueueKb, int outQueueKb) {
+    // allocate aligned memory
+    void *ptr = hv_malloc(sizeof(Heavy_heavy));
+    // ensure non-null
+    if (!ptr) return nullptr;
+    // call constructor
+    new(ptr) Heavy_heavy(sampleRate, poolKb, inQueueKb, outQueueKb);
+    return Context(ptr);
+  }
+
+  HV_EXPORT void hv_heavy_free(HeavyContextInterface *instance) {
+    // call destructor
+    Context(instance)->~Heavy_heavy();
+    // free memory
+    hv_free(instance);
+  }
+} // extern "C"
+
+
+
+
+
+
+
+/*
+ * Class Functions
+ */
+
+Heavy_heavy::Heavy_heavy(double sampleRate, int poolKb, int inQueueKb, int outQueueKb)
+    : HeavyContext(sampleRate, poolKb, inQueueKb, outQueueKb) {
+  numBytes += sSample_init(&sSample_OyIO1UHB);
+  numBytes += sVarf_init(&sVarf_on1j8tJR, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_labDprd0, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_yDspDzlq, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_abUdJnct, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_tP1sMB6I, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_VPvwJhsa, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_No3PmUAN, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_ePPbEeHZ, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_aiBc66fo, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_vA1srsBo, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_2jCuY7z9, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_xUUke7Lh, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_ppCjHaA3, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_TOR0XlZQ, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_WtHgqf5L, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_gA7brsos, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_VoIdHfcL, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_O6U67UOx, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_D3HEy7T3, 0.0f, 0.0f, false);
+  numBytes += sVarf_init(&sVarf_aUc8EqYi, 0.0f, 0.0f, false);
+  numBytes += cDelay_init(this, &cDelay_eEq8Yf6P, 2.0f);
+  
+  // schedule a message to trigger all loadbangs via the __hv_init receiver
+  scheduleMessageForReceiver(0xCE5CC65B, msg_initWithBang(HV_MESSAGE_ON_STACK(1), 0));
+}
+
+Heavy_heavy::~Heavy_heavy() {
+  // nothing to free
+}
+
+HvTable *Heavy_heavy::getTableForHash(hv_uint32_t tableHash) {
+  return nullptr;
+}
+
+void Heavy_heavy::scheduleMessageForReceiver(hv_uint32_t receiverHash, HvMessage *m) {
+  switch (receiverHash) {
+    case 0xCE5CC65B: { // __hv_init
+      mq_addMessageByTimestamp(&mq, m, 0, &cReceive_dH4zL47k_sendMessage);
+      break;
+    }
+    default: return;
+  }
+}
+
+int Heavy_heavy::getParameterInfo(int index, HvParameterInfo *info) {
+  if (info != nullptr) {
+    switch (index) {
+      default: {
+        info->name = "invalid parameter index";
+        info->hash = 0;
+        info->type = HvParameterType::HV_PARAM_TYPE_PARAMETER_IN;
+        info->minVal = 0.0f;
+        info->maxVal = 0.0f;
+        info->defaultVal = 0.0f;
+        break;
+      }
+    }
+  }
+  return 0;
+}
+
+
+
+/*
+ * Send Function Implementations
+ */
+
+
+void Heavy_heavy::cCast_VT5S5yWU_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_nhoGgX3Q_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_OHhXFXA6_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_UPa8BDNP_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_EFeTnAPG_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_jHrw9eAr_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_CqBLkDdb_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_JFhANgZv_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_5FCgCbX2_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_aZ2tX2FO_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_5UIcwGjG_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_FvRanb9k_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_vOfHcFm3_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_njmpPtCl_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_zvscEPhv_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_QWBOReeE_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_eWHsYM6R_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_qIa0RcLz_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_e2s7Ax2P_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_xpL2oNgB_sendMessage);
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_OqgztQES_sendMessage);
+}
+
+void Heavy_heavy::sSample_OyIO1UHB_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cPrint_onMessage(_c, m, "print");
+}
+
+void Heavy_heavy::cSwitchcase_VlvpZoLW_onMessage(HeavyContextInterface *_c, void *o, int letIn, const HvMessage *const m, void *sendMessage) {
+  int msgIndex = 0;
+  switch (msg_getHash(m, msgIndex)) {
+    case 0x6D60E6E: { // "symbol"
+      msgIndex = 1;
+      break;
+    }
+  }
+  switch (msg_getHash(m, msgIndex)) {
+    case 0x7A5B032D: { // "stop"
+      cMsg_FEo1LgHP_sendMessage(_c, 0, m);
+      break;
+    }
+    default: {
+      cMsg_FEo1LgHP_sendMessage(_c, 0, m);
+      cDelay_onMessage(_c, &Context(_c)->cDelay_eEq8Yf6P, 1, m, &cDelay_eEq8Yf6P_sendMessage);
+      cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_ZEKd9XOG_sendMessage);
+      break;
+    }
+  }
+}
+
+void Heavy_heavy::cDelay_eEq8Yf6P_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const m) {
+  cDelay_clearExecutingMessage(&Context(_c)->cDelay_eEq8Yf6P, m);
+  sSample_onMessage(_c, &Context(_c)->sSample_OyIO1UHB, 1, m);
+}
+
+void Heavy_heavy::cMsg_FEo1LgHP_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setSymbol(m, 0, "clear");
+  cDelay_onMessage(_c, &Context(_c)->cDelay_eEq8Yf6P, 0, m, &cDelay_eEq8Yf6P_sendMessage);
+}
+
+void Heavy_heavy::cCast_ZEKd9XOG_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cDelay_onMessage(_c, &Context(_c)->cDelay_eEq8Yf6P, 0, m, &cDelay_eEq8Yf6P_sendMessage);
+}
+
+void Heavy_heavy::cCast_zvscEPhv_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_L1gTYmCo_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_JFhANgZv_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_QpPQKbrT_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_eWHsYM6R_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_MmA6zhBg_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_nhoGgX3Q_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_VQ2jkd8R_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_jHrw9eAr_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_4Sn1N3F5_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_aZ2tX2FO_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_3zAGLiJi_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_5FCgCbX2_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_0FWfxLGv_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_vOfHcFm3_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_0e0vDVkO_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_EFeTnAPG_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_NfMAEXZ4_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_UPa8BDNP_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_h3tiHz4Y_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_OqgztQES_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_9OMSXE6J_sendMessage(_c, 0, m);
+  cSwitchcase_VlvpZoLW_onMessage(_c, NULL, 0, m, NULL);
+}
+
+void Heavy_heavy::cCast_CqBLkDdb_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_NgXveo0Z_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_njmpPtCl_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_Z0cQoxWA_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_QWBOReeE_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_PARoOlcF_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_OHhXFXA6_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_joNp02hL_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_qIa0RcLz_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_1DPldaeH_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_xpL2oNgB_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_jUzyBo6b_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_e2s7Ax2P_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_jmDOqNRM_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_5UIcwGjG_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_JCtqF078_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cCast_FvRanb9k_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cMsg_p4ylErOW_sendMessage(_c, 0, m);
+}
+
+void Heavy_heavy::cMsg_9OMSXE6J_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.1f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_on1j8tJR, m);
+}
+
+void Heavy_heavy::cMsg_1DPldaeH_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.4f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_aUc8EqYi, m);
+}
+
+void Heavy_heavy::cMsg_jmDOqNRM_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.2f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_labDprd0, m);
+}
+
+void Heavy_heavy::cMsg_jUzyBo6b_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.3f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_yDspDzlq, m);
+}
+
+void Heavy_heavy::cMsg_MmA6zhBg_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.1f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_D3HEy7T3, m);
+}
+
+void Heavy_heavy::cMsg_Z0cQoxWA_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.4f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_gA7brsos, m);
+}
+
+void Heavy_heavy::cMsg_L1gTYmCo_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.2f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_VoIdHfcL, m);
+}
+
+void Heavy_heavy::cMsg_PARoOlcF_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.3f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_O6U67UOx, m);
+}
+
+void Heavy_heavy::cMsg_0e0vDVkO_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.1f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_WtHgqf5L, m);
+}
+
+void Heavy_heavy::cMsg_3zAGLiJi_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.4f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_ppCjHaA3, m);
+}
+
+void Heavy_heavy::cMsg_JCtqF078_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.2f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_TOR0XlZQ, m);
+}
+
+void Heavy_heavy::cMsg_p4ylErOW_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.3f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_xUUke7Lh, m);
+}
+
+void Heavy_heavy::cMsg_0FWfxLGv_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.1f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_2jCuY7z9, m);
+}
+
+void Heavy_heavy::cMsg_4Sn1N3F5_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.4f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_VPvwJhsa, m);
+}
+
+void Heavy_heavy::cMsg_NgXveo0Z_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.2f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_abUdJnct, m);
+}
+
+void Heavy_heavy::cMsg_QpPQKbrT_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.3f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_vA1srsBo, m);
+}
+
+void Heavy_heavy::cMsg_NfMAEXZ4_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.1f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_tP1sMB6I, m);
+}
+
+void Heavy_heavy::cMsg_VQ2jkd8R_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.4f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_aiBc66fo, m);
+}
+
+void Heavy_heavy::cMsg_joNp02hL_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.2f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_No3PmUAN, m);
+}
+
+void Heavy_heavy::cMsg_h3tiHz4Y_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *const n) {
+  HvMessage *m = nullptr;
+  m = HV_MESSAGE_ON_STACK(1);
+  msg_init(m, 1, msg_getTimestamp(n));
+  msg_setFloat(m, 0, 0.3f);
+  sVarf_onMessage(_c, &Context(_c)->sVarf_ePPbEeHZ, m);
+}
+
+void Heavy_heavy::cReceive_dH4zL47k_sendMessage(HeavyContextInterface *_c, int letIn, const HvMessage *m) {
+  cCast_onMessage(_c, HV_CAST_BANG, 0, m, &cCast_VT5S5yWU_sendMessage);
+}
+
+
+
+/*
+ * Code for expr~ implementation
+ * Write out the generic implementation code
+ */
+
+ // per class code
+
+ // per object code
+ 
+ void Heavy_heavy::cExprSig_2Nim4Xly_evaluate(hv_bInf_t* bIns, hv_bOutf_t bOut) {
+ 	hv_bufferf_t Bf0, Bf1, Bf2, Bf3;
+ 	__hv_add_f(bIns[0], bIns[1], &Bf0);
+	__hv_sin_f(Bf0, &Bf0);
+	__hv_div_f(bIns[2], bIns[3], &Bf1);
+	__hv_mul_f(Bf1, bIns[4], &Bf1);
+	__hv_sub_f(Bf0, Bf1, &Bf0);
+	__hv_add_f(bIns[5], bIns[6], &Bf1);
+	__hv_sub_f(Bf0, Bf1, &Bf0);
+	__hv_div_f(bIns[7], bIns[8], &Bf1);
+	__hv_mul_f(Bf1, bIns[9], &Bf1);
+	__hv_add_f(bIns[10], bIns[11], &Bf2);
+	__hv_div_f(bIns[12], bIns[13], &Bf3);
+	__hv_mul_f(Bf3, bIns[14], &Bf3);
+	__hv_sub_f(Bf2, Bf3, &Bf2);
+	__hv_mul_f(Bf1, Bf2, &Bf1);
+	__hv_sub_f(Bf0, Bf1, &Bf0);
+	__hv_add_f(bIns[15], bIns[16], &Bf1);
+	__hv_div_f(bIns[17], bIns[18], &Bf2);
+	__hv_tanh_f(Bf2, &Bf2);
+	__hv_mul_f(Bf2, bIns[19], &Bf2);
+	__hv_sub_f(Bf1, Bf2, &Bf1);
+	__hv_add_f(Bf0, Bf1, bOut);
+ }
+
+
+/*
+ * Context Process Implementation
+ */
+
+int Heavy_heavy::process(float **inputBuffers, float **outputBuffers, int n) {
+  while (hLp_hasData(&inQueue)) {
+    hv_uint32_t numBytes = 0;
+    ReceiverMessagePair *p = reinterpret_cast<ReceiverMessagePair *>(hLp_getReadBuffer(&inQueue, &numBytes));
+    hv_assert(numBytes >= sizeof(ReceiverMessagePair));
+    scheduleMessageForReceiver(p->receiverHash, &p->msg);
+    hLp_consume(&inQueue);
+  }
+
+  sendBangToReceiver(0xDD21C0EB); // send to __hv_bang~ on next cycle
+  const int n4 = n & ~HV_N_SIMD_MASK; // ensure that the block size is a multiple of HV_N_SIMD
+
+  // temporary signal vars
+  hv_bufferf_t Bf0, Bf1, Bf2, Bf3, Bf4, Bf5, Bf6, Bf7, Bf8, Bf9, Bf10, Bf11, Bf12, Bf13, Bf14, Bf15, Bf16, Bf17, Bf18, Bf19;
+
+  // input and output vars
+
+  // declare and init the zero buffer
+  hv_bufferf_t ZERO; __hv_zero_f(VOf(ZERO));
+
+  hv_uint32_t nextBlock = blockStartTimestamp;
+  for (int n = 0; n < n4;) {
+
+    // process all of the messages for the next frame
+    while (mq_hasMessageBefore(&mq, nextBlock + HV_N_SIMD)) {
+      MessageNode *const node = mq_peek(&mq);
+      node->sendMessage(this, node->let, node->m);
+      mq_pop(&mq);
+    }
+
+    // the frames before the frame of the next message
+    int end = n4;
+    if (mq_hasMessage(&mq)) {
+      const hv_uint32_t numSamples = msg_getTimestamp(mq_node_getMessage(mq_peek(&mq))) - nextBlock;
+      if (numSamples < (hv_uint32_t) (n4 - n)) end = n + (int) (numSamples & ~HV_N_SIMD_MASK);
+    }
+
+    while (n < end) {
+
+      
+
+      
+
+      // process all signal functions
+      __hv_varread_f(&sVarf_on1j8tJR, VOf(Bf0));
+      __hv_varread_f(&sVarf_yDspDzlq, VOf(Bf1));
+      __hv_varread_f(&sVarf_labDprd0, VOf(Bf2));
+      __hv_varread_f(&sVarf_aUc8EqYi, VOf(Bf3));
+      __hv_varread_f(&sVarf_D3HEy7T3, VOf(Bf4));
+      __hv_varread_f(&sVarf_O6U67UOx, VOf(Bf5));
+      __hv_varread_f(&sVarf_VoIdHfcL, VOf(Bf6));
+      __hv_varread_f(&sVarf_gA7brsos, VOf(Bf7));
+      __hv_varread_f(&sVarf_WtHgqf5L, VOf(Bf8));
+      __hv_varread_f(&sVarf_xUUke7Lh, VOf(Bf9));
+      __hv_varread_f(&sVarf_TOR0XlZQ, VOf(Bf10));
+      __hv_varread_f(&sVarf_ppCjHaA3, VOf(Bf11));
+      __hv_varread_f(&sVarf_2jCuY7z9, VOf(Bf12));
+      __hv_varread_f(&sVarf_vA1srsBo, VOf(Bf13));
+      __hv_varread_f(&sVarf_abUdJnct, VOf(Bf14));
+      __hv_varread_f(&sVarf_VPvwJhsa, VOf(Bf15));
+      __hv_varread_f(&sVarf_tP1sMB6I, VOf(Bf16));
+      __hv_varread_f(&sVarf_ePPbEeHZ, VOf(Bf17));
+      __hv_varread_f(&sVarf_No3PmUAN, VOf(Bf18));
+      __hv_varread_f(&sVarf_aiBc66fo, VOf(Bf19));
+      
+      	// !!! declare this buffer once outside the loop
+      	hv_bInf_t input_args_2Nim4Xly[20] = {VIf(Bf0), VIf(Bf1), VIf(Bf2), VIf(Bf3), VIf(Bf4), VIf(Bf5), VIf(Bf6), VIf(Bf7), VIf(Bf8), VIf(Bf9), VIf(Bf10), VIf(Bf11), VIf(Bf12), VIf(Bf13), VIf(Bf14), VIf(Bf15), VIf(Bf16), VIf(Bf17), VIf(Bf18), VIf(Bf19)};
+      	cExprSig_evaluators[0](input_args_2Nim4Xly, VOf(Bf19));
+      __hv_sample_f(this, &sSample_OyIO1UHB, VIf(Bf19), &sSample_OyIO1UHB_sendMessage);
+
+      // save output vars to output buffer
+      // no output channels
+
+      n += HV_N_SIMD;
+      nextBlock += HV_N_SIMD;
+
+      // signal objects may have scheduled messages for the next frame
+      if (mq_hasMessageBefore(&mq, nextBlock + HV_N_SIMD)) break;
+    }
+  }
+
+  blockStartTimestamp = nextBlock;
+
+  return n4; // return the number of frames processed
+
+}
+
+int Heavy_heavy::processInline(float *inputBuffers, float *outputBuffers, int n4) {
+  hv_assert(!(n4 & HV_N_SIMD_MASK)); // ensure that n4 is a multiple of HV_N_SIMD
+
+  // define the heavy input buffer for 0 channel(s)
+  float **const bIn = NULL;
+
+  // define the heavy output buffer for 0 channel(s)
+  float **const bOut = NULL;
+
+  int n = process(bIn, bOut, n4);
+  return n;
+}
+
+int Heavy_heavy::processInlineInterleaved(float *inputBuffers, float *outputBuffers, int n4) {
+  hv_assert(n4 & ~HV_N_SIMD_MASK); // ensure that n4 is a multiple of HV_N_SIMD
+
+  // define the heavy input buffer for 0 channel(s), uninterleave
+  float *const bIn = NULL;
+
+  // define the heavy output buffer for 0 channel(s)
+  float *const bOut = NULL;
+
+  int n = processInline(bIn, bOut, n4);
+
+  
+
+  return n;
+}
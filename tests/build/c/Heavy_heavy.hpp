@@ -0,0 +1,155 @@
+/**
+ * Copyright (c) 2026 Enzien Audio, Ltd.
+ * 
+ * Redistribution and use in source and binary forms, with or without modification,
+ * are permitted provided that the following conditions are met:
+ * 
+ * 1. Redistributions of source code must retain the above copyright notice,
+ *    this list of conditions, and the following disclaimer.
+ * 
+ * 2. Redistributions in binary form must reproduce the phrase "powered by heavy",
+ *    the heavy logo, and a hyperlink to https://enzienaudio.com, all in a visible
+ *    form.
+ * 
+ *   2.1 If the Application is distributed in a store system (for example,
+ *       the Apple "App Store" or "Google Play"), the phrase "powered by heavy"
+ *       shall be included in the app description or the copyright text as well as
+ *       the in the app itself. The heavy logo will shall be visible in the app
+ *       itself as well.
+ * 
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+ * THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ * FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ * DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ * SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ * CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ * OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF
+ * THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ * 
+ */
+
+#ifndef _HEAVY_CONTEXT_HEAVY_HPP_
+#define _HEAVY_CONTEXT_HEAVY_HPP_
+
+// object includes
+#include "HeavyContext.hpp"
+#include "HvSignalVar.h"
+#include "HvControlPrint.h"
+#include "HvSignalSample.h"
+#include "HvControlDelay.h"
+#include "HvControlCast.h"
+#include "HvMath.h"
+
+class Heavy_heavy : public HeavyContext {
+
+ public:
+  Heavy_heavy(double sampleRate, int poolKb=10, int inQueueKb=2, int outQueueKb=0);
+  ~Heavy_heavy();
+
+  const char *getName() override { return "heavy"; }
+  int getNumInputChannels() override { return 0; }
+  int getNumOutputChannels() override { return 0; }
+
+  int process(float **inputBuffers, float **outputBuffer, int n) override;
+  int processInline(float *inputBuffers, float *outputBuffer, int n) override;
+  int processInlineInterleaved(float *inputBuffers, float *outputBuffer, int n) override;
+
+  int getParameterInfo(int index, HvParameterInfo *info) override;
+
+ private:
+  HvTable *getTableForHash(hv_uint32_t tableHash) override;
+  void scheduleMessageForReceiver(hv_uint32_t receiverHash, HvMessage *m) override;
+
+
+  /*
+  * Code for expr~ implementation
+  * Write out the generic header code
+  */
+
+  // per class code
+  typedef void(*cExprSig_evaluator)(hv_bInf_t*, hv_bOutf_t);
+  cExprSig_evaluator cExprSig_evaluators[1] = {
+		cExprSig_2Nim4Xly_evaluate
+	};
+
+  // per object code
+  static inline void cExprSig_2Nim4Xly_evaluate(hv_bInf_t* bIns, hv_bOutf_t bOut);
+
+
+  // static sendMessage functions
+  static void cCast_VT5S5yWU_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void sSample_OyIO1UHB_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cSwitchcase_VlvpZoLW_onMessage(HeavyContextInterface *, void *, int letIn, const HvMessage *const, void *);
+  static void cDelay_eEq8Yf6P_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_FEo1LgHP_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_ZEKd9XOG_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_zvscEPhv_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_JFhANgZv_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_eWHsYM6R_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_nhoGgX3Q_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_jHrw9eAr_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_aZ2tX2FO_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_5FCgCbX2_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_vOfHcFm3_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_EFeTnAPG_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_UPa8BDNP_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_OqgztQES_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_CqBLkDdb_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_njmpPtCl_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_QWBOReeE_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_OHhXFXA6_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_qIa0RcLz_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_xpL2oNgB_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_e2s7Ax2P_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_5UIcwGjG_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cCast_FvRanb9k_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_9OMSXE6J_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_1DPldaeH_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_jmDOqNRM_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_jUzyBo6b_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_MmA6zhBg_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_Z0cQoxWA_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_L1gTYmCo_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_PARoOlcF_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_0e0vDVkO_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_3zAGLiJi_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_JCtqF078_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_p4ylErOW_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_0FWfxLGv_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_4Sn1N3F5_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_NgXveo0Z_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_QpPQKbrT_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_NfMAEXZ4_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_VQ2jkd8R_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_joNp02hL_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cMsg_h3tiHz4Y_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+  static void cReceive_dH4zL47k_sendMessage(HeavyContextInterface *, int, const HvMessage *);
+
+  // objects
+  SignalSample sSample_OyIO1UHB;
+  SignalVarf sVarf_on1j8tJR;
+  SignalVarf sVarf_labDprd0;
+  SignalVarf sVarf_yDspDzlq;
+  SignalVarf sVarf_abUdJnct;
+  SignalVarf sVarf_tP1sMB6I;
+  SignalVarf sVarf_VPvwJhsa;
+  SignalVarf sVarf_No3PmUAN;
+  SignalVarf sVarf_ePPbEeHZ;
+  SignalVarf sVarf_aiBc66fo;
+  SignalVarf sVarf_vA1srsBo;
+  SignalVarf sVarf_2jCuY7z9;
+  SignalVarf sVarf_xUUke7Lh;
+  SignalVarf sVarf_ppCjHaA3;
+  SignalVarf sVarf_TOR0XlZQ;
+  SignalVarf sVarf_WtHgqf5L;
+  SignalVarf sVarf_gA7brsos;
+  SignalVarf sVarf_VoIdHfcL;
+  SignalVarf sVarf_O6U67UOx;
+  SignalVarf sVarf_D3HEy7T3;
+  SignalVarf sVarf_aUc8EqYi;
+  ControlDelay cDelay_eEq8Yf6P;
+};
+
+#endif // _HEAVY_CONTEXT_HEAVY_HPP_
@@ -0,0 +1,44 @@
+/**
+ * Copyright (c) 2014-2018 Enzien Audio Ltd.
+ *
+ * Permission to use, copy, modify, and/or distribute this software for any
+ * purpose with or without fee is hereby granted, provided that the above
+ * copyright notice and this permission notice appear in all copies.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+ * REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+ * AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+ * INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+ * LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+ * OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+ * PERFORMANCE OF THIS SOFTWARE.
+ */
+
+#ifndef _HEAVY_CONTROL_DELAY_H_
+#define _HEAVY_CONTROL_DELAY_H_
+
+#define __HV_DELAY_MAX_MESSAGES 8
+
+#include "HvHeavyInternal.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct ControlDelay {
+  hv_uint32_t delay; // delay in samples
+  HvMessage *msgs[__HV_DELAY_MAX_MESSAGES];
+} ControlDelay;
+
+hv_size_t cDelay_init(HeavyContextInterface *_c, ControlDelay *o, float delayMs);
+
+void cDelay_onMessage(HeavyContextInterface *_c, ControlDelay *o, int letIn, const HvMessage *m,
+    void (*sendMessage)(HeavyContextInterface *, int, const HvMessage *));
+
+void cDelay_clearExecutingMessage(ControlDelay *o, const HvMessage *m);
+
+#ifdef __cplusplus
+} // extern "C"
+#endif
+
+#endif // _HEAVY_CONTROL_DELAY_H_
@@ -25,6 +25,10 @@ from tests.framework.base_test import HvBaseTest
 
 
 class TestPdSpeedBase(HvBaseTest):
+    # the signal scheduler the patches are compiled with
+    SIGNAL_SCHEDULER = "depth-first"
+    # test results cannot be more than this percentage slower than the golden value
+    PERCENT_THRESHOLD = 2.0
 
     def compile_and_run(
         self,
@@ -58,7 +62,7 @@ class TestPdSpeedBase(HvBaseTest):
             golden = {}
 
         try:
-            out_dir = self._run_hvcc(pd_path)
+            out_dir = self._run_hvcc(pd_path, compile_args={"signal_scheduler": self.SIGNAL_SCHEDULER})
         except Exception as e:
             self.fail(str(e))
 
@@ -78,9 +82,11 @@ class TestPdSpeedBase(HvBaseTest):
         if "HV_SIMD_SSE" in golden.get("usPerBlock", {}):
             tock = golden["usPerBlock"]["HV_SIMD_SSE"]
             percent_difference = 100.0 * (tick - tock) / tock
-            self.assertTrue(percent_difference < self.__PERCENT_THRESHOLD,
-                            f"{os.path.basename(pd_path)} has become {percent_difference:g}% slower @ {tick}us/block.")
-            if (percent_difference < -self.__PERCENT_THRESHOLD):
-                print(f"{os.path.basename(pd_path)} has become significantly faster: {percent_difference:g}%")
+            self.assertTrue(percent_difference < self.PERCENT_THRESHOLD,
+                            f"{os.path.basename(pd_path)} ({self.SIGNAL_SCHEDULER}) has become "
+                            f"{percent_difference:g}% slower @ {tick}us/block.")
+            if (percent_difference < -self.PERCENT_THRESHOLD):
+                print(f"{os.path.basename(pd_path)} ({self.SIGNAL_SCHEDULER}) has become significantly faster: "
+                      f"{percent_difference:g}%")
         else:
-            print(tick)
+            print(f"{os.path.basename(pd_path)} ({self.SIGNAL_SCHEDULER}): {tick}us/block")
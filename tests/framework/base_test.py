@@ -20,7 +20,7 @@ import shutil
 import subprocess
 import unittest
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import hvcc
 
@@ -39,6 +39,10 @@ simd_flags = {
 class HvBaseTest(unittest.TestCase):
     SCRIPT_DIR = ''
     TEST_DIR = ''
+    # additional flags for compiling the generated C code
+    C_FLAGS: List[str] = []
+    # additional arguments of hvcc.compile_dataflow
+    COMPILE_ARGS: Dict = {}
 
     def setUp(self):
         self.env = jinja2.Environment()
@@ -51,7 +55,8 @@ class HvBaseTest(unittest.TestCase):
         pd_path: str,
         expect_warning: bool = False,
         expect_fail: bool = False,
-        expected_enum: NotificationEnum = NotificationEnum.EMPTY
+        expected_enum: NotificationEnum = NotificationEnum.EMPTY,
+        compile_args: Optional[Dict] = None
     ) -> Optional[str]:
         """Run hvcc on a Pd file. Returns the output directory.
         """
@@ -61,7 +66,8 @@ class HvBaseTest(unittest.TestCase):
         if os.path.exists(out_dir):
             shutil.rmtree(out_dir)
 
-        hvcc_results = hvcc.compile_dataflow(pd_path, out_dir, verbose=False)
+        compile_args = {**self.COMPILE_ARGS, **(compile_args or {})}
+        hvcc_results = hvcc.compile_dataflow(pd_path, out_dir, verbose=False, **compile_args)
 
         for r in hvcc_results.root.values():
             if not expect_fail:
@@ -108,7 +114,7 @@ class HvBaseTest(unittest.TestCase):
         makefile_path = os.path.join(out_dir, "c", "Makefile")
         with open(makefile_path, "w") as f:
             f.write(self.env.get_template("Makefile").render(
-                simd_flags=simd_flags[flag or "HV_SIMD_NONE"],
+                simd_flags=simd_flags[flag or "HV_SIMD_NONE"] + self.C_FLAGS,
                 source_files=source_files,
                 out_path=exe_path))
 
@@ -126,7 +132,7 @@ class HvBaseTest(unittest.TestCase):
         flag = flag or "HV_SIMD_NONE"
         self.assertTrue(flag in simd_flags, f"Unknown compiler flag: {flag}")
 
-        c_flags = simd_flags[flag]
+        c_flags = simd_flags[flag] + self.C_FLAGS
 
         # all warnings are errors (except for #warning)
         # assertions are NOT turned off (help to catch errors)
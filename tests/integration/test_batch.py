@@ -0,0 +1,90 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import json
+import os
+
+from hvcc import batch
+from hvcc.types.batch import BatchJob
+
+
+class TestBatch:
+    SCRIPT_DIR = os.path.dirname(__file__)
+    DATA_DIR = os.path.join(SCRIPT_DIR, "data")
+
+    def test_load_jobs(self, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps([
+            {"in_path": "synth.pd", "generators": ["js"]},
+            {"in_path": "fx.pd", "out_dir": "build/fx", "nodsp": True, "message_scheduling": "split"}
+        ]))
+
+        jobs = batch.load_jobs(
+            [str(manifest), os.path.join(self.DATA_DIR, "gui_*.pd")],
+            BatchJob(in_path="", patch_name="batch", generators=["c"]))
+
+        assert jobs[0].in_path == os.path.join(tmp_path, "synth.pd")
+        assert jobs[0].generators == ["js"]
+        assert jobs[0].patch_name == "batch"
+        assert jobs[1].out_dir == os.path.join(tmp_path, "build/fx")
+        assert jobs[1].nodsp
+        assert jobs[1].message_scheduling == "split"
+        assert jobs[0].message_scheduling == "frame"
+        assert [os.path.basename(j.in_path) for j in jobs[2:]] == [
+            "gui_abs_args.pd", "gui_abstraction.pd", "gui_dollarzero.pd", "gui_subpatch.pd"]
+        assert all(j.generators == ["c"] for j in jobs[2:])
+
+    def test_compile_batch(self, tmp_path):
+        jobs = [
+            BatchJob(in_path=os.path.join(self.DATA_DIR, "subgraph.pd"), out_dir=str(tmp_path / "a")),
+            BatchJob(in_path=os.path.join(self.DATA_DIR, "gui_abstraction.pd"), out_dir=str(tmp_path / "b")),
+            BatchJob(in_path=os.path.join(self.DATA_DIR, "missing.pd"), out_dir=str(tmp_path / "c")),
+            BatchJob(in_path=os.path.join(self.DATA_DIR, "subgraph.pd"), out_dir=str(tmp_path / "c")),
+        ]
+        results = batch.compile_batch(jobs, workers=2)
+
+        assert [r.job for r in results.patches] == jobs
+        assert results.patches[0].errors == []
+        assert results.patches[1].errors == []
+        assert results.patches[0].compile_time > 0
+        assert os.path.isfile(tmp_path / "a" / "c" / "Heavy_heavy.cpp")
+        assert os.path.isfile(tmp_path / "b" / "c" / "Heavy_heavy.cpp")
+
+        # patches sharing an output directory are not compiled
+        assert "shared with another patch" in results.patches[2].errors[0]
+        assert results.patches[2].results is None
+        assert results.num_errors == 2
+
+    def test_main(self, tmp_path):
+        results_path = tmp_path / "results.json"
+        has_error = batch.main([
+            os.path.join(self.DATA_DIR, "subgraph*.pd"),
+            "-o", str(tmp_path),
+            "-j", "1",
+            "--results_path", str(results_path)])
+
+        assert not has_error
+        assert os.path.isfile(tmp_path / "subgraph" / "c" / "Heavy_heavy.cpp")
+        assert os.path.isfile(tmp_path / "subgraph_inv" / "c" / "Heavy_heavy.cpp")
+
+        with open(results_path) as f:
+            results = json.load(f)
+        assert len(results["patches"]) == 2
+        assert results["num_errors"] == 0
+        assert "hv2ir" in results["patches"][0]["results"]
+
+    def test_main_compile_options(self, tmp_path):
+        has_error = batch.main([
+            os.path.join(self.DATA_DIR, "osc.pd"),
+            "-o", str(tmp_path),
+            "-j", "1",
+            "--message-scheduling", "split",
+            "--profile"])
+
+        assert not has_error
+        with open(tmp_path / "osc" / "c" / "Heavy_heavy.cpp") as f:
+            source = f.read()
+        assert "for (int n = 0; n < n4;) {" in source
+        assert "getProfile" in source
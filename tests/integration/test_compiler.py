@@ -0,0 +1,292 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+
+import hvcc
+from hvcc import compiler
+from hvcc.cache import CompileCache
+from hvcc.core.directory_index import DirectoryIndex
+from hvcc.core.hv2ir.HeavyLangObject import HeavyLangObject
+from hvcc.generators.ir2c.SymbolTable import SymbolTable
+from hvcc.generators.ir2c.ir2c_perf import ir2c_perf
+from hvcc.interpreters.pd2hv.PdFile import PdFile
+from hvcc.types.compiler import CompilerResp, CompilerResults, ExternInfo, Generator
+
+
+class TestCompiler:
+    SCRIPT_DIR = os.path.dirname(__file__)
+
+    def _compile(self, out_dir: str, **kwargs):
+        source_path = os.path.join(self.SCRIPT_DIR, "data", "subgraph.pd")
+        results = hvcc.compile_dataflow(source_path, out_dir, **kwargs)
+        assert not any(r.notifs.has_error for r in results.root.values())
+        return results
+
+    def test_in_memory(self, tmp_path):
+        results = self._compile(str(tmp_path))
+
+        assert results.root["hv2ir"].ir is not None
+        assert os.path.isfile(os.path.join(tmp_path, "c", "Heavy_heavy.cpp"))
+        assert not os.path.exists(os.path.join(tmp_path, "hv"))
+        assert not os.path.exists(os.path.join(tmp_path, "ir", "heavy.heavy.ir.json"))
+
+    def test_intermediates(self, tmp_path):
+        self._compile(str(tmp_path), intermediates=True)
+
+        assert os.path.isfile(os.path.join(tmp_path, "hv", "subgraph.hv.json"))
+        assert os.path.isfile(os.path.join(tmp_path, "ir", "heavy.heavy.ir.json"))
+
+    def _copy_sources(self, src_dir) -> str:
+        os.makedirs(src_dir)
+        for f in ("gui_abstraction.pd", "subgraph.pd", "subgraph_inv.pd"):
+            shutil.copy(os.path.join(self.SCRIPT_DIR, "data", f), src_dir)
+        return os.path.join(src_dir, "gui_abstraction.pd")
+
+    def test_cache(self, tmp_path, monkeypatch):
+        source_path = self._copy_sources(tmp_path / "src")
+        out_dir = str(tmp_path / "out")
+        cache_dir = str(tmp_path / "cache")
+
+        results = hvcc.compile_dataflow(source_path, out_dir, cache_dir=cache_dir)
+        assert not any(r.notifs.has_error for r in results.root.values())
+        assert len(os.listdir(cache_dir)) == 2  # the patch and the abstractions/ directory
+
+        def no_compile(*args, **kwargs):
+            raise AssertionError("compile_c should not run on a cache hit")
+
+        shutil.rmtree(out_dir)
+        with monkeypatch.context() as m:
+            m.setattr(compiler, "compile_c", no_compile)
+            cached = hvcc.compile_dataflow(source_path, out_dir, cache_dir=cache_dir)
+
+        assert cached.root["hv2ir"].ir == results.root["hv2ir"].ir
+        assert all(r.cached for r in cached.root.values())
+        assert os.path.isfile(os.path.join(out_dir, "c", "Heavy_heavy.cpp"))
+        assert os.path.isfile(os.path.join(out_dir, "ir", "gui_abstraction.gui.json"))
+
+    def test_abstraction_cache(self, tmp_path, monkeypatch):
+        source_path = self._copy_sources(tmp_path / "src")
+        out_dir = str(tmp_path / "out")
+        cache_dir = str(tmp_path / "cache")
+
+        results = hvcc.compile_dataflow(source_path, out_dir, cache_dir=cache_dir)
+        assert results.root["pd2hv"].stats == {"abstractions_parsed": 2, "abstractions_reused": 0}
+
+        # only the changed abstraction is parsed again
+        with open(tmp_path / "src" / "subgraph_inv.pd", "a") as f:
+            f.write("#X obj 10 10 f;\n")
+        monkeypatch.setattr(HeavyLangObject, "_HeavyLangObject__RANDOM", random.Random(0))
+        results = hvcc.compile_dataflow(source_path, out_dir, cache_dir=cache_dir)
+        assert not results.root["pd2hv"].cached
+        assert results.root["pd2hv"].stats == {"abstractions_parsed": 1, "abstractions_reused": 1}
+        assert not any(r.notifs.has_error for r in results.root.values())
+
+        # the reused abstraction generates the same C as parsing it again
+        uncached_dir = str(tmp_path / "uncached")
+        monkeypatch.setattr(HeavyLangObject, "_HeavyLangObject__RANDOM", random.Random(0))
+        hvcc.compile_dataflow(source_path, uncached_dir)
+        assert self._read_tree(os.path.join(out_dir, "c")) == self._read_tree(os.path.join(uncached_dir, "c"))
+
+    def test_pd_files_read_once(self, tmp_path, monkeypatch):
+        source_path = self._copy_sources(tmp_path / "src")
+        loads = []
+        load = PdFile.load
+        monkeypatch.setattr(PdFile, "load", lambda p: loads.append(p) or load(p))
+
+        # the cache key, pd2hv and pd2gui share the files of the compile
+        results = hvcc.compile_dataflow(source_path, str(tmp_path / "out"), cache_dir=str(tmp_path / "cache"))
+        assert not any(r.notifs.has_error for r in results.root.values())
+        assert sorted(loads) == sorted(set(loads))
+        assert os.path.join(tmp_path, "src", "subgraph_inv.pd") in loads
+
+    def test_directories_listed_once(self, tmp_path, monkeypatch):
+        source_path = self._copy_sources(tmp_path / "src")
+        listed = []
+        casefolded = DirectoryIndex.casefolded
+        monkeypatch.setattr(
+            DirectoryIndex, "casefolded", classmethod(lambda _, d, n: listed.append(d) or casefolded(d, n)))
+
+        # the cache key, pd2hv, pd2gui and hv2ir share one directory index
+        results = hvcc.compile_dataflow(source_path, str(tmp_path / "out"), cache_dir=str(tmp_path / "cache"))
+        assert not any(r.notifs.has_error for r in results.root.values())
+        assert sorted(listed) == sorted(set(listed))
+        assert str(tmp_path / "src") in listed
+
+    def test_cache_key(self, tmp_path):
+        source_path = self._copy_sources(tmp_path / "src")
+        cache = CompileCache(str(tmp_path / "cache"))
+
+        closure = cache.abstraction_closure(source_path)
+        assert closure is not None
+        assert sorted(os.path.basename(p) for p in closure) == ["subgraph.pd", "subgraph_inv.pd"]
+
+        key = cache.key(source_path, str(tmp_path / "out"))
+        assert key == cache.key(source_path, str(tmp_path / "out"))
+        assert key != cache.key(source_path, str(tmp_path / "out"), nodsp=True)
+        assert key != cache.key(source_path, str(tmp_path / "out"), generators=["c", "js"])
+
+        # changing an abstraction invalidates the patch
+        with open(tmp_path / "src" / "subgraph.pd", "a") as f:
+            f.write("#X obj 10 10 f;\n")
+        assert key != cache.key(source_path, str(tmp_path / "out"))
+
+    def test_cache_eviction(self, tmp_path):
+        cache = CompileCache(str(tmp_path / "cache"))
+        out_dir = tmp_path / "out"
+        os.makedirs(out_dir / "c")
+        with open(out_dir / "c" / "Heavy_heavy.c", "w") as f:
+            f.write(" " * 1000)
+
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.store(key, str(out_dir), CompilerResults(root={}))
+            os.utime(os.path.join(cache.cache_dir, key, cache.RESULTS_FILE), (i, i))
+
+        # using "a" makes "b" the least recently used entry
+        assert cache.load("a", str(tmp_path / "restore")) is not None
+        cache.max_size = 2500
+        cache.evict()
+        assert sorted(os.listdir(cache.cache_dir)) == ["a", "c"]
+        assert cache.size() <= 2500
+
+    def _read_tree(self, root) -> dict:
+        tree = {}
+        for d, _, files in os.walk(root):
+            for f in files:
+                with open(os.path.join(d, f), "rb") as fp:
+                    tree[os.path.relpath(os.path.join(d, f), root)] = fp.read()
+        return tree
+
+    def test_generators(self, tmp_path):
+        generators = ["dpf", "pdext", "unity", "wwise", "fmod", "daisy"]
+        source_path = os.path.join(self.SCRIPT_DIR, "data", "gui_abstraction.pd")
+
+        sequential = hvcc.compile_dataflow(
+            source_path, str(tmp_path / "sequential"), generators=generators, sequential_generators=True)
+        concurrent = hvcc.compile_dataflow(
+            source_path, str(tmp_path / "concurrent"), generators=generators)
+
+        stages = ["pd2hv", "pd2gui", "hv2ir", "ir2c", "ir2c_perf",
+                  "c2daisy", "c2dpf", "c2pdext", "c2unity", "c2wwise", "c2fmod"]
+        assert list(sequential.root.keys()) == stages
+        assert list(concurrent.root.keys()) == stages
+        assert not any(r.notifs.has_error for r in concurrent.root.values())
+
+        sequential_tree = self._read_tree(tmp_path / "sequential")
+        concurrent_tree = self._read_tree(tmp_path / "concurrent")
+        assert sequential_tree.keys() == concurrent_tree.keys()
+        # c2pdext writes the shared Makefile after c2dpf
+        assert concurrent_tree["Makefile"] == sequential_tree["Makefile"]
+        assert b"pdlibbuilder" in concurrent_tree["Makefile"]
+
+    def test_interval_buffer_allocator(self, tmp_path):
+        greedy = self._compile(str(tmp_path / "greedy"))
+        interval = self._compile(str(tmp_path / "interval"), buffer_allocator="interval")
+
+        stats = interval.root["hv2ir"].stats
+        assert stats["buffers_interval"] <= stats["buffers_greedy"]
+        assert stats["buffers_greedy"] == greedy.root["hv2ir"].ir.signal.numTemporaryBuffers.float
+        assert interval.root["hv2ir"].ir.signal.numTemporaryBuffers.float == stats["buffers_interval"]
+        assert os.path.isfile(os.path.join(tmp_path, "interval", "c", "Heavy_heavy.cpp"))
+
+    def test_locality_signal_scheduler(self, tmp_path):
+        depth_first = self._compile(str(tmp_path / "depth-first")).root["hv2ir"].ir
+        locality = self._compile(str(tmp_path / "locality"), signal_scheduler="locality").root["hv2ir"].ir
+
+        assert sorted(so.id for so in locality.signal.processOrder) == \
+            sorted(so.id for so in depth_first.signal.processOrder)
+        assert os.path.isfile(os.path.join(tmp_path, "locality", "c", "Heavy_heavy.cpp"))
+
+    def test_split_message_scheduling(self, tmp_path):
+        self._compile(str(tmp_path / "frame"))
+        self._compile(str(tmp_path / "split"), message_scheduling="split")
+
+        with open(os.path.join(tmp_path, "frame", "c", "Heavy_heavy.cpp")) as f:
+            frame = f.read()
+        with open(os.path.join(tmp_path, "split", "c", "Heavy_heavy.cpp")) as f:
+            split = f.read()
+        assert "for (int n = 0; n < n4; n += HV_N_SIMD) {" in frame
+        assert "for (int n = 0; n < n4;) {" in split
+        # only process() differs
+        assert frame.split("::process(float")[0] == split.split("::process(float")[0]
+
+    def test_symbol_table(self, tmp_path):
+        source_path = os.path.join(self.SCRIPT_DIR, "data", "symbols.pd")
+        results = hvcc.compile_dataflow(source_path, str(tmp_path))
+
+        # "pitch" is a receiver, send, route case and message symbol
+        stats = results.root["ir2c"].stats
+        assert (stats["symbols"], stats["symbol_duplicates"], stats["symbol_collisions"]) == (3, 1, 0)
+        with open(os.path.join(tmp_path, "c", "Heavy_heavy_symbols.h")) as f:
+            assert '{ "pitch", 0x8B2148DD }, // case, message, receiver, send' in f.read()
+
+        # a different symbol with the same hash
+        assert results.root["hv2ir"].ir is not None
+        symbol_table = SymbolTable(results.root["hv2ir"].ir)
+        symbol_table.hashes["collision"] = symbol_table.hashes["__hv_init"]
+        assert symbol_table.get_collisions() == {symbol_table.hashes["__hv_init"]: ["__hv_init", "collision"]}
+
+        # symbols are written as C string literals, with control characters in octal
+        assert SymbolTable.c_string('a"b\\c\n\x01??=é') == '"a\\"b\\\\c\\012\\001\\?\\?=é"'
+
+    def test_shared_expr_evaluators(self, tmp_path):
+        source_path = os.path.join(self.SCRIPT_DIR, "data", "expr_shared.pd")
+        results = hvcc.compile_dataflow(source_path, str(tmp_path))
+
+        # "$v1*2" and "$v1 * 2" share an evaluator
+        stats = results.root["ir2c"].stats
+        assert (stats["expr_objects"], stats["expr_evaluators"]) == (3, 2)
+        assert stats["expr_bytes_saved"] > 0
+        with open(os.path.join(tmp_path, "c", "Heavy_heavy.cpp")) as f:
+            assert f.read().count("_evaluate(hv_bInf_t* bIns, hv_bOutf_t bOut) {") == 2
+
+    def test_generators_are_imported_lazily(self):
+        code = "import sys, hvcc; print(any(m.startswith('hvcc.generators.c2') for m in sys.modules))"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                             cwd=os.path.join(self.SCRIPT_DIR, "..", ".."))
+        assert out.stdout.strip() == "False"
+
+    def test_ext_generator_entry_point(self, tmp_path, monkeypatch):
+        class ExampleGenerator(Generator):
+            @classmethod
+            def compile(cls, c_src_dir: str, out_dir: str, externs: ExternInfo, **kwargs) -> CompilerResp:
+                return CompilerResp(stage="example", in_dir=c_src_dir, out_dir=out_dir)
+
+        class EntryPoint:
+            def load(self):
+                return ExampleGenerator
+
+        monkeypatch.setattr(compiler, "ext_generator_entry_points", lambda: {"example": EntryPoint()})
+        results = self._compile(str(tmp_path), ext_generators=["example"])
+        assert results.root["example"].stage == "example"
+
+    def test_profile(self, tmp_path):
+        source_path = os.path.join(self.SCRIPT_DIR, "data", "voices.pd")
+        results = hvcc.compile_dataflow(source_path, str(tmp_path), profile=True)
+        assert not any(r.notifs.has_error for r in results.root.values())
+
+        ir = results.root["hv2ir"].ir
+        assert ir is not None
+        num_counters = len(ir.signal.processOrder) + len(ir.control.sendMessage)
+        assert results.root["ir2c"].stats["profile_counters"] == num_counters
+        assert os.path.isfile(os.path.join(tmp_path, "c", "HvProfile.hpp"))
+        with open(os.path.join(tmp_path, "c", "Heavy_heavy.cpp")) as f:
+            assert f.read().count("HvProfileScope _profile(") == num_counters
+
+        # the objects of the [lop~] inside of a [voice] abstraction
+        origins = {o.origin for o in ir.objects.values()}
+        assert "voices.pd/voice.pd/lop~.pd" in origins
+
+        # the counters are mapped back to the objects, most time spent first
+        counters = [(so.id, "process", i, 10) for i, so in enumerate(ir.signal.processOrder)]
+        report = ir2c_perf.profile(ir, counters)
+        assert [r["id"] for r in report] == [c[0] for c in reversed(counters)]
+        assert report[0]["type"] == ir.objects[report[0]["id"]].type
+        assert report[0]["origin"] == ir.objects[report[0]["id"]].origin
+        assert abs(sum(r["percent"] for r in report) - 100.0) < 1e-6
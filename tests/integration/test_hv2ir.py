@@ -0,0 +1,101 @@
+# Heavy Compiler Collection
+# Copyright (C) 2025 Wasted Audio
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+
+from hvcc.core.hv2ir.ConstantFolding import ConstantFolding
+from hvcc.core.hv2ir.DeadCodeElimination import DeadCodeElimination
+from hvcc.core.hv2ir.hv2ir import hv2ir
+from hvcc.interpreters.pd2hv.pd2hv import pd2hv
+
+
+class TestHv2ir:
+    SCRIPT_DIR = os.path.dirname(__file__)
+
+    def _compile(self, pd_file: str):
+        pd_path = os.path.join(self.SCRIPT_DIR, "data", pd_file)
+        hv = pd2hv.compile(pd_path).hv
+        results = hv2ir.compile(pd_path, patch_name="heavy", hv_json=hv)
+        assert not results.notifs.has_error
+        return results
+
+    def test_constant_folding(self, monkeypatch):
+        # [osc~ 440] x [sig~ 1] into the dac~, an unused [osc~ 3] and a [phasor~] into a [send~] without receivers
+        results = self._compile("constant_folding.pd")
+        ir = results.ir
+        stats = results.stats
+
+        types = [ir.objects[so.id].type for so in ir.signal.processOrder]
+        assert types.count("__osc_k~f") == 1
+        assert "__varwrite~f" not in types
+        assert "__var~f" not in [o.type for o in ir.objects.values()]
+
+        # the multiplication by one is folded, leaving only the dac~ __add~f
+        assert types[-1] == "__add~f"
+        assert "__mul~f" not in types
+
+        # the same patch without either pass
+        monkeypatch.setattr(ConstantFolding, "run", classmethod(lambda cls, graph: (0, 0, 0)))
+        monkeypatch.setattr(DeadCodeElimination, "run", classmethod(lambda cls, graph: (0, 0)))
+        unoptimized = self._compile("constant_folding.pd").ir
+
+        def num_buffers(ir):
+            return sum(len(so.outputBuffers) for so in ir.signal.processOrder)
+
+        def num_varreads(ir):
+            return [o.type for o in ir.objects.values()].count("__varread~f")
+
+        assert stats["constant_folding_objects"] + stats["dead_code_objects"] == \
+            len(unoptimized.objects) - len(ir.objects)
+        assert stats["constant_folding_buffers"] + stats["dead_code_buffers"] == \
+            num_buffers(unoptimized) - num_buffers(ir)
+        assert stats["constant_folding_constants"] == num_varreads(unoptimized) - num_varreads(ir)
+
+    def test_osc(self):
+        # [osc~ 440] with a message into its phase inlet, and an [osc~] of which the frequency is a signal
+        results = self._compile("osc.pd")
+        ir = results.ir
+
+        ids = {ir.objects[so.id].type: so.id for so in ir.signal.processOrder}
+        assert "__osc_k~f" in ids and "__osc~f" in ids
+        assert not any(t.startswith("__phasor") for t in ids)
+        assert ir.signal.numTemporaryBuffers.float == 2
+        assert ir.objects[ids["__osc_k~f"]].args["frequency"] == 440
+
+        # the phase is sent to the oscillator
+        assert any(
+            m.id == ids["__osc_k~f"] and m.inletIndex == 1
+            for s in ir.control.sendMessage for mm in s.onMessage for m in mm
+        )
+
+    def test_vd(self):
+        # [vd~ d] and [delread4~ d] behind a [delwrite~ d 100]
+        results = self._compile("vd.pd")
+        ir = results.ir
+
+        objs = [ir.objects[so.id] for so in ir.signal.processOrder]
+        reads = [o for o in objs if o.type == "__delread_lin~f"]
+        write = next(o for o in objs if o.type == "__tabwrite~f")
+        assert len(reads) == 2
+        assert all(o.args["table"] == "del-d" and o.args["table_id"] == write.args["table_id"] for o in reads)
+        assert not any(o.type in ("__floor~f", "__tabread~if", "__tabhead~f") for o in objs)
+        assert ir.signal.numTemporaryBuffers.float == 2
+
+    def test_peephole_rules(self):
+        # [__abs~f] -> [__abs~f], [*~ 2] -> [*~ 3] and [*~ 3] -> [*~ 5]
+        results = self._compile("peephole.pd")
+        ir = results.ir
+
+        objs = [ir.objects[so.id] for so in ir.signal.processOrder]
+        types = [o.type for o in objs]
+        assert types.count("__abs~f") == 1
+
+        # only the multiplication by a power of two is merged, as 3*5 would round differently
+        assert types.count("__mul~f") == 3
+        assert sorted(o.args["k"] for o in objs if o.type == "__var_k~f") == [3.0, 5.0, 6.0]
+
+        assert results.stats["peephole_abs_abs"] == 1
+        assert results.stats["peephole_mul_constants"] == 1
+        assert results.stats["peephole_fma"] == 0
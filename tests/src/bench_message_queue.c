@@ -0,0 +1,172 @@
+/**
+ * Heavy Compiler Collection
+ * Copyright (C) 2025 Wasted Audio
+ *
+ * SPDX-License-Identifier: GPL-3.0-only
+ */
+
+/**
+ * Benchmarks the message queue, in the steady state of a sequencer: the next message
+ * is popped and a new one is scheduled at a random later time, at varying queue depths.
+ * With --check, a random sequence of adds, pops, removes and clears is run instead,
+ * checking that messages are popped in order of timestamp and then of insertion, and
+ * printing every popped message. Both implementations must print the same trace.
+ *
+ * S=../../hvcc/generators/ir2c/static
+ * clang -std=c11 -O3 -DNDEBUG -I$S bench_message_queue.c $S/HvMessage.c $S/HvMessagePool.c \
+ *     $S/HvMessageQueue.c $S/HvUtils.c -o bench_message_queue [-DHV_MESSAGE_QUEUE_HEAP=1]
+ * ./bench_message_queue [--check]
+ */
+
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+#include "HvMessageQueue.h"
+
+#define POOL_SIZE_KB 512
+#define MAX_PENDING 4096
+
+static void sendMessage(HeavyContextInterface *c, int let, const HvMessage *m) {
+  (void) c; (void) let; (void) m;
+}
+
+static void otherSendMessage(HeavyContextInterface *c, int let, const HvMessage *m) {
+  (void) c; (void) let; (void) m;
+}
+
+// xorshift32, the same sequence for both implementations
+static hv_uint32_t rngState = 0x12345678;
+
+static hv_uint32_t rng(void) {
+  rngState ^= rngState << 13;
+  rngState ^= rngState >> 17;
+  rngState ^= rngState << 5;
+  return rngState;
+}
+
+static double nowNs(void) {
+  return 1e9 * clock() / CLOCKS_PER_SEC;
+}
+
+// the messages in the queue, which can be removed
+static HvMessage *pending[MAX_PENDING];
+static int numPending = 0;
+
+static void forget(HvMessage *m) {
+  for (int i = 0; i < numPending; ++i) {
+    if (pending[i] == m) {
+      pending[i] = pending[--numPending];
+      return;
+    }
+  }
+}
+
+static int check(void) {
+  HvMessageQueue q;
+  mq_initWithPoolSize(&q, POOL_SIZE_KB);
+  HvMessage *m = HV_MESSAGE_ON_STACK(1);
+  hv_uint32_t now = 0;
+  hv_uint32_t lastTimestamp = 0;
+  float lastId = -1.0f;
+  int id = 0;
+  int errors = 0;
+
+  for (int i = 0; i < 200000; ++i) {
+    const hv_uint32_t r = rng() % 16;
+    if (r < 8) {
+      if (numPending < MAX_PENDING) {
+        // schedule a message, many of them at the same time
+        msg_initWithFloat(m, now + rng() % 64, (float) id++);
+        pending[numPending++] = mq_addMessageByTimestamp(&q, m, 0, &sendMessage);
+      }
+    } else if (r < 12) {
+      // send all messages before the next block
+      now += rng() % 8;
+      while (mq_hasMessageBefore(&q, now)) {
+        HvMessage *n = mq_node_getMessage(mq_peek(&q));
+        const hv_uint32_t t = msg_getTimestamp(n);
+        const float f = msg_getFloat(n, 0);
+        if (t < lastTimestamp || (t == lastTimestamp && f < lastId)) {
+          printf("error: %g at %u is popped after %g at %u\n", f, t, lastId, lastTimestamp);
+          ++errors;
+        }
+        lastTimestamp = t;
+        lastId = f;
+        printf("pop %u %g\n", t, f);
+        forget(n);
+        mq_pop(&q);
+      }
+    } else if (r < 15) {
+      if (numPending > 0) {
+        // remove a message, which fails for another sendMessage
+        HvMessage *n = pending[rng() % numPending];
+        const float f = msg_getFloat(n, 0);
+        if (mq_removeMessage(&q, n, &otherSendMessage)) {
+          printf("error: %g is removed with another sendMessage\n", f);
+          ++errors;
+        }
+        if (!mq_removeMessage(&q, n, (rng() & 1) ? &sendMessage : NULL)) {
+          printf("error: %g is not removed\n", f);
+          ++errors;
+        }
+        printf("remove %g\n", f);
+        forget(n);
+      }
+    } else {
+      // remove all messages at or after a time
+      const hv_uint32_t t = now + rng() % 64;
+      for (int j = numPending - 1; j >= 0; --j) {
+        if (msg_getTimestamp(pending[j]) >= t) pending[j] = pending[--numPending];
+      }
+      mq_clearAfter(&q, t);
+      printf("clear %u\n", t);
+    }
+
+    if (mq_size(&q) != numPending) {
+      printf("error: the queue has %d instead of %d messages\n", mq_size(&q), numPending);
+      return 1;
+    }
+  }
+
+  mq_free(&q);
+  return (errors > 0) ? 1 : 0;
+}
+
+static void bench(int depth, int numIterations) {
+  HvMessageQueue q;
+  mq_initWithPoolSize(&q, POOL_SIZE_KB);
+  HvMessage *m = HV_MESSAGE_ON_STACK(1);
+  const hv_uint32_t range = 2 * (hv_uint32_t) depth;
+
+  for (int i = 0; i < depth; ++i) {
+    msg_initWithFloat(m, rng() % range, 0.0f);
+    mq_addMessageByTimestamp(&q, m, 0, &sendMessage);
+  }
+
+  const double start = nowNs();
+  for (int i = 0; i < numIterations; ++i) {
+    // pop the next message, and schedule one at a random time after it
+    const hv_uint32_t t = msg_getTimestamp(mq_node_getMessage(mq_peek(&q)));
+    mq_pop(&q);
+    msg_initWithFloat(m, t + 1 + rng() % range, 0.0f);
+    mq_addMessageByTimestamp(&q, m, 0, &sendMessage);
+  }
+  const double elapsed = nowNs() - start;
+
+  printf("%8d %12.1f\n", depth, elapsed / numIterations);
+  mq_free(&q);
+}
+
+int main(int argc, const char *argv[]) {
+  if (argc > 1 && strcmp(argv[1], "--check") == 0) {
+    return check();
+  }
+
+  printf("%s queue\n", HV_MESSAGE_QUEUE_HEAP ? "heap" : "linked list");
+  printf("   depth  ns/pop+add\n");
+  const int depths[] = {1, 4, 16, 64, 256, 1024, 4096};
+  for (int i = 0; i < (int) (sizeof(depths) / sizeof(depths[0])); ++i) {
+    bench(depths[i], 200000);
+  }
+  return 0;
+}
@@ -29,6 +29,11 @@ class TestPdControlPatches(TestPdControlBase):
     def test_abs(self):
         self._test_control_patch("test-abs.pd")
 
+    def test_abs_recursion(self):
+        self._test_control_patch_expect_error(
+            "test-abs_recursion.pd",
+            NotificationEnum.ERROR_UNKNOWN_OBJECT)
+
     def test_add(self):
         self._test_control_patch("test-add.pd")
 
@@ -198,6 +203,9 @@ class TestPdControlPatches(TestPdControlBase):
     def test_null_object(self):
         self._test_control_patch("test-null_object.pd")
 
+    def test_osc(self):
+        self._test_control_patch("test-osc.pd")
+
     def test_pack(self):
         self._test_control_patch("test-pack.pd")
 
@@ -313,6 +321,10 @@ class TestPdControlPatches(TestPdControlBase):
     def test_variable_args(self):
         self._test_control_patch("test-variable_args.pd")
 
+    def test_vd(self):
+        # vd~ and delread4~ with fractional, clamped and varying delays, golden output of the vd~.pd abstraction
+        self._test_control_patch("test-vd.pd")
+
     def test_width(self):
         self._test_control_patch(
             "test-width.pd",
@@ -327,6 +339,69 @@ class TestPdControlPatches(TestPdControlBase):
         self._test_control_patch("test-extern_table.pd")
 
 
+class TestPdControlPatchesHeapQueue(TestPdControlBase):
+    """ The patches which schedule messages, with the binary heap message queue.
+    """
+    SCRIPT_DIR = os.path.dirname(__file__)
+    TEST_DIR = os.path.join(os.path.dirname(__file__), "pd", "control")
+    C_FLAGS = ["-DHV_MESSAGE_QUEUE_HEAP=1"]
+
+    def test_delay(self):
+        self._test_control_patch("test-delay.pd")
+
+    def test_line(self):
+        self._test_control_patch("test-line.pd")
+
+    def test_metro(self):
+        self._test_control_patch("test-metro.pd", num_iterations=100)
+
+    def test_pipe(self):
+        self._test_control_patch("test-pipe.pd", num_iterations=100)
+
+    def test_timer(self):
+        self._test_control_patch("test-timer.pd", num_iterations=20)
+
+
+class TestPdControlPatchesSplit(TestPdControlBase):
+    """ The patches which schedule messages, with process() split at the message timestamps.
+    """
+    SCRIPT_DIR = os.path.dirname(__file__)
+    TEST_DIR = os.path.join(os.path.dirname(__file__), "pd", "control")
+    COMPILE_ARGS = {"message_scheduling": "split"}
+
+    def test_delay(self):
+        self._test_control_patch("test-delay.pd")
+
+    def test_line(self):
+        self._test_control_patch("test-line.pd")
+
+    def test_metro(self):
+        self._test_control_patch("test-metro.pd", num_iterations=100)
+
+    def test_pipe(self):
+        self._test_control_patch("test-pipe.pd", num_iterations=100)
+
+    def test_timer(self):
+        self._test_control_patch("test-timer.pd", num_iterations=20)
+
+
+class TestPdControlPatchesProfile(TestPdControlBase):
+    """ Patches compiled with profiling, of which the output must not change.
+    """
+    SCRIPT_DIR = os.path.dirname(__file__)
+    TEST_DIR = os.path.join(os.path.dirname(__file__), "pd", "control")
+    COMPILE_ARGS = {"profile": True}
+
+    def test_delay(self):
+        self._test_control_patch("test-delay.pd")
+
+    def test_osc(self):
+        self._test_control_patch("test-osc.pd")
+
+    def test_pipe(self):
+        self._test_control_patch("test-pipe.pd", num_iterations=100)
+
+
 def main():
     # TODO(mhroth): make this work
     parser = argparse.ArgumentParser(
@@ -191,6 +191,21 @@ class TestPdControlExprPatches(TestPdControlBase):
         self._test_control_patch("test-var-types.pd")
 
 
+class TestPdControlExprPatchesSplit(TestPdControlBase):
+    """ Signal expressions which are read by delayed messages, with process() split at the
+        message timestamps.
+    """
+    SCRIPT_DIR = os.path.dirname(__file__)
+    TEST_DIR = os.path.join(os.path.dirname(__file__), "pd", "signal_expr")
+    COMPILE_ARGS = {"message_scheduling": "split"}
+
+    def test_add_sub(self):
+        self._test_control_patch("test-add-sub.pd")
+
+    def test_complex_expr1(self):
+        self._test_control_patch("test-complex-expr1.pd")
+
+
 def main():
     # TODO(mhroth): make this work
     parser = argparse.ArgumentParser(
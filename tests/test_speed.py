@@ -26,10 +26,16 @@ class TestPdPatches(TestPdSpeedBase):
     SCRIPT_DIR = os.path.dirname(__file__)
     TEST_DIR = os.path.join(os.path.dirname(__file__), "pd", "speed")
     # test results cannot be more than 2% slower than the golden value
-    __PERCENT_THRESHOLD = 2.0
+    PERCENT_THRESHOLD = 2.0
 
     def test_00_fire(self):
         self._test_speed_patch("test-00-fire.pd")
 
     def test_01_fire(self):
         self._test_speed_patch("test-01-fire.pd")
+
+
+class TestPdPatchesLocality(TestPdPatches):
+    """ The same patches, with the signal objects ordered by the locality scheduler.
+    """
+    SIGNAL_SCHEDULER = "locality"
@@ -0,0 +1,47 @@
+import pytest
+
+from hvcc.core.hv2ir.BufferPool import BufferPool
+from hvcc.core.hv2ir.HeavyException import HeavyException
+
+
+def test_get_buffer_reuses_most_recently_released():
+    pool = BufferPool()
+    a = pool.get_buffer("~f>")
+    b = pool.get_buffer("~f>")
+    c = pool.get_buffer("~i>")
+
+    assert (a, b, c) == (("~f>", 0), ("~f>", 1), ("~i>", 0))
+
+    pool.release_buffer(a)
+    pool.release_buffer(b)
+    assert pool.get_buffer("~f>") == b
+    assert pool.get_buffer("~f>", excludeSet={b}) == a
+    assert pool.get_buffer("~f>") == ("~f>", 2)
+    assert pool.num_buffers("~f>") == 3
+    assert pool.num_buffers() == 4
+
+
+def test_retain_release_counts():
+    pool = BufferPool()
+    a = pool.get_buffer("~f>", 2)
+
+    assert pool.retain_buffer(a, 3) == 5
+    assert pool.release_buffer(a, 4) == 1
+    assert pool.retain_buffer(("zero", 0)) == 0
+    assert pool.release_buffer(("input", 0)) == 0
+
+    with pytest.raises(HeavyException):
+        pool.release_buffer(("~f>", 7))
+
+
+def test_unchanged_count_moves_unused_buffer():
+    pool = BufferPool()
+    a = pool.get_buffer("~f>")
+    b = pool.get_buffer("~f>")
+    pool.release_buffer(a)
+    pool.release_buffer(b)
+
+    # retaining an unused buffer by zero makes it the most recently released one
+    pool.retain_buffer(a, 0)
+    assert pool.get_buffer("~f>") == a
+    assert pool.get_buffer("~f>") == b
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from hvcc.core.directory_index import DirectoryIndex
+from hvcc.interpreters.pd2hv.PdParser import PdParser
+
+
+def touch(*path):
+    with open(os.path.join(*path), "w") as f:
+        f.write("#N canvas 0 50 450 300 12;\n")
+
+
+def test_directory_index_isfile(tmp_path):
+    index = DirectoryIndex()
+    os.mkdir(os.path.join(tmp_path, "sub"))
+    touch(tmp_path, "abs.pd")
+    touch(tmp_path, "sub", "abs.pd")
+
+    assert index.isfile(os.path.join(tmp_path, "abs.pd"))
+    assert index.isfile(os.path.join(tmp_path, "sub/abs.pd"))
+    assert not index.isfile(os.path.join(tmp_path, "sub"))
+    assert not index.isfile(os.path.join(tmp_path, "missing", "abs.pd"))
+
+
+def test_directory_index_misses(tmp_path, monkeypatch):
+    index = DirectoryIndex()
+    touch(tmp_path, "abs.pd")
+    assert index.isfile(os.path.join(tmp_path, "abs.pd"))
+
+    # a name that is not listed is not looked up on the file system
+    monkeypatch.setattr(os.path, "isfile", lambda p: pytest.fail(f"stat of {p}"))
+    assert not index.isfile(os.path.join(tmp_path, "other.pd"))
+    assert not index.isfile(os.path.join(tmp_path, "ABS.pd"))
+
+
+def test_directory_index_case_insensitive(tmp_path, monkeypatch):
+    index = DirectoryIndex()
+    touch(tmp_path, "Abs.pd")
+
+    # e.g. a differently cased name on a case-insensitive file system
+    monkeypatch.setattr(os.path, "isfile", lambda p: p.casefold() == os.path.join(tmp_path, "abs.pd").casefold())
+    assert index.isfile(os.path.join(tmp_path, "ABS.pd"))
+    assert index.isfile(os.path.join(tmp_path, "Abs.pd"))
+    assert not index.isfile(os.path.join(tmp_path, "other.pd"))
+
+
+def test_directory_index_new_directory(tmp_path):
+    index = DirectoryIndex()
+    touch(tmp_path, "main.pd")
+    assert index.isfile(os.path.join(tmp_path, "main.pd"))
+
+    # a directory that is searched for the first time is listed then, e.g. after [declare -path]
+    new_dir = os.path.join(tmp_path, "lib")
+    os.mkdir(new_dir)
+    touch(new_dir, "abs.pd")
+    assert index.isfile(os.path.join(new_dir, "abs.pd"))
+
+
+def test_directory_index_declare_path(tmp_path):
+    index = DirectoryIndex()
+    lib_dir = os.path.join(tmp_path, "lib")
+    os.mkdir(lib_dir)
+    assert not index.isfile(os.path.join(lib_dir, "abs.pd"))
+    assert not index.isfile(os.path.join(tmp_path, "main.pd"))
+
+    # a directory added by [declare -path] is listed again, other directories are not
+    touch(lib_dir, "abs.pd")
+    touch(tmp_path, "main.pd")
+    parser = PdParser(directory_index=index)
+    parser.search_paths.append(str(tmp_path))
+    assert parser.add_relative_search_directory("lib")
+    assert parser.find_abstraction_path(str(tmp_path), "abs") == os.path.join(lib_dir, "abs.pd")
+    assert not index.isfile(os.path.join(tmp_path, "main.pd"))
@@ -0,0 +1,101 @@
+from hvcc.generators.ir2c.expr.expr_arpeggio_parser import ExprArpeggioParser
+from hvcc.generators.ir2c.expr.expr_c_writer import BufferAllocator, ExprCWriter
+from hvcc.generators.ir2c.expr.expr_optimiser import ExprOptimiser
+
+
+def test_parse_is_cached():
+    expr = "$v1*2+sin($v2)"
+    assert ExprArpeggioParser.parse(expr) is ExprArpeggioParser.parse(expr)
+
+
+def test_simd_code_is_cached(monkeypatch):
+    expr = "-$v1 * 0.5 + sin($v2)"
+    expected = ExprCWriter(expr).to_c_simd("bIns", "bOut")
+
+    calls = []
+    original = ExprCWriter._to_c_simd
+
+    def counted(self, v_out):
+        calls.append(v_out)
+        return original(self, v_out)
+
+    monkeypatch.setattr(ExprCWriter, "_to_c_simd", counted)
+
+    # the cached code and its buffers, without generating it again
+    writer = ExprCWriter(expr)
+    assert writer.to_c_simd("bIns", "bOut") == expected
+    assert writer.num_simd_buffers() == 2
+    assert calls == []
+
+    # a different output buffer is generated once, and counts its buffers in the same pass
+    writer = ExprCWriter(expr)
+    writer.to_c_simd("bIns", "out")
+    assert writer.num_simd_buffers() == 2
+    assert calls == ["out"]
+
+
+def test_simd_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(ExprCWriter, "MAX_CACHED", 2)
+    cache = ExprCWriter._ExprCWriter__SIMD_CACHE
+    cache.clear()
+
+    # counting the buffers does not cache any code
+    assert ExprCWriter("$v1*3").num_simd_buffers() == 1
+    assert len(cache) == 0
+
+    for expr in ["$v1*4", "$v1*5", "$v1*6"]:
+        ExprCWriter(expr).to_c_simd("A", "bOut")
+    assert [k[0] for k in cache] == ["$v1*5", "$v1*6"]
+
+
+def hv_calls(expr):
+    return [li.split("(")[0] for li in ExprCWriter(expr).to_c_simd("A", "bOut")[:-1]]
+
+
+def test_common_subexpressions():
+    # sin($v1*2) is computed once, and its buffer holds the product
+    assert ExprCWriter("sin($v1*2)*sin($v1*2)").to_c_simd("A", "bOut") == [
+        "__hv_var_k_i(&Bf0, 2, 2, 2, 2, 2, 2, 2, 2);",
+        "__hv_mul_f(A[0], Bf0, &Bf0);",
+        "__hv_sin_f(Bf0, &Bf0);",
+        "__hv_mul_f(Bf0, Bf0, bOut);",
+        "bOut",
+    ]
+    assert hv_calls("max($v1\\, $v2) + max($v1\\, $v2)*$v1") == ["__hv_max_f", "__hv_mul_f", "__hv_add_f"]
+
+
+def test_constant_folding():
+    assert hv_calls("$v1*(2*3)") == ["__hv_var_k_f", "__hv_mul_f"]
+    assert hv_calls("-(2*0.1) + $v1") == ["__hv_var_k_f", "__hv_add_f"]
+    assert ExprCWriter("1/3").to_c_simd("A", "bOut")[0] == "__hv_var_k_f(bOut" + ", 0.33333334" * 8 + ");"
+
+    # no reassociation, and no folding of divisions by zero
+    assert hv_calls("$v1*2*3") == ["__hv_var_k_i", "__hv_mul_f", "__hv_var_k_i", "__hv_mul_f"]
+    assert hv_calls("$v1/(2-2)") == ["__hv_var_k_f", "__hv_div_f"]
+
+
+def test_buffer_allocator_uses():
+    ba = BufferAllocator()
+    assert ba.next(2) == 0
+    assert ba.next() == 1
+    ba.free(1)
+    ba.free(0)
+    assert ba.next() == 1
+    ba.free(0)
+    assert ba.next() == 0
+    assert ba.num_allocated() == 2
+
+
+def test_fold_control_constants():
+    fold = ExprOptimiser.fold_constants_c
+    assert fold("$f1*(2*3)") == "$f1*(6)"
+    assert fold("2*3*$f1") == "6*$f1"
+    assert fold("$f1*2*3") == "$f1*2*3"
+    assert fold("max($f1\\, 2*4)") == "max($f1\\, 8)"
+
+    # integer arithmetic of C
+    assert fold("7/2+$f1") == "3+$f1"
+    assert fold("-7%3 + $i1") == "(-1) + $i1"
+    assert fold("1.5*2 + $f1") == "3.0 + $f1"
+    assert fold("(1+2)*(3+4)*$f1 + 1/0") == "(21)*$f1 + 1/0"
+    assert fold("010*2+$f1") == "010*2+$f1"
@@ -0,0 +1,71 @@
+from hvcc.core.hv2ir.IntervalAllocator import IntervalAllocator
+from hvcc.types.IR import IRBuffer, IRNumTempBuffer, IRSignal, IRSignalList
+
+
+def _signal(process_order):
+    return IRSignal(
+        numInputBuffers=0,
+        numOutputBuffers=2,
+        numTemporaryBuffers=IRNumTempBuffer(float=0, integer=0),
+        processOrder=[
+            IRSignalList(
+                id=str(i),
+                inputBuffers=[IRBuffer(type=t, index=x) for t, x in inputs],
+                outputBuffers=[IRBuffer(type=t, index=x) for t, x in outputs])
+            for i, (inputs, outputs) in enumerate(process_order)
+        ])
+
+
+def _buffers(signal):
+    return [
+        ([(b.type, b.index) for b in so.inputBuffers], [(b.type, b.index) for b in so.outputBuffers])
+        for so in signal.processOrder
+    ]
+
+
+def test_allocate_reuses_dead_buffers():
+    signal = _signal([
+        ([], [("~f>", 0)]),
+        ([("~f>", 0)], [("~f>", 1)]),
+        ([("~f>", 1)], [("~f>", 2)]),
+        ([("~f>", 2), ("output", 0)], [("output", 0)]),
+    ])
+
+    assert IntervalAllocator.allocate(signal)
+    assert signal.numTemporaryBuffers.float == 1
+    assert _buffers(signal) == [
+        ([], [("~f>", 0)]),
+        ([("~f>", 0)], [("~f>", 0)]),
+        ([("~f>", 0)], [("~f>", 0)]),
+        ([("~f>", 0), ("output", 0)], [("output", 0)]),
+    ]
+
+
+def test_allocate_keeps_overlapping_values_apart():
+    signal = _signal([
+        ([], [("~f>", 3)]),
+        ([("~f>", 3)], [("~f>", 5), ("~f>", 4)]),  # outputs of one object never share a buffer
+        ([("~f>", 5), ("zero", 0)], [("~f>", 6)]),
+        ([("~f>", 6), ("~f>", 4)], [("~f>", 7)]),
+        ([("~f>", 7), ("~f>", 3)], [("output", 1)]),
+    ])
+
+    assert IntervalAllocator.allocate(signal)
+    assert signal.numTemporaryBuffers.float == 3
+    assert _buffers(signal) == [
+        ([], [("~f>", 0)]),
+        ([("~f>", 0)], [("~f>", 1), ("~f>", 2)]),
+        ([("~f>", 1), ("zero", 0)], [("~f>", 1)]),
+        ([("~f>", 1), ("~f>", 2)], [("~f>", 2)]),
+        ([("~f>", 2), ("~f>", 0)], [("output", 1)]),
+    ]
+
+
+def test_allocate_rejects_buffers_used_across_blocks():
+    signal = _signal([
+        ([("~f>", 0)], [("~f>", 1)]),
+        ([("~f>", 1)], [("~f>", 0)]),
+    ])
+
+    assert not IntervalAllocator.allocate(signal)
+    assert _buffers(signal)[0] == ([("~f>", 0)], [("~f>", 1)])
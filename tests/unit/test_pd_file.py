@@ -0,0 +1,86 @@
+import os
+
+from hvcc.interpreters.pd2hv.PdFile import PdFile, PdFiles
+
+
+PATCH = (
+    "#N canvas 0 50 450 300 12;\r\n"
+    "#X obj 10 10 @hv_arg \\$1 freq float 440 false;\r\n"
+    "#N canvas 0 50 450 300 sub 0;\r\n"
+    "#X obj 10 10 @hv_arg \\$1 gain float 1 false;\r\n"
+    "#X restore 10 10 pd sub;\r\n"
+    "#X obj 10 10 t b\n"
+    "b, f 22;\r\n"
+    "#X text 10 10 some\\ thing \\; else;\r\n"
+)
+
+
+def test_pd_file_lines():
+    pd_file = PdFile(PATCH.encode("utf-8"))
+
+    assert [li for li, _ in pd_file.lines][-2:] == ["#X obj 10 10 t b b, f 22", "#X text 10 10 some\\ thing \\; else"]
+    assert pd_file.lines[-2][1] == ["#X", "obj", "10", "10", "t", "b", "b"]
+    assert pd_file.lines[-1][1] == ["#X", "text", "10", "10", "some thing", "\\;", "else"]
+
+
+def test_pd_file_hv_args():
+    pd_file = PdFile(PATCH.encode("utf-8"))
+
+    assert list(pd_file.hv_args.values()) == [
+        ["#X obj 10 10 @hv_arg \\$1 freq float 440 false"],
+        ["#X obj 10 10 @hv_arg \\$1 gain float 1 false"],
+    ]
+
+
+def test_pd_file_is_cached(tmp_path):
+    pd_path = os.path.join(tmp_path, "patch.pd")
+    with open(pd_path, "w") as f:
+        f.write(PATCH)
+
+    pd_file = PdFile.load(pd_path)
+    assert PdFile.load(pd_path) is pd_file
+
+    # a changed file is read again
+    with open(pd_path, "a") as f:
+        f.write("#X obj 10 10 print;\n")
+    assert PdFile.load(pd_path).lines[-1][0] == "#X obj 10 10 print"
+
+    # also when its size and modification time are unchanged
+    s = os.stat(pd_path)
+    with open(pd_path, "r+") as f:
+        f.seek(s.st_size - len("print;\n"))
+        f.write("prunt;\n")
+    os.utime(pd_path, ns=(s.st_atime_ns, s.st_mtime_ns))
+    assert PdFile.load(pd_path).lines[-1][0] == "#X obj 10 10 prunt"
+
+
+def test_pd_files_per_compile(tmp_path, monkeypatch):
+    pd_path = os.path.join(tmp_path, "patch.pd")
+    with open(pd_path, "w") as f:
+        f.write(PATCH)
+
+    loads = []
+    load = PdFile.load
+    monkeypatch.setattr(PdFile, "load", lambda p: loads.append(p) or load(p))
+
+    # a file is read once per compile, also through a relative path
+    pd_files = PdFiles()
+    pd_file = pd_files.load(pd_path)
+    monkeypatch.chdir(tmp_path)
+    assert pd_files.load("patch.pd") is pd_file
+    assert loads == [pd_path]
+
+    # and read again by the next compile
+    with open(pd_path, "a") as f:
+        f.write("#X obj 10 10 print;\n")
+    assert pd_files.load(pd_path) is pd_file
+    assert PdFiles().load(pd_path).lines[-1][0] == "#X obj 10 10 print"
+
+
+def test_pd_file_arrays():
+    pd_file = PdFile(b"#N canvas 0 50 450 300 12;\n#X array table 4 float 2;\n#A 0 0 0.5 -1\n1e-05;\n#A 0;\n")
+
+    # the values are not split into arguments, they are parsed into the table
+    assert pd_file.lines[2] == ("#A 0 0 0.5 -1 1e-05", ["#A", "0"])
+    assert list(PdFile.array_values(pd_file.lines[2][0])) == [0.0, 0.5, -1.0, 1e-05]
+    assert list(PdFile.array_values(pd_file.lines[3][0])) == []
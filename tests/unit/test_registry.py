@@ -0,0 +1,35 @@
+import shutil
+
+from hvcc.core.registry import HEAVY_IR, ObjectRegistry
+from hvcc.types.IR import HeavyIRType
+
+
+def _registry(json_dir):
+    class Registry(ObjectRegistry):
+        JSON_DIR = str(json_dir)
+
+    return Registry("heavy.ir.json", HeavyIRType)
+
+
+def test_registry_is_loaded_lazily(tmp_path, monkeypatch):
+    shutil.copy(HEAVY_IR.json_path, tmp_path)
+    registry = _registry(tmp_path)
+    expected = HEAVY_IR["__add~f"]
+
+    loads = []
+    original = HeavyIRType.__init__
+
+    def counted(self, **kwargs):
+        loads.append(1)
+        original(self, **kwargs)
+
+    monkeypatch.setattr(HeavyIRType, "__init__", counted)
+    assert loads == []
+
+    # the file is read on first access, and only once
+    assert registry["__add~f"] == expected
+    assert "__sub~f" in registry
+    assert loads == [1]
+
+    # nothing is written next to the json file
+    assert [p.name for p in tmp_path.iterdir()] == ["heavy.ir.json"]
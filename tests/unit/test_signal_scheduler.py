@@ -0,0 +1,54 @@
+from hvcc.core.hv2ir.SignalScheduler import SignalScheduler
+
+
+class _Obj:
+    def __init__(self, name, num_inlets=0, obj_type="__add~f"):
+        self.name = name
+        self.type = obj_type
+        self.inlet_connections = [[] for _ in range(num_inlets)]
+        self.outlet_connections = [[]]
+        self.inlet_buffers = [("zero", 0)] * num_inlets
+        self.outlet_buffers = [("zero", 0)]
+
+    def __repr__(self):
+        return self.name
+
+
+class _Connection:
+    is_signal = True
+
+    def __init__(self, from_object, to_object, inlet_index):
+        self.from_object = from_object
+        self.outlet_index = 0
+        self.to_object = to_object
+        from_object.outlet_connections[0].append(self)
+        to_object.inlet_connections[inlet_index].append(self)
+
+
+def test_schedule_keeps_consumers_adjacent():
+    # two independent chains, a0 -> a1 -> a2 and b0 -> b1 -> b2, summed by c
+    a0, a1, a2 = _Obj("a0"), _Obj("a1", 1), _Obj("a2", 1)
+    b0, b1, b2 = _Obj("b0"), _Obj("b1", 1), _Obj("b2", 1)
+    c = _Obj("c", 2)
+    for x, y, i in [(a0, a1, 0), (a1, a2, 0), (b0, b1, 0), (b1, b2, 0), (a2, c, 0), (b2, c, 1)]:
+        _Connection(x, y, i)
+
+    # all sources first, which keeps both chains alive at once
+    order = SignalScheduler.schedule([a0, b0, a1, b1, a2, b2, c])
+    assert order == [a0, a1, a2, b0, b1, b2, c]
+
+
+def test_schedule_respects_dependencies_and_shared_state():
+    w = _Obj("w", 1, "__tabwrite~f")
+    r = _Obj("r", 0, "__tabread~f")
+    s = _Obj("s")
+    m = _Obj("m", 1)
+    _Connection(s, w, 0)
+    _Connection(r, m, 0)
+
+    # the table is written before it is read, and must stay that way
+    order = SignalScheduler.schedule([s, w, r, m])
+    assert order.index(w) < order.index(r)
+    assert order.index(s) < order.index(w)
+    assert order.index(r) < order.index(m)
+    assert sorted(order, key=repr) == sorted([s, w, r, m], key=repr)
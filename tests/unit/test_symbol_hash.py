@@ -0,0 +1,20 @@
+from hvcc.core.symbol_hash import get_hash, get_hash_string
+
+
+def test_symbol_hash():
+    # the hashes of hv_string_to_hash()
+    assert get_hash_string("__hv_init") == "0xCE5CC65B"
+    assert get_hash_string("1001-pitch") == "0x66B39196"
+    assert get_hash_string("other") == "0x3AD4650E"
+
+    assert get_hash("bang") == 0xFFFFFFFF
+    assert get_hash(1.0) == get_hash(1) == 0x3F800000
+
+
+def test_symbol_hash_is_cached():
+    get_hash.cache_clear()
+    get_hash("pitch")
+    get_hash("pitch")
+
+    info = get_hash.cache_info()
+    assert (info.hits, info.misses) == (1, 1)